@@ -0,0 +1,84 @@
+"""
+Memory and speed of the sorted maps in pietoolz.data_structures.bst: the
+node-based BinaryTree vs. the block-based BlockTree, w/ keys in lists and in
+a typed array.
+
+Memory is what building the tree allocates (traced by tracemalloc), not
+counting the keys themselves, which are made beforehand. Lookups search for
+<N> // 10 random keys; range scans iterate over the whole tree and over
+1000 windows of 0.1% of the keys.
+
+Run from the repo root (N defaults to 10**6; 10**7 takes a few minutes and
+several GB for BinaryTree):
+    python benchmarks/bst_layouts.py [N]
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from pietoolz.data_structures.bst import BinaryTree, BlockTree
+
+
+def _timed(func, *args) -> tuple:
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def _build(make, keys: list) -> tuple:
+    """
+    Return the tree made by make(keys), the seconds it took, and the MB it
+    allocated.
+    """
+    tree, seconds = _timed(make, keys)
+    del tree
+    tracemalloc.start()
+    tree = make(keys)
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return tree, seconds, allocated / 2**20
+
+
+def _lookups(tree, probes: list) -> int:
+    return sum(key in tree for key in probes)
+
+
+def _full_scan(tree) -> int:
+    return sum(1 for _ in tree)
+
+
+def _window_scans(tree, windows: list) -> int:
+    return sum(sum(1 for _ in tree.irange(lo, hi)) for lo, hi in windows)
+
+
+def _insert_all(keys: list) -> BinaryTree:
+    tree = BinaryTree()
+    for key in keys:
+        tree.insert(key)
+    return tree
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    rng = random.Random(0)
+    keys = [rng.random() for _ in range(n)]
+    probes = rng.sample(keys, n // 10)
+    ordered = sorted(keys)
+    width = max(1, n // 1000)
+    starts = rng.sample(range(n - width), 1000)
+    windows = [(ordered[i], ordered[i + width]) for i in starts]
+    layouts = (('BinaryTree', _insert_all),
+               ('BlockTree', BlockTree),
+               ("BlockTree('d')", lambda keys: BlockTree(keys, typecode='d')))
+    print(f'{n:,} float keys')
+    print(f'{"":>15} {"build s":>8} {"MB":>8} {"lookup s":>9} '
+          f'{"scan s":>8} {"windows s":>10}')
+    for name, make in layouts:
+        tree, build_s, mb = _build(make, keys)
+        _, lookup_s = _timed(_lookups, tree, probes)
+        _, scan_s = _timed(_full_scan, tree)
+        _, window_s = _timed(_window_scans, tree, windows)
+        print(f'{name:>15} {build_s:8.2f} {mb:8.1f} {lookup_s:9.2f} '
+              f'{scan_s:8.2f} {window_s:10.2f}')
+        del tree
@@ -0,0 +1,75 @@
+"""
+Query speed of the spatial indexes in pietoolz.data_structures.spatial vs.
+a linear scan, over <N> random points in a 1000 x 1000 square.
+
+Each query kind is run <QUERIES> times: the 8 nearest points, the points
+within radius 5, and the points in a 10 x 10 box. GridIndex is also timed
+moving points by small steps, as in a simulation frame.
+
+Run from the repo root (N defaults to 10**6):
+    python benchmarks/spatial_index.py [N]
+"""
+import math
+import random
+import sys
+import time
+
+from pietoolz.data_structures.spatial import GridIndex, KDTree
+
+
+QUERIES = 1_000
+# Linear scans are slow; time this many, and scale up
+SCANS = 10
+
+
+def _timed(func, *args) -> tuple:
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def _scan_nearest(points: list, q: tuple, k: int) -> list:
+    return sorted((math.dist(q, p), i) for i, p in enumerate(points))[:k]
+
+
+def _run(index, queries: list) -> tuple[float, float, float]:
+    """
+    Return the seconds <index> takes for all of <queries>, by query kind.
+    """
+    _, knn_s = _timed(lambda: [index.nearest(q, 8) for q in queries])
+    _, radius_s = _timed(lambda: [index.within(q, 5) for q in queries])
+    _, box_s = _timed(lambda: [index.in_box(q, (q[0] + 10, q[1] + 10))
+                               for q in queries])
+    return knn_s, radius_s, box_s
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    rng = random.Random(0)
+    points = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(n)]
+    queries = [(rng.uniform(0, 1000), rng.uniform(0, 1000))
+               for _ in range(QUERIES)]
+    print(f'{n:,} points, {QUERIES:,} queries of each kind')
+    print(f'{"":>11} {"build s":>8} {"8-NN s":>8} {"r=5 s":>8} {"box s":>8}')
+
+    grid, build_s = _timed(GridIndex, 5, enumerate(points))
+    print(f'{"GridIndex":>11} {build_s:8.2f}', *(f'{s:8.2f}'
+                                                 for s in _run(grid, queries)))
+    tree, build_s = _timed(KDTree, points)
+    print(f'{"KDTree":>11} {build_s:8.2f}', *(f'{s:8.2f}'
+                                              for s in _run(tree, queries)))
+    _, scan_s = _timed(lambda: [_scan_nearest(points, q, 8)
+                                for q in queries[:SCANS]])
+    print(f'{"Linear scan":>11} {"":>8} {scan_s * QUERIES / SCANS:8.2f}'
+          f'  (estimated from {SCANS} queries)')
+
+    steps = [(rng.randrange(n), rng.uniform(-1, 1), rng.uniform(-1, 1))
+             for _ in range(200_000)]
+
+    def _move_all() -> None:
+        for key, dx, dy in steps:
+            x, y = grid.get(key)
+            grid.move(key, (x + dx, y + dy))
+
+    _, move_s = _timed(_move_all)
+    print(f'GridIndex: {len(steps) / move_s / 1e3:,.0f}k moves/s')
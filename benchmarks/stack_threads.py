@@ -0,0 +1,53 @@
+"""
+Throughput of the thread-safe Stacks, by number of threads.
+
+Each thread pushes and then pops <OPS> items. On a GIL build of CPython the
+threads take turns, so the total stays about flat; on a free-threaded build
+(python3.13t and later), AtomicStack should scale w/ the thread count.
+
+Run from the repo root:
+    python benchmarks/stack_threads.py
+"""
+import sys
+import threading
+import time
+
+from pietoolz.data_structures.stack import AtomicStack, ConcurrentStack
+
+
+OPS = 200_000
+
+
+def _work(stack) -> None:
+    push, pop = stack.push, stack.pop
+    for i in range(OPS):
+        push(i)
+    for _ in range(OPS):
+        pop()
+
+
+def bench(stack_cls, n_threads: int) -> float:
+    """
+    Return the push+pop operations per second of <n_threads> threads
+    sharing one <stack_cls>.
+    """
+    stack = stack_cls()
+    threads = [threading.Thread(target=_work, args=(stack,))
+               for _ in range(n_threads)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    assert stack.size() == 0
+    return 2 * OPS * n_threads / elapsed
+
+
+if __name__ == '__main__':
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'Python {sys.version.split()[0]}, GIL {"on" if gil else "off"}')
+    for stack_cls in (ConcurrentStack, AtomicStack):
+        for n in (1, 2, 4, 8):
+            print(f'{stack_cls.__name__:>16} x{n}: '
+                  f'{bench(stack_cls, n) / 1e6:6.2f} M ops/s')
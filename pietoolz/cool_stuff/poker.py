@@ -9,10 +9,20 @@ NOTE: Never make the developer code the business of the client code,
       especially the problematic part of the developer code.
 """
 from __future__ import annotations
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Optional, Sequence, Union
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+import math
+import os
 import random as rand
 
-from pietoolz.data_structures.stack import Stack
+from pietoolz.data_structures.stack import Stack, make_rng, shuffle_top
+from pietoolz.cool_stuff.poker_exceptions import (InvalidDealException,
+                                                  InvalidHandException,
+                                                  InvalidRangeException,
+                                                  NotEnoughCardsException)
 
 
 SUITS_EMJ: tuple = ('♠', '♥', '♦', '♣')
@@ -38,34 +48,46 @@ VALID_SUITS: tuple = ('s', 'S', 'spades', 'spade', 'Spades', 'Spade',
                       'HEARTS', 'HEART', 'hrt', 'HRT',
                       'd', 'D', 'diamonds', 'diamond', 'Diamonds', 'Diamond',
                       'DIAMONDS', 'DIAMOND', 'dia', 'DIA',
-                      'c', 'C', 'clubs', 'club', 'Clubs', 'clubs'
+                      'c', 'C', 'clubs', 'club', 'Clubs', 'Club',
                       'CLUBS', 'CLUB', 'clb', 'CLB',
-                      'j', 'J', 'jok', 'joker', 'Joker', 'JOKER'
+                      'j', 'J', 'jok', 'joker', 'Joker', 'JOKER',
                       'j0ker', 'J0ker', 'J0KER', 'j0k', 'J0k','J0K'
                      )
 
+# Every valid <suit> arg of Card(), mapped to the suit it stands for
+_SUIT_ALIASES: dict = {alias: {'s': 'Spades', 'h': 'Hearts', 'd': 'Diamonds',
+                               'c': 'Clubs', 'j': 'j0ker'}[alias[0].lower()]
+                       for alias in VALID_SUITS}
+
 STD_DECK_STR: str = 'Standard 52-Card Deck'
 
+# Hand categories, from the weakest to the strongest.
+HAND_CATEGORIES: tuple = ('High Card', 'One Pair', 'Two Pair',
+                          'Three of a Kind', 'Straight', 'Flush',
+                          'Full House', 'Four of a Kind', 'Straight Flush')
+
 
 class Card:
     """
-    Card object. 54 unique variations of Card can be created:
+    Card object. 54 unique variations of Card exist:
     - 52 of the standard 52-card deck
     - 2 joker Cards: 1 black, 1 color
 
-    There are no limits as to how many Card() objects of any given variation
-    can be instantiated. It is up to the client code to instantiate the correct
-    number of each Card variation.
+    Each variation is created exactly once, when this module is imported.
+    Card(rank, suit) does not build a new object; it returns the one Card of
+    that rank and suit, so Cards can be compared w/ <is> and memory per Card
+    stays constant no matter how many Decks are built.
 
-    NOTE: Card objects are not truly unique b/c it's possible to instantiate
-    more than one Card that share the same rank and suit, but with different
-    instance IDs.
+    >>> Card(1, 's') is Card(1, 'Spades')
+    True
+    >>> Card(1, 's') == Card(1, 'h')
+    False
 
     Use Cases
     ---------
     Maybe you'd like to design code for a poker game. Use this Card class to
-    generate the cards that you need for your deck. The combinations of Card
-    objects you can instantiate are infinite, limited only by memory space.
+    get the cards that you need for your deck. Deal as many of them, as many
+    times over, as you like.
 
     Notes for Client Code
     ---------------------
@@ -74,30 +96,28 @@ class Card:
 
     Representation Invariants
     -------------------------
-    - Once instantiated, the instance attributes, <_suit> and <_rank>, cannot
+    - Once created, the instance attributes, <_suit> and <_rank>, cannot
     be changed. In other words, they are immutable.
     - The same applies for a joker card and its color.
     """
-    # Class Attribute:
-    num_instances: int=0
+    __slots__ = ('_rank', '_suit', '_is_joker', '_code')
 
     # Instance Attributes:
     # --------------------
     # Basic playing-card info
-    _rank: str
+    _rank: Union[int, str]
     _suit: str
     # Card status
-    _is_face_up: bool
     _is_joker: bool
-    # Misc
-    _inst_id: int
+    # Evaluator code (rank_index * 4 + suit_index); 52 and 53 for j0kers
+    _code: int
 
 
-    def __init__(self, rank: int, suit: str) -> None:
+    def __new__(cls, rank: int, suit: str) -> Card:
         """
         Pre-conditions
         --------------
-        1. To create a standard number card:
+        1. To get a standard number card:
             >>> ace_spades = Card(1, 's')
             >>> ace_spades = Card(1, 'S')
             >>> ace_spades = Card(1, 'spades')
@@ -105,15 +125,15 @@ class Card:
             >>> ace_spades = Card(1, 'spade')
             >>> ace_spades = Card(1, 'Spade')
 
-        2. To create a standard face card:
+        2. To get a standard face card:
             >>> jack_hearts = Card(11, 'h')
             >>> queen_diamonds = Card(12, 'd')
             >>> king_clubs = Card(13, 'c')
 
-        3. To create a black joker card:
+        3. To get a black joker card:
             >>> black_joker = Card(0, 'joker')
 
-        4. To create a color joker card:
+        4. To get a color joker card:
             >>> color_joker = Card(255, 'joker')
 
         Exceptions
@@ -121,40 +141,28 @@ class Card:
         If the pre-conditions above are NOT satisfied, InvalidArgException
         is raised.
         """
-        # Check: Invalid Args
-        if suit not in VALID_SUITS:
-            raise InvalidArgException
-        if rank not in VALID_RANKS:
-            raise InvalidArgException
-        # Suit: j0ker
-        if (c:=suit[0].lower()) == 'j':
-            if rank == 0:
-                self._rank = 'black'
-            elif rank == 255:
-                self._rank = 'c0l0r'
-            self._suit = 'j0ker'
-            self._is_joker = True
-        # Suits: Spades, Hearts, Diamonds, Clubs
-        else:
-            self._is_joker = False
-            self._rank = rank
-            # Spade
-            if c == 's':
-                self._suit = 'Spades'
-            # Hearts
-            elif c == 'h':
-                self._suit = 'Hearts'
-            # Diamonds
-            elif c == 'd':
-                self._suit = 'Diamonds'
-            # Clubs
-            elif c == 'c':
-                self._suit = 'Clubs'
-        # Housekeeping
-        self._is_face_up = False
-        self._id = self.num_instances
-        self.num_instances += 1
-    
+        try:
+            return _CARD_TABLE[(rank, suit)]
+        except (KeyError, TypeError):
+            raise InvalidArgException from None
+
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError('Card objects are immutable.')
+
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError('Card objects are immutable.')
+
+
+    def __hash__(self) -> int:
+        return self._code
+
+
+    def __reduce__(self) -> tuple:
+        # Un-pickled Cards (e.g. in a worker process) are the interned ones.
+        return (_card_from_code, (self._code,))
+
 
     def __str__(self) -> str:
         """
@@ -190,6 +198,32 @@ class Card:
         return self._rank
 
 
+    def get_code(self) -> int:
+        """
+        Return the compact int code of this Card: rank_index * 4 + suit_index,
+        where rank_index 0 is a deuce, 12 an ace, and suit_index follows
+        SUITS_STR. The black and color j0kers are 52 and 53.
+
+        Client Code
+        -----------
+        >>> Card(2, 's').get_code()
+        0
+        >>> Card(1, 'c').get_code()
+        51
+        >>> Card.from_code(51)
+        < Ace of Clubs >
+        """
+        return self._code
+
+
+    @staticmethod
+    def from_code(code: int) -> Card:
+        """
+        Return the Card whose code is <code>. Refer to Card.get_code().
+        """
+        return _CARDS_BY_CODE[code]
+
+
     def get(self) -> str:
         """
         Return a str representation of this Card.
@@ -275,6 +309,48 @@ class InvalidArgException(Exception):
 To see how to initialize a Card, run 'Card.help()'")
 
 
+def _build_card_table() -> tuple[tuple, dict]:
+    """
+    Create the 54 Cards, once. Return them ordered by code, along w/ the
+    table Card() looks them up in, keyed by every valid (rank, suit) arg.
+    """
+    cards, table = [], {}
+    for code in range(54):
+        if code < 52:
+            r = code >> 2
+            rank, suit = (1 if r == 12 else r + 2), SUITS_STR[code & 3]
+            fields = (rank, suit, False, code)
+            arg_rank = rank
+        else:
+            arg_rank = 0 if code == 52 else 255
+            suit = 'j0ker'
+            fields = ('black' if code == 52 else 'c0l0r', suit, True, code)
+        card = object.__new__(Card)
+        for name, value in zip(Card.__slots__, fields):
+            object.__setattr__(card, name, value)
+        cards.append(card)
+        for alias, canonical in _SUIT_ALIASES.items():
+            if canonical == suit:
+                table[(arg_rank, alias)] = card
+    return tuple(cards), table
+
+
+def _card_from_code(code: int) -> Card:
+    """
+    Return the Card w/ evaluator code <code>.
+    """
+    return _CARDS_BY_CODE[code]
+
+
+_CARDS_BY_CODE, _CARD_TABLE = _build_card_table()
+
+
+def _check_counts(*counts: int) -> None:
+    # The player and card counts of a deal
+    if min(counts) < 0:
+        raise ValueError('Cannot deal a negative number of players or cards.')
+
+
 class Deck:
     """
     What the Deck?
@@ -351,9 +427,15 @@ class Deck:
     def __init__(self,
                  deck_name: str=STD_DECK_STR,
                  cust_deck: Optional[list[Card]]=None,
-                 shuffle=False) -> None:
+                 shuffle=False,
+                 rng: Union[None, int, rand.Random]=None) -> None:
         """
-        Deck() representations are shuffled by default.
+        Deck() representations are NOT shuffled by default.
+
+        <rng> is the RNG this Deck shuffles with: by default, OS entropy, fit
+        for real-money dealing; pass a seed (or a random.Random) for fast,
+        reproducible simulations. Refer to make_rng() in
+        pietoolz.data_structures.stack.
         """
         # Set up the Deck info
         self._deck_info = dict()
@@ -366,6 +448,7 @@ class Deck:
         else:
             self._deck_info.setdefault('cards_remaining', len(cust_deck))
             self._deck_stack = self._gen_cust_deck(cust_deck)
+        self._deck_stack.set_rng(rng)
         # To shuffle or not to shuffle is not a question but a boolean.
         if shuffle:
             self.shuffle()
@@ -394,11 +477,7 @@ class Deck:
         '< Ace of Spades >'     \n
         [Bottom of the Deck]    \n
         """
-        stack = Stack()
-        for suit, rank_list in STANDARD_DECK_STR.items():
-            for rank in rank_list:
-                stack.push(Card(rank, suit))
-        return stack
+        return Stack(map(_card_from_code, _STD52_CODES))
 
 
     def _gen_cust_deck(self, cust_deck: list[Card]) -> Stack[Card]:
@@ -443,22 +522,111 @@ class Deck:
         return stack
 
 
-    def shuffle(self) -> None:
+    def shuffle(self,
+                k: Optional[int]=None,
+                rng: Union[None, int, rand.Random]=None) -> None:
         """
         Shuffle the currently-remaining cards in this Deck.
+
+        If <k> is passed, only randomize the top <k> cards, i.e. the ones
+        about to be dealt. If <rng> is passed, use it for this shuffle only.
+
+        >>> d1, d2 = Deck(rng=7), Deck(rng=7)
+        >>> d1.shuffle(k=5)
+        >>> d2.shuffle(k=5)
+        >>> hand1 = [d1.draw_card_from_top() for _ in range(5)]
+        >>> hand2 = [d2.draw_card_from_top() for _ in range(5)]
+        >>> hand1 == hand2
+        True
         """
-        self._deck_stack.shuffle()
+        self._deck_stack.shuffle(k, rng)
 
 
-    def draw_card_from_top(self) -> str:
+    def draw_card_from_top(self) -> Optional[Card]:
         """
         Refer to class docstring.
         """
         card = self._deck_stack.pop()
-        self.__total_count -= 1
+        if card is not None:
+            self._deck_info['cards_remaining'] -= 1
         return card
 
 
+    def draw_many(self, k: int) -> tuple[Card, ...]:
+        """
+        Draw the top <k> cards of this Deck at once, in the order they would
+        have been drawn one by one. If fewer than <k> cards remain, draw all
+        of them.
+
+        Client Code
+        -----------
+        >>> deck = Deck()
+        >>> deck.draw_many(3)
+        (< King of Clubs >, < Queen of Clubs >, < Jack of Clubs >)
+        >>> deck.get_info()['cards_remaining']
+        49
+
+        Exceptions
+        ----------
+        If <k> is negative, ValueError is raised.
+        """
+        if k < 0:
+            raise ValueError('Cannot draw a negative number of cards.')
+        cards = tuple(self._deck_stack.pop_many(k))
+        self._deck_info['cards_remaining'] -= len(cards)
+        return cards
+
+
+    def deal(self, n_players: int, n_cards: int=2) -> tuple[tuple[Card, ...], ...]:
+        """
+        Deal <n_cards> to each of <n_players>, one card at a time around the
+        table, as a dealer would. Return one tuple of Cards per player.
+
+        The cards for the whole table are taken off the Deck in one slice.
+
+        Client Code
+        -----------
+        >>> deck = Deck()
+        >>> deck.deal(2)
+        ((< King of Clubs >, < Jack of Clubs >), (< Queen of Clubs >, < 10 of Clubs >))
+        >>> deck.get_info()['cards_remaining']
+        48
+
+        Exceptions
+        ----------
+        If there are not enough cards left, NotEnoughCardsException is raised
+        and no card is dealt. If <n_players> or <n_cards> is negative,
+        ValueError is raised.
+        """
+        _check_counts(n_players, n_cards)
+        if n_players * n_cards > self._deck_stack.size():
+            raise NotEnoughCardsException
+        cards = self.draw_many(n_players * n_cards)
+        return tuple(cards[i::n_players] for i in range(n_players))
+
+
+    def deal_table(self,
+                   n_players: int,
+                   n_cards: int=2,
+                   board: int=5) -> tuple[tuple[tuple[Card, ...], ...],
+                                          tuple[Card, ...]]:
+        """
+        Deal the hole cards of <n_players>, as in Deck.deal(), followed by
+        <board> community cards, in one slice. Return (hands, board).
+
+        >>> hands, board = Deck().deal_table(3)
+        >>> len(hands), len(board)
+        (3, 5)
+        """
+        _check_counts(n_players, n_cards, board)
+        dealt = n_players * n_cards
+        if dealt + board > self._deck_stack.size():
+            raise NotEnoughCardsException
+        cards = self.draw_many(dealt + board)
+        return (tuple(cards[i:dealt:n_players] for i in range(n_players)),
+                cards[dealt:])
+
+
     def get_info(self) -> dict:
         """
         Refer to the class docstring.
@@ -491,6 +659,672 @@ class Deck:
             raise NotImplementedError
         else:
             self._deck_stack.push(joker)
+            self._deck_info['joker_count'] += 1
+            self._deck_info['cards_remaining'] += 1
+
+
+# The standard 52-card deck as codes, in the order of Deck._gen_std52_deck()
+_STD52_CODES: bytes = bytes(Card(rank, suit).get_code()
+                            for suit, rank_list in STANDARD_DECK_STR.items()
+                            for rank in rank_list)
+
+
+class PackedDeck:
+    """
+    A Deck of Card codes (refer to Card.get_code()), packed one byte per
+    Card in an array. Building, cloning, and shuffling one never creates a
+    Card object; Cards are looked up only as they are drawn.
+
+    The Cards are in the same order as in Deck: the last code in the array
+    is the top of the deck.
+
+    Client Code
+    -----------
+    >>> deck = PackedDeck()
+    >>> len(deck)
+    52
+    >>> deck.draw_card_from_top()
+    < King of Clubs >
+    >>> deck.draw_code()  # Queen of Clubs
+    43
+    >>> fresh = PackedDeck()
+    >>> sim = fresh.clone()  # One buffer copy, e.g. per simulated hand
+    >>> sim.shuffle()
+    >>> len(sim), len(deck)
+    (52, 50)
+    >>> custom = PackedDeck([Card(7, 's'), Card(0, 'joker')])
+    >>> custom.draw_card_from_top()
+    < 7 of Spades >
+    >>> custom.draw_card_from_top()
+    < black j0ker >
+    >>> custom.draw_card_from_top()
+    """
+    _codes: array
+    _rng: rand.Random
+
+
+    def __init__(self,
+                 cust_deck: Optional[Sequence[Card]]=None,
+                 shuffle=False,
+                 rng: Union[None, int, rand.Random]=None) -> None:
+        """
+        Create a standard 52-card PackedDeck, or, if <cust_deck> is passed, a
+        PackedDeck of those Cards, the first of which is on top.
+
+        <rng> is the RNG this PackedDeck shuffles with. Refer to make_rng() in
+        pietoolz.data_structures.stack.
+        """
+        if cust_deck is None:
+            self._codes = array('B', _STD52_CODES)
+        else:
+            self._codes = array('B', [card._code for card in reversed(cust_deck)])
+        self._rng = make_rng(rng)
+        if shuffle:
+            self.shuffle()
+
+
+    @classmethod
+    def from_codes(cls, codes: Union[bytes, Sequence[int]]) -> PackedDeck:
+        """
+        Return a PackedDeck of <codes>, the LAST of which is on top.
+
+        >>> PackedDeck.from_codes([0, 51]).draw_card_from_top()
+        < Ace of Clubs >
+        """
+        deck = cls.__new__(cls)
+        deck._codes = array('B', codes)
+        deck._rng = make_rng()
+        return deck
+
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+
+    def clone(self) -> PackedDeck:
+        """
+        Return a copy of this PackedDeck, made w/ one buffer copy.
+        """
+        deck = PackedDeck.__new__(PackedDeck)
+        deck._codes = self._codes[:]
+        deck._rng = self._rng
+        return deck
+
+
+    def codes(self) -> bytes:
+        """
+        Return the codes currently in this PackedDeck, top of the deck last.
+        """
+        return self._codes.tobytes()
+
+
+    def shuffle(self,
+                k: Optional[int]=None,
+                rng: Union[None, int, rand.Random]=None) -> None:
+        """
+        Shuffle the currently-remaining cards in this PackedDeck. Refer to
+        Stack.shuffle() for <k> and <rng>.
+        """
+        rng = self._rng if rng is None else make_rng(rng)
+        if k is None:
+            rng.shuffle(self._codes)
+        else:
+            shuffle_top(self._codes, k, rng)
+
+
+    def draw_code(self) -> Optional[int]:
+        """
+        Remove the top card of this PackedDeck and return its code, or None
+        if the PackedDeck is empty.
+        """
+        if not self._codes:
+            return None
+        return self._codes.pop()
+
+
+    def draw_card_from_top(self) -> Optional[Card]:
+        """
+        Remove the top card of this PackedDeck and return it, or None if the
+        PackedDeck is empty.
+        """
+        if not self._codes:
+            return None
+        return _CARDS_BY_CODE[self._codes.pop()]
+
+
+    def draw_codes(self, k: int) -> array:
+        """
+        Remove the top <k> cards of this PackedDeck in one slice, and return
+        their codes, in the order they would have been drawn one by one. If
+        fewer than <k> cards remain, draw all of them.
+
+        >>> PackedDeck().draw_codes(3).tolist()  # K, Q, J of Clubs
+        [47, 43, 39]
+        """
+        if k < 0:
+            raise ValueError('Cannot draw a negative number of cards.')
+        k = min(k, len(self._codes))
+        if k == 0:
+            return array('B')
+        codes = self._codes[:-k - 1:-1]
+        del self._codes[-k:]
+        return codes
+
+
+    def draw_many(self, k: int) -> tuple[Card, ...]:
+        """
+        Like PackedDeck.draw_codes(), but return Cards. Refer to
+        Deck.draw_many().
+        """
+        return tuple(map(_CARDS_BY_CODE.__getitem__, self.draw_codes(k)))
+
+
+    def deal(self, n_players: int, n_cards: int=2) -> tuple[tuple[Card, ...], ...]:
+        """
+        Refer to Deck.deal().
+
+        >>> PackedDeck().deal(2)
+        ((< King of Clubs >, < Jack of Clubs >), (< Queen of Clubs >, < 10 of Clubs >))
+        """
+        _check_counts(n_players, n_cards)
+        if n_players * n_cards > len(self._codes):
+            raise NotEnoughCardsException
+        cards = self.draw_many(n_players * n_cards)
+        return tuple(cards[i::n_players] for i in range(n_players))
+
+
+    def deal_table(self,
+                   n_players: int,
+                   n_cards: int=2,
+                   board: int=5) -> tuple[tuple[tuple[Card, ...], ...],
+                                          tuple[Card, ...]]:
+        """
+        Refer to Deck.deal_table().
+        """
+        _check_counts(n_players, n_cards, board)
+        dealt = n_players * n_cards
+        if dealt + board > len(self._codes):
+            raise NotEnoughCardsException
+        cards = self.draw_many(dealt + board)
+        return (tuple(cards[i:dealt:n_players] for i in range(n_players)),
+                cards[dealt:])
+
+
+# Hand Evaluator Tables
+# ---------------------
+# A card code is rank_index * 4 + suit_index, where rank_index runs from
+# 0 (deuce) to 12 (ace) and suit_index follows SUITS_STR. A hand is scored
+# w/ two lookups:
+#   - The sum of its suit keys tells, via _FLUSH_SUIT, which suit (if any)
+#     holds 5+ cards. Suit keys are powers of 8, so the sum never carries.
+#   - If there is a flush, the OR of that suit's rank bits indexes
+#     _FLUSH_STRENGTH. Otherwise, the product of its rank primes (unique per
+#     rank multiset) keys _RANK_STRENGTH.
+# Strengths run from 1 (7-5-4-3-2 offsuit) to 7462 (royal flush).
+_RANK_PRIMES: tuple = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_SUIT_KEYS: tuple = (1, 8, 64, 512)
+_STRAIGHT_MASKS: tuple = tuple([(0b11111 << (high - 4), high)
+                                for high in range(12, 3, -1)]
+                               + [(0b1000000001111, 3)])  # A-2-3-4-5
+_CARD_PRIME: tuple = tuple(_RANK_PRIMES[c >> 2] for c in range(52))
+_CARD_SUIT_KEY: tuple = tuple(_SUIT_KEYS[c & 3] for c in range(52))
+_CARD_RANK_BIT: tuple = tuple(1 << (c >> 2) for c in range(52))
+# Filled in by _build_eval_tables(), on first use.
+_FLUSH_SUIT: list = []
+_FLUSH_STRENGTH: list = []
+_RANK_STRENGTH: dict = {}
+_CATEGORY_FLOORS: list = []
+
+
+def _straight_high(mask: int) -> int:
+    """
+    Return the rank index of the highest straight in <mask>, or -1.
+    """
+    for straight, high in _STRAIGHT_MASKS:
+        if mask & straight == straight:
+            return high
+    return -1
+
+
+def _flush_key(mask: int) -> tuple:
+    """
+    Return the sort key of the 5-card flush (or straight flush) in <mask>.
+    """
+    high = _straight_high(mask)
+    if high >= 0:
+        return (8, high)
+    return (5,) + tuple([r for r in range(12, -1, -1) if mask >> r & 1][:5])
+
+
+def _rank_key(counts: list[int]) -> tuple:
+    """
+    Return the sort key of the 5-card, non-flush hand w/ rank <counts>.
+    """
+    groups = sorted(((c, r) for r, c in enumerate(counts) if c), reverse=True)
+    (top_count, top), (next_count, second) = groups[0], groups[1]
+    kickers = sorted((r for _, r in groups[1:]), reverse=True)
+    if top_count == 4:
+        return (7, top, kickers[0])
+    if top_count == 3 and next_count == 2:
+        return (6, top, second)
+    high = _straight_high(sum(1 << r for _, r in groups))
+    if high >= 0:
+        return (4, high)
+    if top_count == 3:
+        return (3, top) + tuple(kickers)
+    if top_count == 2 and next_count == 2:
+        return (2, top, second, groups[2][1])
+    if top_count == 2:
+        return (1, top) + tuple(kickers)
+    return (0,) + tuple(r for _, r in groups)
+
+
+def _rank_multisets(size: int, start: int=0, counts: Optional[list]=None):
+    """
+    Yield the rank counts of every <size>-card multiset of ranks.
+    The same list is mutated and re-yielded; copy it to keep it.
+    """
+    if counts is None:
+        counts = [0] * 13
+    if size == 0:
+        yield counts
+        return
+    for r in range(start, 13):
+        if counts[r] < 4:
+            counts[r] += 1
+            yield from _rank_multisets(size - 1, r, counts)
+            counts[r] -= 1
+
+
+def _build_eval_tables() -> None:
+    """
+    Fill in the evaluator tables. Takes a fraction of a second, once.
+
+    Only the 5-card hands are ranked directly. A 6 or 7-card hand is the
+    best of the hands one card smaller, which are looked up in the level
+    below.
+    """
+    five_rank = {}
+    for counts in _rank_multisets(5):
+        product = 1
+        for r, c in enumerate(counts):
+            product *= _RANK_PRIMES[r] ** c
+        five_rank[product] = _rank_key(counts)
+    five_flush = {m: _flush_key(m) for m in range(8192) if m.bit_count() == 5}
+    keys = sorted(set(five_rank.values()) | set(five_flush.values()))
+    strength_of = {key: i + 1 for i, key in enumerate(keys)}
+    # Non-flush hands, keyed by prime product
+    rank_strength = {p: strength_of[k] for p, k in five_rank.items()}
+    level = rank_strength
+    for _ in (6, 7):
+        bigger = {}
+        for product, strength in level.items():
+            for prime in _RANK_PRIMES:
+                if product % prime ** 4:
+                    n = product * prime
+                    if bigger.get(n, 0) < strength:
+                        bigger[n] = strength
+        rank_strength.update(bigger)
+        level = bigger
+    # Flush hands, indexed by rank bitmask
+    flush_strength = [0] * 8192
+    for m, key in five_flush.items():
+        flush_strength[m] = strength_of[key]
+    for bits in (6, 7):
+        for m in range(8192):
+            if m.bit_count() == bits:
+                flush_strength[m] = max(flush_strength[m & ~(1 << r)]
+                                        for r in range(13) if m >> r & 1)
+    # Suit key sums: 7 cards of a suit never overflow the 3 bits of a key
+    flush_suit = [-1] * 4096
+    for total in range(4096):
+        for s in range(4):
+            if (total >> (3 * s)) & 7 >= 5:
+                flush_suit[total] = s
+    _CATEGORY_FLOORS[:] = [strength_of[min(k for k in keys if k[0] == cat)]
+                           for cat in range(len(HAND_CATEGORIES))]
+    _FLUSH_SUIT[:] = flush_suit
+    _FLUSH_STRENGTH[:] = flush_strength
+    _RANK_STRENGTH.update(rank_strength)
+
+
+def _deal_codes(hands: Sequence[Sequence[Card]],
+                board: Sequence[Card]) -> tuple[tuple, tuple]:
+    """
+    Return the codes of the hole Cards in <hands> and of <board>, after
+    checking that they make up a valid hold'em deal.
+    """
+    holes = tuple(tuple(card._code for card in hand) for hand in hands)
+    board_codes = tuple(card._code for card in board)
+    dealt = [c for hole in holes for c in hole] + list(board_codes)
+    if (len(holes) < 2 or any(len(hole) != 2 for hole in holes)
+            or len(board_codes) > 5 or max(dealt) > 51
+            or len(set(dealt)) != len(dealt)):
+        raise InvalidDealException
+    return holes, board_codes
+
+
+def _mc_shard(holes: tuple, board: tuple, trials: int, seed: int) -> tuple:
+    """
+    Deal <trials> random runouts of <board>, w/ an RNG seeded by <seed>.
+    Return the per-player win counts, tie counts, equity sums, and sums of
+    squared per-trial equity (for the confidence interval).
+
+    Module-level, so that it can be pickled into worker processes.
+    """
+    if not _FLUSH_SUIT:
+        _build_eval_tables()
+    dead = set(board).union(*holes)
+    rest = [c for c in range(52) if c not in dead]
+    need = 5 - len(board)
+    n = len(holes)
+    wins, ties, equity, squares = [0] * n, [0] * n, [0.0] * n, [0.0] * n
+    fixed = [list(hole) + list(board) for hole in holes]
+    evaluate = Poker.evaluate_codes
+    sample = rand.Random(seed).sample
+    for _ in range(trials):
+        runout = sample(rest, need)
+        scores = [evaluate(cards + runout) for cards in fixed]
+        best = max(scores)
+        split = scores.count(best)
+        if split == 1:
+            winner = scores.index(best)
+            wins[winner] += 1
+            equity[winner] += 1.0
+            squares[winner] += 1.0
+        else:
+            share = 1.0 / split
+            for i, score in enumerate(scores):
+                if score == best:
+                    ties[i] += 1
+                    equity[i] += share
+                    squares[i] += share * share
+    return wins, ties, equity, squares
+
+
+# NumPy copies of the evaluator tables, for Poker.evaluate_batch()
+_NP_TABLES: dict = {}
+
+
+def _numpy_tables() -> dict:
+    """
+    Return the evaluator tables as NumPy arrays, building them on first use.
+    NumPy is an optional extra, so it is only imported here.
+    """
+    if _NP_TABLES:
+        return _NP_TABLES
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("Poker.evaluate_batch() requires NumPy: "
+                          "pip install 'pietoolz[numpy]'") from None
+    if not _FLUSH_SUIT:
+        _build_eval_tables()
+    products = np.array(sorted(_RANK_STRENGTH), dtype=np.int64)
+    _NP_TABLES.update(
+        np=np,
+        prime=np.array(_CARD_PRIME, dtype=np.int64),
+        suit_key=np.array(_CARD_SUIT_KEY, dtype=np.int64),
+        rank_bit=np.array(_CARD_RANK_BIT, dtype=np.int64),
+        flush_suit=np.array(_FLUSH_SUIT, dtype=np.int64),
+        flush_strength=np.array(_FLUSH_STRENGTH, dtype=np.int32),
+        products=products,
+        rank_strength=np.array([_RANK_STRENGTH[p] for p in products.tolist()],
+                               dtype=np.int32))
+    return _NP_TABLES
+
+
+_MULTISETS_BY_SIZE: dict = {}
+
+
+def _rank_multiset_list(size: int) -> list[tuple[int, tuple]]:
+    """
+    Return (prime product, ((rank_index, count), ...)) for every <size>-card
+    multiset of ranks. Cached.
+    """
+    if size not in _MULTISETS_BY_SIZE:
+        _MULTISETS_BY_SIZE[size] = [
+            (math.prod(_RANK_PRIMES[r] ** c for r, c in enumerate(counts)),
+             tuple((r, c) for r, c in enumerate(counts) if c))
+            for counts in _rank_multisets(size)]
+    return _MULTISETS_BY_SIZE[size]
+
+
+def _exact_tally(holes: tuple, board: tuple) -> tuple:
+    """
+    Score every runout of <board>. Return the per-player win counts, tie
+    counts, and equity (in units of 1 / lcm(1..n) of a pot), and the number
+    of runouts.
+
+    Runouts are not dealt one by one. Unless someone makes a flush, the
+    showdown depends only on the ranks of the board, so each multiset of
+    runout ranks is scored once and weighted by how many runouts share it.
+    Then, for each suit, the runouts where that suit gives someone a flush
+    are re-scored (still grouped by the ranks of their off-suit cards),
+    and their rank-only result is swapped out. At most one suit can have 3+
+    cards on a board, so no runout is corrected twice.
+    """
+    if not _FLUSH_SUIT:
+        _build_eval_tables()
+    n = len(holes)
+    need = 5 - len(board)
+    dead = set(board).union(*holes)
+    rest = [c for c in range(52) if c not in dead]
+    known = [hole + board for hole in holes]
+    products = [math.prod(_CARD_PRIME[c] for c in cards) for cards in known]
+    unit = math.lcm(*range(1, n + 1))
+    wins, ties, equity = [0] * n, [0] * n, [0] * n
+    rank_strength = _RANK_STRENGTH
+
+    def tally(scores: list, weight: int) -> None:
+        best = max(scores)
+        split = scores.count(best)
+        if split == 1:
+            winner = scores.index(best)
+            wins[winner] += weight
+            equity[winner] += weight * unit
+        else:
+            share = weight * (unit // split)
+            for i, score in enumerate(scores):
+                if score == best:
+                    ties[i] += weight
+                    equity[i] += share
+
+    def weighted_multisets(cards: list, size: int):
+        # Yield (prime product, count of runouts) per rank multiset of <cards>
+        avail = [0] * 13
+        for c in cards:
+            avail[c >> 2] += 1
+        for product, groups in _rank_multiset_list(size):
+            weight = 1
+            for r, c in groups:
+                weight *= math.comb(avail[r], c)
+                if not weight:
+                    break
+            else:
+                yield product, weight
+
+    # Every runout, scored by ranks alone
+    for product, weight in weighted_multisets(rest, need):
+        tally([rank_strength[p * product] for p in products], weight)
+
+    # Flush corrections, one suit at a time
+    for suit in range(4):
+        on_board = sum(1 for c in board if c & 3 == suit)
+        in_hand = [sum(1 for c in hole if c & 3 == suit) for hole in holes]
+        suit_cards = [c for c in rest if c & 3 == suit]
+        off_suit = [c for c in rest if c & 3 != suit]
+        low = max(5 - on_board - max(in_hand), 0)
+        for m in range(low, min(need, len(suit_cards)) + 1):
+            flushes = [on_board + h + m >= 5 for h in in_hand]
+            off_multisets = list(weighted_multisets(off_suit, need - m))
+            for drawn in combinations(suit_cards, m):
+                drawn_product = math.prod(_CARD_PRIME[c] for c in drawn)
+                flush_scores = []
+                for cards, has_flush in zip(known, flushes):
+                    mask = 0
+                    if has_flush:
+                        for c in cards + drawn:
+                            if c & 3 == suit:
+                                mask |= _CARD_RANK_BIT[c]
+                    flush_scores.append(_FLUSH_STRENGTH[mask])
+                bases = [p * drawn_product for p in products]
+                for product, weight in off_multisets:
+                    by_rank = [rank_strength[b * product] for b in bases]
+                    tally([f or r for f, r in zip(flush_scores, by_rank)],
+                          weight)
+                    tally(by_rank, -weight)
+    return wins, ties, equity, math.comb(len(rest), need)
+
+
+# Hand Ranges
+# -----------
+# A range is an array('d') of 1326 weights, one per 2-card combo. The combo
+# of card codes a < b is at index b * (b - 1) // 2 + a.
+_COMBOS: tuple = tuple((a, b) for b in range(52) for a in range(b))
+_RANK_CHARS: str = '23456789TJQKA'
+_SUIT_CHARS: str = 'shdc'
+
+
+def _rank_combos(high: int, low: int, kind: str) -> list[int]:
+    """
+    Return the combo indices of the hand of rank indices <high> and <low>.
+    <kind> is 's' (suited), 'o' (offsuit), or '' (both, or a pair).
+    """
+    return [b * (b - 1) // 2 + a
+            for b in range(52) for a in range(b)
+            if {a >> 2, b >> 2} == {high, low} and (a >> 2 != b >> 2
+                                                    or high == low)
+            and (kind != 's' or a & 3 == b & 3)
+            and (kind != 'o' or a & 3 != b & 3)]
+
+
+def _parse_range_token(token: str) -> list[int]:
+    """
+    Return the combo indices of one range token, such as 'QQ+', 'T9s',
+    'A5s-A2s', 'KJo+' or 'AhKh'. Raise KeyError or ValueError if malformed.
+    """
+    if len(token) == 4 and token[1] in _SUIT_CHARS and token[3] in _SUIT_CHARS:
+        a = _RANK_CHARS.index(token[0]) * 4 + _SUIT_CHARS.index(token[1])
+        b = _RANK_CHARS.index(token[2]) * 4 + _SUIT_CHARS.index(token[3])
+        if a == b:
+            raise ValueError(token)
+        a, b = min(a, b), max(a, b)
+        return [b * (b - 1) // 2 + a]
+    first, _, last = token.partition('-')
+    plus = first.endswith('+')
+    first = first.rstrip('+')
+    high, low = _RANK_CHARS.index(first[0]), _RANK_CHARS.index(first[1])
+    kind = first[2:]
+    if kind not in ('', 's', 'o') or (plus and last) or low > high \
+            or (high == low and kind):
+        raise ValueError(token)
+    if last:
+        end_high, end_low = _RANK_CHARS.index(last[0]), _RANK_CHARS.index(last[1])
+        if last[2:] != kind or (high == low) != (end_high == end_low) \
+                or (high != low and end_high != high):
+            raise ValueError(token)
+        lows = range(min(low, end_low), max(low, end_low) + 1)
+    elif plus:
+        lows = range(low, 13 if high == low else high)
+    else:
+        lows = (low,)
+    if high == low:
+        return [i for r in lows for i in _rank_combos(r, r, '')]
+    return [i for r in lows for i in _rank_combos(high, r, kind)]
+
+
+def _range_weights(hand_range: Union[str, Sequence[float]]) -> array:
+    """
+    Return <hand_range> as 1326 combo weights, parsing it if it is a str.
+    """
+    if isinstance(hand_range, str):
+        return Poker.parse_range(hand_range)
+    if len(hand_range) != len(_COMBOS):
+        raise InvalidRangeException
+    return array('d', hand_range)
+
+
+def _range_tally_numpy(board: tuple, cards: Any, masks: Any,
+                       hero: Any, villain: Any) -> tuple[float, float, float]:
+    """
+    Return hero's weighted (wins, ties, matchups) vs. villain on the 5-card
+    <board>, over the combos <cards> (w/ card bitmasks <masks>) that either
+    range holds.
+
+    A combo only faces the villain combos that share no card w/ it. Rather
+    than pairing combos up, that is done by card removal: from the villain
+    weight below (or equal to, or anywhere around) a combo's strength, take
+    away the weight of villain combos holding either of its two cards, and
+    add back the one villain combo holding both (subtracted twice).
+    """
+    np = _NP_TABLES['np']
+    bits = sum(1 << c for c in board)
+    valid = (masks & bits) == 0
+    cards, hero, villain = cards[valid], hero[valid], villain[valid]
+    m = len(cards)
+    rows = np.empty((m, 7), dtype=np.intp)
+    rows[:, :2] = cards
+    rows[:, 2:] = board
+    strength = Poker.evaluate_batch(rows)
+    order = np.argsort(strength, kind='stable')
+    ranked, weight = strength[order], villain[order]
+    cum = np.concatenate(([0.0], np.cumsum(weight)))
+    # Per card: cumulative villain weight of the combos holding it
+    per_card = np.zeros((52, m + 1))
+    cols = np.arange(1, m + 1)
+    per_card[cards[order, 0], cols] = weight
+    per_card[cards[order, 1], cols] = weight
+    per_card = np.cumsum(per_card, axis=1)
+    lo = np.searchsorted(ranked, strength, 'left')
+    hi = np.searchsorted(ranked, strength, 'right')
+    a, b = cards[:, 0], cards[:, 1]
+    below = cum[lo] - per_card[a, lo] - per_card[b, lo]
+    equal = (cum[hi] - cum[lo] - (per_card[a, hi] - per_card[a, lo])
+             - (per_card[b, hi] - per_card[b, lo]) + villain)
+    total = cum[m] - per_card[a, m] - per_card[b, m] + villain
+    return (float(hero @ below), float(hero @ equal), float(hero @ total))
+
+
+def _range_tally(board: tuple, combos: list[tuple[int, int, int, float, float]]
+                 ) -> tuple[float, float, float]:
+    """
+    Pure-Python _range_tally_numpy(), over <combos> given as (mask, a, b,
+    hero weight, villain weight).
+    """
+    bits = sum(1 << c for c in board)
+    board = list(board)
+    evaluate = Poker.evaluate_codes
+    scored = sorted((evaluate([a, b] + board), a, b, wh, wv)
+                    for mask, a, b, wh, wv in combos if not mask & bits)
+    all_total, all_card = 0.0, [0.0] * 52
+    for _, a, b, _, wv in scored:
+        all_total += wv
+        all_card[a] += wv
+        all_card[b] += wv
+    below_total, below_card = 0.0, [0.0] * 52
+    wins = ties = total = 0.0
+    i = 0
+    while i < len(scored):
+        # One group of equal strength at a time, weakest first
+        j = i
+        equal_total, equal_card = 0.0, [0.0] * 52
+        while j < len(scored) and scored[j][0] == scored[i][0]:
+            _, a, b, _, wv = scored[j]
+            equal_total += wv
+            equal_card[a] += wv
+            equal_card[b] += wv
+            j += 1
+        for _, a, b, wh, wv in scored[i:j]:
+            if wh:
+                wins += wh * (below_total - below_card[a] - below_card[b])
+                ties += wh * (equal_total - equal_card[a] - equal_card[b] + wv)
+                total += wh * (all_total - all_card[a] - all_card[b] + wv)
+        below_total += equal_total
+        for c in range(52):
+            below_card[c] += equal_card[c]
+        i = j
+    return wins, ties, total
 
 
 class Poker():
@@ -569,8 +1403,592 @@ class Poker():
 
     Happy Playing!
     ==============
+
+    Hand Evaluation
+    ---------------
+    Poker.evaluate() scores 5 to 7 Cards as the best 5-card hand among them.
+    The higher the score, the better the hand, so hands can be compared
+    directly, and the winners of a showdown are those w/ the max score.
+
+    >>> royal = [Card(r, 's') for r in (1, 13, 12, 11, 10)]
+    >>> Poker.evaluate(royal)
+    7462
+    >>> Poker.category(Poker.evaluate(royal))
+    'Royal Flush'
+    >>> full_house = [Card(11, 's'), Card(11, 'h'), Card(11, 'c'),
+    ...               Card(13, 'c'), Card(13, 'd'), Card(2, 'h'), Card(7, 'd')]
+    >>> Poker.category(Poker.evaluate(full_house))
+    'Full House'
+    >>> wheel = [Card(1, 'd'), Card(2, 'c'), Card(3, 'd'), Card(4, 's'),
+    ...          Card(5, 'c'), Card(13, 'h')]
+    >>> Poker.category(Poker.evaluate(wheel))
+    'Straight'
+    >>> Poker.evaluate(full_house) > Poker.evaluate(wheel)
+    True
     """
-    pass
+    @staticmethod
+    def evaluate(cards: Iterable[Card]) -> int:
+        """
+        Return the strength of the best 5-card hand in <cards>, a collection
+        of 5 to 7 distinct, non-joker Cards. Refer to the class docstring.
+
+        Exceptions
+        ----------
+        If <cards> is not a valid hand, InvalidHandException is raised.
+        """
+        codes = [card._code for card in cards]
+        if (not 5 <= len(codes) <= 7 or max(codes) > 51
+                or len(set(codes)) != len(codes)):
+            raise InvalidHandException
+        return Poker.evaluate_codes(codes)
+
+
+    @staticmethod
+    def evaluate_codes(codes: Sequence[int]) -> int:
+        """
+        Return the strength of the best 5-card hand in <codes>, 5 to 7
+        distinct card codes (rank_index * 4 + suit_index, where rank_index 0
+        is a deuce and 12 an ace).
+
+        This is the hot path: it does NOT validate <codes>, and scoring a hand
+        costs two table lookups.
+
+        Client Code
+        -----------
+        >>> Poker.evaluate_codes([48, 44, 40, 36, 32])  # A-K-Q-J-T of Spades
+        7462
+        >>> Poker.evaluate_codes([20, 13, 10, 7, 0])  # 7-5-4-3-2, offsuit
+        1
+        """
+        if not _FLUSH_SUIT:
+            _build_eval_tables()
+        suit_sum = 0
+        product = 1
+        for c in codes:
+            suit_sum += _CARD_SUIT_KEY[c]
+            product *= _CARD_PRIME[c]
+        suit = _FLUSH_SUIT[suit_sum]
+        if suit < 0:
+            return _RANK_STRENGTH[product]
+        mask = 0
+        for c in codes:
+            if c & 3 == suit:
+                mask |= _CARD_RANK_BIT[c]
+        return _FLUSH_STRENGTH[mask]
+
+
+    @staticmethod
+    def evaluate_batch(hands: Any, chunk_size: int=1 << 20) -> Any:
+        """
+        Return a NumPy array of the strengths of <hands>, an (N, 5), (N, 6),
+        or (N, 7) array of card codes (refer to Card.get_code()), one hand per
+        row. Strengths are the same as those of Poker.evaluate().
+
+        Every table lookup is done on whole columns at once; rows are only
+        split into chunks of <chunk_size>, to bound the temporary arrays.
+        Like Poker.evaluate_codes(), <hands> is NOT validated.
+
+        Requires NumPy, an optional extra: pip install 'pietoolz[numpy]'.
+
+        Client Code
+        -----------
+        >>> import numpy as np
+        >>> hands = np.array([[48, 44, 40, 36, 32, 0, 1],   # royal flush
+        ...                   [20, 13, 10, 7, 0, 25, 30],   # 9-high
+        ...                   [0, 1, 2, 4, 5, 8, 12]])      # deuces full
+        >>> Poker.evaluate_batch(hands)
+        array([7462,   49, 7141], dtype=int32)
+        >>> [Poker.category(s) for s in Poker.evaluate_batch(hands)]
+        ['Royal Flush', 'High Card', 'Full House']
+        """
+        t = _numpy_tables()
+        np = t['np']
+        hands = np.asarray(hands, dtype=np.intp)
+        if hands.ndim != 2 or not 5 <= hands.shape[1] <= 7:
+            raise InvalidHandException
+        out = np.empty(len(hands), dtype=np.int32)
+        for start in range(0, len(hands), chunk_size):
+            chunk = hands[start:start + chunk_size]
+            product = t['prime'][chunk].prod(axis=1)
+            strength = t['rank_strength'][np.searchsorted(t['products'],
+                                                          product)]
+            suit = t['flush_suit'][t['suit_key'][chunk].sum(axis=1)]
+            flush = suit >= 0
+            if flush.any():
+                cards = chunk[flush]
+                in_suit = (cards & 3) == suit[flush][:, None]
+                # Cards of one suit have distinct ranks: the sum is the OR
+                mask = (t['rank_bit'][cards] * in_suit).sum(axis=1)
+                strength[flush] = t['flush_strength'][mask]
+            out[start:start + chunk_size] = strength
+        return out
+
+
+    @staticmethod
+    def category(strength: int) -> str:
+        """
+        Return the name of the hand category of <strength>, a score returned
+        by Poker.evaluate().
+
+        Client Code
+        -----------
+        >>> Poker.category(1)
+        'High Card'
+        >>> Poker.category(7461)
+        'Straight Flush'
+        """
+        if not _CATEGORY_FLOORS:
+            _build_eval_tables()
+        if strength == 7462:
+            return 'Royal Flush'
+        return HAND_CATEGORIES[bisect_right(_CATEGORY_FLOORS, strength) - 1]
+
+
+    @staticmethod
+    def monte_carlo_equity(hands: Sequence[Sequence[Card]],
+                           board: Sequence[Card]=(),
+                           trials: int=100_000,
+                           seed: Optional[int]=None,
+                           workers: Optional[int]=None,
+                           tolerance: Optional[float]=None,
+                           shard_size: int=10_000) -> dict[str, Any]:
+        """
+        Estimate the equity of each of <hands> (2 hole Cards per player),
+        given the known <board> Cards, by dealing up to <trials> random
+        runouts of the board.
+
+        The trials are split into shards of <shard_size>, each w/ its own RNG
+        seeded from <seed>, and the shards are run across <workers> processes
+        (all CPUs by default; 1 runs them in this process). Shard results are
+        combined in order, so the same <seed> gives the same result for any
+        number of <workers>.
+
+        If <tolerance> is passed, stop early once the 95% confidence interval
+        of every player's equity is within +/- <tolerance>.
+
+        Return
+        ------
+        A dict w/ the number of 'trials' dealt, and the per-player 'win' and
+        'tie' frequencies, 'equity' (wins plus split pots' shares), and the
+        'margin' of the 95% confidence interval of the equity.
+
+        Client Code
+        -----------
+        >>> aces = [Card(1, 's'), Card(1, 'h')]
+        >>> kings = [Card(13, 's'), Card(13, 'h')]
+        >>> odds = Poker.monte_carlo_equity([aces, kings], trials=20_000,
+        ...                                 seed=7, workers=1)
+        >>> odds['trials']
+        20000
+        >>> 0.79 < odds['equity'][0] < 0.85
+        True
+        >>> odds == Poker.monte_carlo_equity([aces, kings], trials=20_000,
+        ...                                  seed=7, workers=2)
+        True
+        >>> quick = Poker.monte_carlo_equity([aces, kings], trials=10**6,
+        ...                                  seed=7, workers=1, tolerance=0.01,
+        ...                                  shard_size=1_000)
+        >>> quick['trials'] < 10**6, max(quick['margin']) <= 0.01
+        (True, True)
+
+        Exceptions
+        ----------
+        If <hands> and <board> are not a valid deal, InvalidDealException is
+        raised.
+        """
+        holes, board_codes = _deal_codes(hands, board)
+        n = len(holes)
+        master = rand.Random(seed)
+        sizes = [shard_size] * (trials // shard_size)
+        if trials % shard_size:
+            sizes.append(trials % shard_size)
+        seeds = [master.getrandbits(64) for _ in sizes]
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        totals = [[0] * n, [0] * n, [0.0] * n, [0.0] * n]
+        done = 0
+        margins = [1.0] * n
+
+        def absorb(shard: tuple, size: int) -> bool:
+            # Add one shard's counts to the totals; return True to stop.
+            nonlocal done, margins
+            for total, part in zip(totals, shard):
+                for i in range(n):
+                    total[i] += part[i]
+            done += size
+            margins = []
+            for eq, sq in zip(totals[2], totals[3]):
+                mean = eq / done
+                variance = max(sq / done - mean * mean, 0.0)
+                margins.append(1.96 * math.sqrt(variance / done))
+            return tolerance is not None and max(margins) <= tolerance
+
+        if workers <= 1:
+            for size, s in zip(sizes, seeds):
+                if absorb(_mc_shard(holes, board_codes, size, s), size):
+                    break
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_mc_shard, holes, board_codes, size, s)
+                           for size, s in zip(sizes, seeds)]
+                for future, size in zip(futures, sizes):
+                    if absorb(future.result(), size):
+                        for pending in futures:
+                            pending.cancel()
+                        break
+
+        wins, ties, equity, _ = totals
+        scale = 1.0 / done if done else 0.0
+        return {'trials': done,
+                'win': [w * scale for w in wins],
+                'tie': [t * scale for t in ties],
+                'equity': [e * scale for e in equity],
+                'margin': margins}
+
+
+    @staticmethod
+    def parse_range(text: str) -> array:
+        """
+        Return the hand range described by <text> as an array of 1326 combo
+        weights (refer to the Hand Ranges notes above this class).
+
+        <text> is a comma-separated list of:
+        - pairs: 'QQ', 'QQ+' (QQ up to AA), 'QQ-88'
+        - other hands: 'AKs' (suited), 'AKo' (offsuit), 'AK' (both),
+          'ATs+' (AT up to AK, suited), 'A5s-A2s'
+        - specific combos: 'AhKh'
+        Each may end w/ ':weight' (1 by default); later entries override
+        earlier ones.
+
+        Client Code
+        -----------
+        >>> weights = Poker.parse_range('QQ+, AKs, AQo:0.5')
+        >>> sum(w > 0 for w in weights)  # 18 pairs + 4 suited + 12 offsuit
+        34
+        >>> sum(weights)
+        28.0
+
+        Exceptions
+        ----------
+        If <text> is malformed, InvalidRangeException is raised.
+        """
+        weights = array('d', bytes(8 * len(_COMBOS)))
+        for token in text.replace(' ', '').split(','):
+            if not token:
+                continue
+            hand, _, weight = token.partition(':')
+            try:
+                w = float(weight) if weight else 1.0
+                indices = _parse_range_token(hand)
+            except (KeyError, ValueError, IndexError):
+                raise InvalidRangeException from None
+            for i in indices:
+                weights[i] = w
+        return weights
+
+
+    @staticmethod
+    def range_equity(hero: Union[str, Sequence[float]],
+                     villain: Union[str, Sequence[float]],
+                     board: Sequence[Card]) -> dict[str, Any]:
+        """
+        Return the exact equity of the <hero> range vs. the <villain> range,
+        over every runout of the flop, turn, or river <board>. Each range is
+        either a str (refer to Poker.parse_range()) or 1326 combo weights.
+
+        Every combo pairing that shares no card counts, weighted by the
+        product of the two combos' weights. On each runout, each combo is
+        scored once (w/ Poker.evaluate_batch() if NumPy is installed), and
+        the combos are then ranked, not paired up one by one.
+
+        Return
+        ------
+        A dict w/ the number of 'runouts', and the hero and villain 'win' and
+        'tie' frequencies and 'equity' (wins plus half of the ties).
+
+        Client Code
+        -----------
+        >>> flop = [Card(13, 'd'), Card(7, 's'), Card(2, 's')]
+        >>> odds = Poker.range_equity('AA', 'KK', flop)
+        >>> odds['runouts']
+        1176
+        >>> round(odds['equity'][0], 4)
+        0.101
+        >>> odds = Poker.range_equity('QQ+, AKs', 'JJ-99, AQs+', flop)
+        >>> round(sum(odds['equity']), 6)
+        1.0
+
+        Exceptions
+        ----------
+        If <board> is not 3 to 5 distinct, non-joker Cards,
+        InvalidDealException is raised.
+        """
+        board_codes = tuple(card._code for card in board)
+        if (not 3 <= len(board_codes) <= 5 or max(board_codes) > 51
+                or len(set(board_codes)) != len(board_codes)):
+            raise InvalidDealException
+        hero_w, villain_w = _range_weights(hero), _range_weights(villain)
+        held = [i for i in range(len(_COMBOS)) if hero_w[i] or villain_w[i]]
+        rest = [c for c in range(52) if c not in board_codes]
+        runouts = list(combinations(rest, 5 - len(board_codes)))
+        try:
+            t = _numpy_tables()
+        except ImportError:
+            t = None
+        if t is not None:
+            np = t['np']
+            cards = np.array([_COMBOS[i] for i in held], dtype=np.intp)
+            masks = (np.int64(1) << cards[:, 0]) | (np.int64(1) << cards[:, 1])
+            hw = np.array([hero_w[i] for i in held])
+            vw = np.array([villain_w[i] for i in held])
+            tallies = [_range_tally_numpy(board_codes + runout, cards, masks,
+                                          hw, vw) for runout in runouts]
+        else:
+            combos = [((1 << _COMBOS[i][0]) | (1 << _COMBOS[i][1]),
+                       _COMBOS[i][0], _COMBOS[i][1], hero_w[i], villain_w[i])
+                      for i in held]
+            tallies = [_range_tally(board_codes + runout, combos)
+                       for runout in runouts]
+        wins = sum(t[0] for t in tallies)
+        ties = sum(t[1] for t in tallies)
+        total = sum(t[2] for t in tallies)
+        if not total:
+            raise InvalidRangeException
+        win, tie = wins / total, ties / total
+        lose = 1.0 - win - tie
+        return {'runouts': len(runouts),
+                'win': [win, lose],
+                'tie': [tie, tie],
+                'equity': [win + tie / 2, lose + tie / 2]}
+
+
+    @staticmethod
+    def exact_equity(hands: Sequence[Sequence[Card]],
+                     board: Sequence[Card]=()) -> dict[str, Any]:
+        """
+        Return the exact equity of each of <hands> (2 hole Cards per player),
+        given the known <board> Cards, over every possible runout of the
+        board. Unlike Poker.monte_carlo_equity(), the result is deterministic.
+
+        Return
+        ------
+        A dict w/ the number of 'runouts' of the board, and the per-player
+        'win' and 'tie' frequencies and 'equity' (wins plus split pots'
+        shares).
+
+        Client Code
+        -----------
+        >>> aces = [Card(1, 's'), Card(1, 'h')]
+        >>> kings = [Card(13, 's'), Card(13, 'h')]
+        >>> odds = Poker.exact_equity([aces, kings])
+        >>> odds['runouts']
+        1712304
+        >>> round(odds['equity'][0], 4), round(odds['tie'][0], 4)
+        (0.8264, 0.0054)
+        >>> flop = [Card(13, 'd'), Card(7, 's'), Card(2, 's')]
+        >>> odds = Poker.exact_equity([aces, kings], flop)
+        >>> odds['runouts'], round(odds['equity'][0], 4)
+        (990, 0.1222)
+
+        Exceptions
+        ----------
+        If <hands> and <board> are not a valid deal, InvalidDealException is
+        raised.
+        """
+        holes, board_codes = _deal_codes(hands, board)
+        wins, ties, equity, runouts = _exact_tally(holes, board_codes)
+        unit = math.lcm(*range(1, len(holes) + 1))
+        return {'runouts': runouts,
+                'win': [w / runouts for w in wins],
+                'tie': [t / runouts for t in ties],
+                'equity': [e / (unit * runouts) for e in equity]}
+
+
+class _SeatState:
+    """
+    What one seat's known cards (hole + board) add up to, kept up to date
+    one card at a time.
+    """
+    __slots__ = ('n', 'rank_counts', 'count_hist', 'suit_masks', 'product',
+                 'suit_sum')
+
+    n: int                 # Number of known cards
+    rank_counts: list      # rank_index -> number of cards of that rank
+    count_hist: list       # k -> number of ranks held exactly k times
+    suit_masks: list       # suit_index -> bitmask of ranks held in that suit
+    product: int           # Product of rank primes (refer to _RANK_STRENGTH)
+    suit_sum: int          # Sum of suit keys (refer to _FLUSH_SUIT)
+
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.rank_counts = [0] * 13
+        self.count_hist = [13, 0, 0, 0, 0]
+        self.suit_masks = [0, 0, 0, 0]
+        self.product = 1
+        self.suit_sum = 0
+
+
+    def add(self, code: int) -> None:
+        r = code >> 2
+        c = self.rank_counts[r]
+        self.rank_counts[r] = c + 1
+        self.count_hist[c] -= 1
+        self.count_hist[c + 1] += 1
+        self.suit_masks[code & 3] |= _CARD_RANK_BIT[code]
+        self.product *= _CARD_PRIME[code]
+        self.suit_sum += _CARD_SUIT_KEY[code]
+        self.n += 1
+
+
+    def category_with(self, code: Optional[int]=None) -> int:
+        """
+        Return the index (in HAND_CATEGORIES) of the category of this seat's
+        best hand, w/ the card <code> added if passed, w/o changing state.
+        """
+        n, product, suit_sum = self.n, self.product, self.suit_sum
+        if code is not None:
+            n += 1
+            product *= _CARD_PRIME[code]
+            suit_sum += _CARD_SUIT_KEY[code]
+        if n >= 5:
+            suit = _FLUSH_SUIT[suit_sum]
+            if suit < 0:
+                strength = _RANK_STRENGTH[product]
+            else:
+                mask = self.suit_masks[suit]
+                if code is not None and code & 3 == suit:
+                    mask |= _CARD_RANK_BIT[code]
+                strength = _FLUSH_STRENGTH[mask]
+            return bisect_right(_CATEGORY_FLOORS, strength) - 1
+        # Fewer than 5 cards: only sets of matching ranks count
+        hist = self.count_hist
+        top = max((k for k in range(1, 5) if hist[k]), default=0)
+        pairs = hist[2]
+        if code is not None:
+            c = self.rank_counts[code >> 2] + 1
+            top = max(top, c)
+            pairs += (c == 2) - (c == 3)
+        if top >= 3:
+            return 7 if top == 4 else 3
+        return min(pairs, 2)
+
+
+class HandTracker:
+    """
+    Keep track of every seat's best hand as a hold'em hand goes from street
+    to street, w/o re-scoring anyone from scratch.
+
+    Each seat keeps histograms and bitmasks of its ranks and suits. Adding a
+    board card updates them in O(1) per seat, and the current best hand is
+    then read off the evaluator tables (refer to Poker.evaluate()).
+
+    Client Code
+    -----------
+    >>> hands = [[Card(1, 's'), Card(13, 's')], [Card(9, 'h'), Card(9, 'd')]]
+    >>> table = HandTracker(hands)
+    >>> table.category(0), table.category(1)
+    ('High Card', 'One Pair')
+    >>> for card in (Card(13, 'h'), Card(9, 's'), Card(4, 's')):  # The flop
+    ...     table.add_board_card(card)
+    >>> table.category(0), table.category(1)
+    ('One Pair', 'Three of a Kind')
+    >>> table.strength(1) > table.strength(0)
+    True
+    >>> len(table.outs(0))  # 9 spades, 3 aces, 2 kings, 3 fours, 1 nine
+    18
+    >>> Card(1, 'h') in table.outs(0)
+    True
+    """
+    _seats: list[_SeatState]
+    _board: list[Card]
+    _seen: set[int]
+
+
+    def __init__(self,
+                 hands: Sequence[Sequence[Card]],
+                 board: Sequence[Card]=()) -> None:
+        """
+        Track <hands> (2 hole Cards per seat), given the known <board> Cards.
+
+        Exceptions
+        ----------
+        If <hands> and <board> are not a valid deal, InvalidDealException is
+        raised.
+        """
+        holes, board_codes = _deal_codes(hands, board)
+        if not _FLUSH_SUIT:
+            _build_eval_tables()
+        self._seats = []
+        for hole in holes:
+            seat = _SeatState()
+            for code in hole + board_codes:
+                seat.add(code)
+            self._seats.append(seat)
+        self._board = list(board)
+        self._seen = set(board_codes).union(*holes)
+
+
+    def add_board_card(self, card: Card) -> None:
+        """
+        Deal <card> to the board, and update every seat's hand.
+
+        Exceptions
+        ----------
+        If <card> is already dealt, is a j0ker, or the board is full,
+        InvalidDealException is raised.
+        """
+        code = card._code
+        if code > 51 or code in self._seen or len(self._board) == 5:
+            raise InvalidDealException
+        self._seen.add(code)
+        self._board.append(card)
+        for seat in self._seats:
+            seat.add(code)
+
+
+    def get_board(self) -> tuple[Card, ...]:
+        return tuple(self._board)
+
+
+    def strength(self, seat: int) -> Optional[int]:
+        """
+        Return the strength (refer to Poker.evaluate()) of the best hand of
+        <seat>, or None before the flop, when there is no 5-card hand yet.
+        """
+        state = self._seats[seat]
+        if state.n < 5:
+            return None
+        suit = _FLUSH_SUIT[state.suit_sum]
+        if suit < 0:
+            return _RANK_STRENGTH[state.product]
+        return _FLUSH_STRENGTH[state.suit_masks[suit]]
+
+
+    def category(self, seat: int) -> str:
+        """
+        Return the category of the best hand of <seat>, e.g. 'Two Pair'.
+        Before the flop, that is 'One Pair' or 'High Card'.
+        """
+        strength = self.strength(seat)
+        if strength is not None:
+            return Poker.category(strength)
+        return HAND_CATEGORIES[self._seats[seat].category_with()]
+
+
+    def outs(self, seat: int) -> tuple[Card, ...]:
+        """
+        Return the unseen Cards that would improve the hand category of
+        <seat> if dealt to the board next, e.g. a fourth spade to a flush
+        draw. Cards held by other seats are seen, so they are not outs.
+        """
+        state = self._seats[seat]
+        now = state.category_with()
+        if len(self._board) == 5:
+            return ()
+        return tuple(_CARDS_BY_CODE[c] for c in range(52)
+                     if c not in self._seen and state.category_with(c) > now)
 
 
 if __name__ == '__main__':
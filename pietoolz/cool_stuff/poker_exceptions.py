@@ -18,6 +18,29 @@ class JokerCountException(Exception):
         super().__init__("The maximum number of Joker cards is two.")
 
 
+class InvalidHandException(Exception):
+    def __init__(self):
+        super().__init__("A poker hand must be 5 to 7 distinct, non-joker Cards.")
+
+
+class NotEnoughCardsException(Exception):
+    def __init__(self):
+        super().__init__("There are not enough cards left in the deck.")
+
+
+class InvalidDealException(Exception):
+    def __init__(self):
+        super().__init__("A deal must be 2 hole Cards per player, for 2+ "
+                         "players, and at most 5 board Cards, all distinct "
+                         "and non-joker.")
+
+
+class InvalidRangeException(Exception):
+    def __init__(self):
+        super().__init__("A range is a comma-separated list of hands, e.g. "
+                         "'QQ+, AKs, A5s-A2s, KQo:0.5, AhKh'.")
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod()
@@ -0,0 +1,293 @@
+"""
+Precomputed hold'em equity tables, saved to disk once and memory-mapped by
+every process that needs them afterwards.
+
+The 169 canonical starting hands are laid out as the usual 13x13 grid, aces
+first: pairs on the diagonal, suited hands above it, and offsuit hands below
+it. Hand i vs. hand j is entry [i, j] of a 169x169 table.
+
+By default the table is exact: every matchup is enumerated over every
+runout by Poker.exact_equity(). This takes about 5 CPU-hours, spread over
+all CPUs. A table built w/ <trials> is a Monte Carlo estimate instead:
+quick, but each entry is only accurate to about +/- 1 / sqrt(<trials>) (95%
+confidence), e.g. +/- 3% for 1000 trials. Keep it for tests and sketches.
+
+Client Code
+-----------
+>>> import os, tempfile
+>>> path = os.path.join(tempfile.mkdtemp(), 'preflop.bin')
+>>> build_preflop_table(path, trials=1, workers=1)  # Leave out trials for real
+>>> with PreflopTable(path) as table:
+...     table.equity('AA', 'AA')
+...     table.equity('AKs', '72o') + table.equity('72o', 'AKs')
+0.5
+1.0
+"""
+from __future__ import annotations
+from typing import Optional, Sequence, Union
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import permutations
+import mmap
+import os
+import random as rand
+import struct
+
+from pietoolz.cool_stuff.poker import Card, Poker
+from pietoolz.cool_stuff.poker_exceptions import InvalidHandException
+
+
+RANK_CHARS: str = 'AKQJT98765432'
+
+# 'AA', 'AKs', ..., 'A2s', 'AKo', 'KK', ..., '22', in grid order
+HAND_NAMES: tuple = tuple(
+    RANK_CHARS[i] + RANK_CHARS[j] if i == j
+    else RANK_CHARS[min(i, j)] + RANK_CHARS[max(i, j)] + ('s' if i < j else 'o')
+    for i in range(13) for j in range(13))
+_HAND_INDEX: dict = {name: i for i, name in enumerate(HAND_NAMES)}
+
+# File layout: header, then a 169x169 row-major table of native doubles
+_MAGIC: bytes = b'PTZ1'
+# magic, hand count, trials, padding (keeps the doubles 8-byte aligned)
+_HEADER: struct.Struct = struct.Struct('<4sIII')
+_DECK: range = range(52)
+# Every relabeling of the 4 suits; equity does not change under any of them
+_SUIT_PERMS: list = list(permutations(range(4)))
+
+
+def hand_index(hand: Union[str, Sequence[Card]]) -> int:
+    """
+    Return the grid index of <hand>: a canonical name like 'AKs', 'T9o' or
+    'QQ', or 2 hole Cards.
+
+    >>> hand_index('AA'), hand_index('AKs'), hand_index('AKo'), hand_index('22')
+    (0, 1, 13, 168)
+    >>> hand_index([Card(13, 'h'), Card(1, 'h')])
+    1
+
+    Exceptions
+    ----------
+    If <hand> is not 2 distinct, non-joker Cards, InvalidHandException is
+    raised.
+    """
+    if isinstance(hand, str):
+        return _HAND_INDEX[hand]
+    codes = [card.get_code() for card in hand]
+    if len(codes) != 2 or max(codes) > 51 or codes[0] == codes[1]:
+        raise InvalidHandException
+    a, b = codes
+    i, j = 12 - (a >> 2), 12 - (b >> 2)
+    if (a & 3) == (b & 3):
+        return min(i, j) * 13 + max(i, j)
+    return max(i, j) * 13 + min(i, j)
+
+
+def _hand_combos(index: int) -> list[tuple[int, int]]:
+    """
+    Return the card-code pairs of every combo of the hand at <index>.
+    """
+    i, j = divmod(index, 13)
+    r1, r2 = 12 - i, 12 - j
+    return [(r1 * 4 + s1, r2 * 4 + s2)
+            for s1 in range(4) for s2 in range(4)
+            if (s1 < s2 if i == j else (s1 == s2) == (i < j))]
+
+
+def _preflop_row(i: int, trials: int, seed: int) -> list[float]:
+    """
+    Estimate the equity of hand <i> vs. every hand j > i, over <trials>
+    random deals each: random combos of both hands, then a random board.
+
+    Module-level, so that it can be pickled into worker processes.
+    """
+    rng = rand.Random(seed)
+    choice, sample = rng.choice, rng.sample
+    evaluate = Poker.evaluate_codes
+    mine = _hand_combos(i)
+    row = []
+    for j in range(i + 1, 169):
+        theirs = _hand_combos(j)
+        equity = 0.0
+        for _ in range(trials):
+            a = choice(mine)
+            b = choice(theirs)
+            while a[0] in b or a[1] in b:
+                b = choice(theirs)
+            # 5 of 9 random cards are sure to miss both hands' 4 cards
+            board = [c for c in sample(_DECK, 9)
+                     if c not in a and c not in b][:5]
+            mine_score = evaluate(list(a) + board)
+            their_score = evaluate(list(b) + board)
+            if mine_score > their_score:
+                equity += 1.0
+            elif mine_score == their_score:
+                equity += 0.5
+        row.append(equity / trials)
+    return row
+
+
+def _suit_class(a: tuple[int, int], b: tuple[int, int]) -> tuple:
+    """
+    Return a key shared by the card-code pairs <a> vs. <b> and every deal
+    that is the same up to relabeling suits.
+    """
+    return min((tuple(sorted((c & ~3) | perm[c & 3] for c in a)),
+                tuple(sorted((c & ~3) | perm[c & 3] for c in b)))
+               for perm in _SUIT_PERMS)
+
+
+def _exact_row(i: int) -> list[float]:
+    """
+    Return the exact equity of hand <i> vs. every hand j > i, averaged over
+    every combo of both hands.
+
+    All combos of hand <i> are the same up to suits, so only its first is
+    dealt, vs. each combo of hand j it does not block. Those deals fall
+    into a few classes that are the same up to suits; one of each class is
+    enumerated, weighted by the class's size.
+
+    Module-level, so that it can be pickled into worker processes.
+    """
+    mine = _hand_combos(i)[0]
+    hand = [Card.from_code(c) for c in mine]
+    row = []
+    for j in range(i + 1, 169):
+        classes = {}
+        for b in _hand_combos(j):
+            if b[0] not in mine and b[1] not in mine:
+                key = _suit_class(mine, b)
+                deal, count = classes.get(key, (b, 0))
+                classes[key] = (deal, count + 1)
+        equity = 0.0
+        for deal, count in classes.values():
+            other = [Card.from_code(c) for c in deal]
+            equity += count * Poker.exact_equity([hand, other])['equity'][0]
+        row.append(equity / sum(count for _, count in classes.values()))
+    return row
+
+
+def build_preflop_table(path: str,
+                        trials: Optional[int]=None,
+                        seed: int=0,
+                        workers: Optional[int]=None) -> None:
+    """
+    Compute the equity of each of the 169 canonical starting hands vs. each
+    other, and save the table to <path> for PreflopTable to map. The table
+    is exact, unless <trials> is given: then it is estimated over <trials>
+    random deals per matchup, w/ the precision given in the module
+    docstring.
+
+    Rows of the table are computed across <workers> processes (all CPUs by
+    default; 1 runs them in this process). Estimates use an RNG per row
+    seeded from <seed>, so the same <seed> gives the same table. Since hand
+    j vs. hand i is 1 minus hand i vs. hand j, only half of the matchups
+    are computed. A hand vs. itself is exactly 0.5.
+
+    The file is written to a temporary name and then renamed, so a process
+    mapping <path> never sees a half-written table.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if trials is None:
+        row_func, args = _exact_row, (range(169),)
+    else:
+        seeds = [rand.Random(seed * 169 + i).getrandbits(64)
+                 for i in range(169)]
+        row_func, args = _preflop_row, (range(169), [trials] * 169, seeds)
+    if workers <= 1:
+        rows = list(map(row_func, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = list(pool.map(row_func, *args))
+    table = array('d', [0.5]) * (169 * 169)
+    for i, row in enumerate(rows):
+        for j, equity in enumerate(row, i + 1):
+            table[i * 169 + j] = equity
+            table[j * 169 + i] = 1.0 - equity
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, 169, trials or 0, 0))
+        table.tofile(f)
+    os.replace(tmp, path)
+
+
+class PreflopTable:
+    """
+    A preflop equity table saved by build_preflop_table(), memory-mapped
+    read-only. Opening one parses nothing but a 16-byte header; the OS pages
+    the table in as it is read, and shares those pages between processes.
+    <trials> is the number of deals per matchup of an estimated table, or 0
+    if the table is exact.
+
+    Refer to the module docstring for Client Code.
+    """
+    _file: object
+    _map: mmap.mmap
+    _table: memoryview
+    trials: int
+
+
+    def __init__(self, path: str) -> None:
+        """
+        Map the table saved at <path>.
+
+        Exceptions
+        ----------
+        If <path> does not hold a whole table, ValueError is raised.
+        """
+        self._file = open(path, 'rb')
+        self._map = None
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+            magic, n, self.trials, _ = _HEADER.unpack_from(self._map)
+            if (magic != _MAGIC or n != 169
+                    or len(self._map) != _HEADER.size + 8 * n * n):
+                raise ValueError
+        except (OSError, ValueError, struct.error):
+            # e.g. an empty file (which cannot be mapped) or a short one
+            if self._map is not None:
+                self._map.close()
+            self._file.close()
+            raise ValueError(f'{path} is not a preflop equity table.') from None
+        self._table = memoryview(self._map)[_HEADER.size:].cast('d')
+
+
+    def equity(self,
+               hand: Union[str, Sequence[Card]],
+               other: Union[str, Sequence[Card]]) -> float:
+        """
+        Return the equity of <hand> vs. <other>. Refer to hand_index() for
+        how hands can be given.
+        """
+        return self._table[hand_index(hand) * 169 + hand_index(other)]
+
+
+    def row(self, hand: Union[str, Sequence[Card]]) -> memoryview:
+        """
+        Return the equities of <hand> vs. each hand in HAND_NAMES, as a
+        zero-copy view into the table. Release the view before closing this
+        PreflopTable.
+        """
+        start = hand_index(hand) * 169
+        return self._table[start:start + 169]
+
+
+    def close(self) -> None:
+        if hasattr(self, '_table'):
+            self._table.release()
+        self._map.close()
+        self._file.close()
+
+
+    def __enter__(self) -> PreflopTable:
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
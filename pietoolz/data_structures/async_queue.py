@@ -0,0 +1,323 @@
+from __future__ import annotations
+from typing import Any, Iterable, Mapping, Optional
+from collections import deque
+import asyncio
+
+from pietoolz.data_structures.queue import QueueFullException
+
+
+class QueueClosedException(Exception):
+    def __init__(self):
+        super().__init__("The Queue is closed.")
+
+
+class AsyncQueue:
+    """
+    The asyncio counterpart of Queue, for many producer and many consumer
+    tasks. Awaiting put() waits for room when the AsyncQueue is at capacity
+    (backpressure), and awaiting get() waits for an item.
+
+    Per-item awaits are what make fanning events out costly, so both sides
+    also move items in batches: put_many() adds as many items as fit at
+    once, and get_batch() hands a consumer everything that is ready, up to
+    <max_items>, optionally lingering <max_wait> seconds to fill the batch.
+    A task only suspends when it truly has to wait.
+
+    When producers are done, close() the AsyncQueue: putting then raises
+    QueueClosedException, while consumers still drain the items left, after
+    which get() raises QueueClosedException and <async for> loops end.
+
+    Client Code
+    -----------
+    >>> async def demo():
+    ...     events = AsyncQueue(capacity=100)
+    ...     batches = []
+    ...     async def log_consumer():
+    ...         while batch := await events.get_batch(max_items=4):
+    ...             batches.append(batch)
+    ...     consumer = asyncio.create_task(log_consumer())
+    ...     await events.put_many(range(10))
+    ...     await events.put('fold')
+    ...     events.close()
+    ...     await consumer
+    ...     return batches
+    >>> asyncio.run(demo())
+    [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 'fold']]
+    """
+    _queue: deque
+    _capacity: Optional[int]
+    _closed: bool
+    # Futures of the tasks waiting for an item, for room, or for empty
+    _getters: deque
+    _putters: deque
+    _drainers: deque
+
+
+    def __init__(self, item: Any=None, capacity: Optional[int]=None) -> None:
+        """
+        Initialize AsyncQueue. Refer to Queue for <item>. <capacity> is the
+        max number of items; None means unbounded.
+        """
+        self._queue = deque()
+        self._capacity = capacity
+        self._closed = False
+        self._getters, self._putters, self._drainers = deque(), deque(), deque()
+        if item is not None:
+            if isinstance(item, (str, bytes, bytearray, Mapping)):
+                self.put_nowait(item)
+            elif isinstance(item, Iterable):
+                for i in item:
+                    self.put_nowait(i)
+            else:
+                self.put_nowait(item)
+
+
+    def __str__(self) -> str:
+        return str(list(self._queue))
+
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+    @staticmethod
+    def _wake(waiters: deque, n: Optional[int]=None) -> None:
+        """
+        Wake up to <n> (default: all) of the tasks waiting on <waiters>.
+        """
+        while waiters and (n is None or n > 0):
+            future = waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                if n is not None:
+                    n -= 1
+
+
+    async def _wait(self, waiters: deque, timeout: Optional[float]=None) -> bool:
+        """
+        Suspend until woken through <waiters>. Return False if <timeout>
+        seconds pass first.
+        """
+        future = asyncio.get_running_loop().create_future()
+        waiters.append(future)
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        except asyncio.CancelledError:
+            # Pass on a wake-up this task can no longer use.
+            if future.done() and not future.cancelled():
+                self._wake(waiters, 1)
+            raise
+        finally:
+            try:
+                waiters.remove(future)
+            except ValueError:
+                pass
+
+
+    def _room(self) -> int:
+        if self._capacity is None:
+            return 1 << 62
+        return self._capacity - len(self._queue)
+
+
+    def _taken(self, n: int) -> None:
+        # Call after <n> items are removed: 1 waiting producer per freed slot.
+        if self._putters:
+            self._wake(self._putters, n)
+        if not self._queue and self._drainers:
+            self._wake(self._drainers)
+
+
+    def put_nowait(self, item: Any) -> None:
+        """
+        Add <item> to the back of this AsyncQueue w/o waiting.
+
+        Exceptions
+        ----------
+        If it is closed, QueueClosedException is raised. If it is full,
+        QueueFullException is raised.
+        """
+        if self._closed:
+            raise QueueClosedException
+        if self._room() <= 0:
+            raise QueueFullException
+        self._queue.append(item)
+        if self._getters:
+            self._wake(self._getters, 1)
+
+
+    async def put(self, item: Any) -> None:
+        """
+        Add <item> to the back of this AsyncQueue, waiting for room if it is
+        full.
+
+        Exceptions
+        ----------
+        If it is (or gets) closed, QueueClosedException is raised.
+        """
+        while self._room() <= 0 and not self._closed:
+            await self._wait(self._putters)
+        self.put_nowait(item)
+
+
+    async def put_many(self, items: Iterable[Any]) -> None:
+        """
+        Add each of <items>, in order, to the back of this AsyncQueue, as
+        many at a time as there is room for.
+        """
+        items = iter(items)
+        pending = deque()
+        while True:
+            if self._closed:
+                raise QueueClosedException
+            # Only wait for room w/ an item in hand: a producer woken for a
+            # slot must fill it, as no other producer is woken for it
+            if not pending:
+                try:
+                    pending.append(next(items))
+                except StopIteration:
+                    return
+            while self._room() <= 0 and not self._closed:
+                await self._wait(self._putters)
+            if self._closed:
+                raise QueueClosedException
+            room = self._room()
+            while len(pending) < room:
+                try:
+                    pending.append(next(items))
+                except StopIteration:
+                    break
+            added = min(room, len(pending))
+            for _ in range(added):
+                self._queue.append(pending.popleft())
+            if self._getters:
+                self._wake(self._getters, added)
+
+
+    def get_nowait(self) -> Any:
+        """
+        Remove the item at the front of this AsyncQueue and return it, or
+        return None if there is none.
+        """
+        if not self._queue:
+            return None
+        item = self._queue.popleft()
+        self._taken(1)
+        return item
+
+
+    async def get(self) -> Any:
+        """
+        Remove the item at the front of this AsyncQueue and return it,
+        waiting for one if it is empty.
+
+        Exceptions
+        ----------
+        If it is closed and empty, QueueClosedException is raised.
+        """
+        while not self._queue:
+            if self._closed:
+                raise QueueClosedException
+            await self._wait(self._getters)
+        return self.get_nowait()
+
+
+    async def get_batch(self,
+                        max_items: int,
+                        max_wait: Optional[float]=None) -> list[Any]:
+        """
+        Remove up to <max_items> items from the front of this AsyncQueue and
+        return them, front first. Wait for at least one; then, if fewer than
+        <max_items> are ready, keep collecting for up to <max_wait> seconds
+        (no waiting if None).
+
+        Return an empty list only once the AsyncQueue is closed and empty.
+
+        Exceptions
+        ----------
+        If <max_items> is not positive, ValueError is raised.
+        """
+        if max_items <= 0:
+            raise ValueError('max_items must be positive.')
+        while not self._queue:
+            if self._closed:
+                return []
+            await self._wait(self._getters)
+        if max_wait is not None and len(self._queue) < max_items:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + max_wait
+            while len(self._queue) < max_items and not self._closed:
+                remaining = deadline - loop.time()
+                if remaining <= 0 or not await self._wait(self._getters,
+                                                          remaining):
+                    break
+        queue = self._queue
+        batch = [queue.popleft() for _ in range(min(max_items, len(queue)))]
+        self._taken(len(batch))
+        # Items may be left for other consumers that were woken for them
+        if queue and self._getters:
+            self._wake(self._getters, len(queue))
+        return batch
+
+
+    def close(self) -> None:
+        """
+        Stop accepting items. Items already in the AsyncQueue can still be
+        got; waiting producers get QueueClosedException.
+        """
+        self._closed = True
+        self._wake(self._getters)
+        self._wake(self._putters)
+
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+
+    async def drain(self) -> None:
+        """
+        Wait until every item in this AsyncQueue has been got.
+        """
+        while self._queue:
+            await self._wait(self._drainers)
+
+
+    def is_empty(self) -> bool:
+        return not self._queue
+
+
+    def size(self) -> int:
+        return len(self._queue)
+
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+
+    def __aiter__(self) -> AsyncQueue:
+        return self
+
+
+    async def __anext__(self) -> Any:
+        """
+        Get the next item, until this AsyncQueue is closed and drained.
+
+        >>> async def demo():
+        ...     q = AsyncQueue(['deal', 'bet'])
+        ...     q.close()
+        ...     return [action async for action in q]
+        >>> asyncio.run(demo())
+        ['deal', 'bet']
+        """
+        try:
+            return await self.get()
+        except QueueClosedException:
+            raise StopAsyncIteration from None
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
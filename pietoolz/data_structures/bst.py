@@ -1,24 +1,971 @@
 from __future__ import annotations
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Iterator, Mapping, Optional, Union
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, chain, islice
 
 
 class _Node():
     """
-    Node
+    Node of an AVL tree: a key, its value, and the height and size (number
+    of nodes) of the subtree rooted here.
     """
+    __slots__ = ('_key', '_value', '_left', '_right', '_height', '_size')
+    _key: Any
     _value: Optional[Any]
+    _left: Optional[_Node]
+    _right: Optional[_Node]
+    _height: int
+    _size: int
+
+
+    def __init__(self, key: Any, value: Optional[Any]=None) -> None:
+        self._key = key
+        self._value = value
+        self._left = self._right = None
+        self._height = self._size = 1
+
+
+def _height(node: Optional[_Node]) -> int:
+    return node._height if node is not None else 0
+
+
+def _size(node: Optional[_Node]) -> int:
+    return node._size if node is not None else 0
+
+
+def _update(node: _Node) -> None:
+    """
+    Recompute the height and size of <node> from its children.
+    """
+    left, right = node._left, node._right
+    lh = left._height if left is not None else 0
+    rh = right._height if right is not None else 0
+    node._height = (lh if lh > rh else rh) + 1
+    node._size = ((left._size if left is not None else 0)
+                  + (right._size if right is not None else 0) + 1)
+
+
+def _rotate_right(node: _Node) -> _Node:
+    pivot = node._left
+    node._left = pivot._right
+    pivot._right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node: _Node) -> _Node:
+    pivot = node._right
+    node._right = pivot._left
+    pivot._left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node: _Node) -> _Node:
+    """
+    Update <node>, then restore the AVL invariant at it, if its children's
+    heights are 2 apart. Return the root of the subtree.
+    """
+    _update(node)
+    balance = _height(node._left) - _height(node._right)
+    if balance > 1:
+        if _height(node._left._left) < _height(node._left._right):
+            node._left = _rotate_left(node._left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node._right._right) < _height(node._right._left):
+            node._right = _rotate_right(node._right)
+        return _rotate_left(node)
+    return node
+
+
+def _insert(node: Optional[_Node], key: Any, value: Any) -> _Node:
+    if node is None:
+        return _Node(key, value)
+    if key < node._key:
+        node._left = _insert(node._left, key, value)
+    elif node._key < key:
+        node._right = _insert(node._right, key, value)
+    else:
+        node._value = value
+        return node
+    return _rebalance(node)
+
+
+def _pop_min(node: _Node) -> tuple[Optional[_Node], _Node]:
+    """
+    Remove the min node of the subtree at <node>. Return the new root of
+    the subtree, and the min node.
+    """
+    if node._left is None:
+        return node._right, node
+    node._left, smallest = _pop_min(node._left)
+    return _rebalance(node), smallest
+
+
+def _delete(node: Optional[_Node], key: Any) -> Optional[_Node]:
+    if node is None:
+        raise KeyError(key)
+    if key < node._key:
+        node._left = _delete(node._left, key)
+    elif node._key < key:
+        node._right = _delete(node._right, key)
+    else:
+        if node._left is None:
+            return node._right
+        if node._right is None:
+            return node._left
+        right, successor = _pop_min(node._right)
+        successor._left, successor._right = node._left, right
+        node = successor
+    return _rebalance(node)
+
+
+def _build(keys: list, values: Optional[list], lo: int, hi: int) -> Optional[_Node]:
+    """
+    Return the root of a perfectly balanced tree of sorted <keys>[lo:hi],
+    w/ their <values> (or None).
+    """
+    if lo >= hi:
+        return None
+    mid = (lo + hi) // 2
+    node = _Node(keys[mid], values[mid] if values is not None else None)
+    node._left = _build(keys, values, lo, mid)
+    node._right = _build(keys, values, mid + 1, hi)
+    _update(node)
+    return node
+
+
+def _join(left: Optional[_Node], node: _Node, right: Optional[_Node]) -> _Node:
+    """
+    Return the root of a tree of the keys of <left>, then <node>'s key,
+    then the keys of <right>, which must be in that order. Takes
+    O(|height(left) - height(right)|).
+    """
+    lh, rh = _height(left), _height(right)
+    if lh > rh + 1:
+        left._right = _join(left._right, node, right)
+        return _rebalance(left)
+    if rh > lh + 1:
+        right._left = _join(left, node, right._left)
+        return _rebalance(right)
+    node._left, node._right = left, right
+    _update(node)
+    return node
+
+
+def _concat(left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+    """
+    Return the root of a tree of the keys of <left>, then those of <right>.
+    """
+    if right is None:
+        return left
+    right, smallest = _pop_min(right)
+    return _join(left, smallest, right)
+
+
+def _split(node: Optional[_Node],
+           key: Any) -> tuple[Optional[_Node], Optional[_Node]]:
+    """
+    Split the tree at <node> into the trees of its keys < <key> and of its
+    keys >= <key>, in O(log n).
+    """
+    if node is None:
+        return None, None
+    if node._key < key:
+        left, right = _split(node._right, key)
+        return _join(node._left, node, left), right
+    left, right = _split(node._left, key)
+    return left, _join(right, node, node._right)
+
+
+def _merge_items(a: list[tuple], b: list[tuple]) -> tuple[list, list]:
+    """
+    Merge 2 sorted lists of (key, value) pairs into a sorted list of keys
+    and a list of their values. A key in both gets its value from <b>.
+    """
+    keys, values = [], []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i][0] < b[j][0]:
+            pair = a[i]
+            i += 1
+        else:
+            if not b[j][0] < a[i][0]:
+                i += 1
+            pair = b[j]
+            j += 1
+        keys.append(pair[0])
+        values.append(pair[1])
+    for pair in chain(islice(a, i, None), islice(b, j, None)):
+        keys.append(pair[0])
+        values.append(pair[1])
+    return keys, values
 
 
 class BinaryTree():
     """
-    BinaryTree
-    
+    A sorted map (or set) of keys, kept in a self-balancing AVL tree. Keys
+    can be anything mutually comparable w/ <, e.g. numbers, strs, or tuples
+    like (chips, player). Using a BinaryTree as a set just means leaving
+    every value as None.
+
+    Each node also tracks the size of its subtree, so on top of insert,
+    delete and search, a BinaryTree answers order-statistics queries: the
+    rank of a key (how many keys are smaller) and the key at a given rank.
+    Every single-key operation is O(log n) worst case.
+
     Client Code
     -----------
-    >>> bst = BinaryTree()
-    >>> 
+    >>> chip_counts = BinaryTree({(1500, 'ann'): 'seat 1',
+    ...                           (3200, 'bob'): 'seat 4',
+    ...                           (800, 'cat'): 'seat 2'})
+    >>> chip_counts.insert((2750, 'dan'), 'seat 6')
+    >>> list(chip_counts)
+    [(800, 'cat'), (1500, 'ann'), (2750, 'dan'), (3200, 'bob')]
+    >>> chip_counts.select(-1)  # The chip leader
+    (3200, 'bob')
+    >>> chip_counts.rank((2750, 'dan'))  # How many players have fewer chips
+    2
+    >>> chip_counts.floor((2000, ''))  # The biggest stack up to 2000 chips
+    (1500, 'ann')
+    >>> chip_counts.delete((800, 'cat'))  # Busted
+    >>> chip_counts[(2750, 'dan')]
+    'seat 6'
+    >>> len(chip_counts)
+    3
+
+    Representation Invariants
+    -------------------------
+    - Every key in a node's left subtree is smaller than the node's key, and
+    every key in its right subtree is bigger.
+    - The heights of a node's 2 subtrees differ by at most 1.
     """
-    pass
+    _root: Optional[_Node]
+    # True if the nodes may be shared w/ other trees, so must not change
+    _shared: bool = False
+
+
+    def __init__(self, items: Union[None, Mapping, Iterable[Any]]=None) -> None:
+        """
+        Initialize BinaryTree w/ the key: value pairs of a mapping <items>,
+        or w/ each key of any other iterable <items> (values None).
+        """
+        self._root = None
+        if items is not None:
+            if isinstance(items, Mapping):
+                for key, value in items.items():
+                    self.insert(key, value)
+            else:
+                for key in items:
+                    self.insert(key)
+
+
+    def __str__(self) -> str:
+        """
+        Client Code
+        -----------
+        >>> print(BinaryTree({'b': 2, 'a': 1}))
+        {'a': 1, 'b': 2}
+        """
+        return '{' + ', '.join(f'{key!r}: {value!r}'
+                               for key, value in self.items()) + '}'
+
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+    def _find(self, key: Any) -> Optional[_Node]:
+        node = self._root
+        while node is not None:
+            if key < node._key:
+                node = node._left
+            elif node._key < key:
+                node = node._right
+            else:
+                return node
+        return None
+
+
+    def insert(self, key: Any, value: Optional[Any]=None) -> None:
+        """
+        Insert <key> w/ <value>. If <key> is already in this BinaryTree, its
+        value is replaced.
+        """
+        self._root = _insert(self._root, key, value)
+
+
+    def delete(self, key: Any) -> None:
+        """
+        Remove <key> and its value.
+
+        Exceptions
+        ----------
+        If <key> is not in this BinaryTree, KeyError is raised.
+        """
+        self._root = _delete(self._root, key)
+
+
+    def search(self, key: Any) -> Optional[Any]:
+        """
+        Return the value of <key>, or None if <key> is not in this
+        BinaryTree.
+        """
+        node = self._find(key)
+        return node._value if node is not None else None
+
+
+    def __getitem__(self, key: Any) -> Any:
+        node = self._find(key)
+        if node is None:
+            raise KeyError(key)
+        return node._value
+
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.insert(key, value)
+
+
+    def __delitem__(self, key: Any) -> None:
+        self.delete(key)
+
+
+    def __contains__(self, key: Any) -> bool:
+        return self._find(key) is not None
+
+
+    def floor(self, key: Any) -> Optional[Any]:
+        """
+        Return the biggest key <= <key>, or None if there is none.
+        """
+        node, best = self._root, None
+        while node is not None:
+            if key < node._key:
+                node = node._left
+            else:
+                best = node
+                if not node._key < key:
+                    break
+                node = node._right
+        return best._key if best is not None else None
+
+
+    def ceiling(self, key: Any) -> Optional[Any]:
+        """
+        Return the smallest key >= <key>, or None if there is none.
+
+        Client Code
+        -----------
+        >>> blinds = BinaryTree([25, 50, 100, 200])
+        >>> blinds.ceiling(60), blinds.ceiling(100), blinds.ceiling(201)
+        (100, 100, None)
+        """
+        node, best = self._root, None
+        while node is not None:
+            if node._key < key:
+                node = node._right
+            else:
+                best = node
+                if not key < node._key:
+                    break
+                node = node._left
+        return best._key if best is not None else None
+
+
+    def rank(self, key: Any) -> int:
+        """
+        Return the number of keys smaller than <key>. <key> need not be in
+        this BinaryTree.
+        """
+        node, smaller = self._root, 0
+        while node is not None:
+            if node._key < key:
+                smaller += _size(node._left) + 1
+                node = node._right
+            else:
+                node = node._left
+        return smaller
+
+
+    def select(self, i: int) -> Any:
+        """
+        Return the key w/ <i> smaller keys: select(0) is the smallest key.
+        Like list indexes, negative <i> count from the biggest key.
+
+        Exceptions
+        ----------
+        If there are not enough keys, IndexError is raised.
+        """
+        n = _size(self._root)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError('BinaryTree index out of range')
+        node = self._root
+        while True:
+            left = _size(node._left)
+            if i < left:
+                node = node._left
+            elif i > left:
+                i -= left + 1
+                node = node._right
+            else:
+                return node._key
+
+
+    def min(self) -> Optional[Any]:
+        """
+        Return the smallest key, or None if this BinaryTree is empty.
+        """
+        node = self._root
+        if node is None:
+            return None
+        while node._left is not None:
+            node = node._left
+        return node._key
+
+
+    def max(self) -> Optional[Any]:
+        """
+        Return the biggest key, or None if this BinaryTree is empty.
+        """
+        node = self._root
+        if node is None:
+            return None
+        while node._right is not None:
+            node = node._right
+        return node._key
+
+
+    def _nodes(self,
+               lo: Optional[Any]=None,
+               hi: Optional[Any]=None) -> Iterator[_Node]:
+        """
+        Yield the nodes w/ lo <= key < hi in key order, skipping the
+        subtrees outside the range. A None bound is no bound.
+        """
+        path = []
+        node = self._root
+        while True:
+            while node is not None:
+                if lo is not None and node._key < lo:
+                    node = node._right
+                else:
+                    path.append(node)
+                    node = node._left
+            if not path:
+                return
+            node = path.pop()
+            if hi is not None and not node._key < hi:
+                return
+            yield node
+            node = node._right
+
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterate over the keys, smallest first.
+        """
+        return (node._key for node in self._nodes())
+
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        """
+        Iterate over the (key, value) pairs, smallest key first.
+        """
+        return ((node._key, node._value) for node in self._nodes())
+
+
+    def irange(self,
+               lo: Optional[Any]=None,
+               hi: Optional[Any]=None) -> Iterator[Any]:
+        """
+        Iterate over the keys k w/ <lo> <= k < <hi>, smallest first. A None
+        bound is no bound. Takes O(log n) to find the first key.
+
+        Client Code
+        -----------
+        >>> stacks = BinaryTree([300, 1200, 450, 5000, 980])
+        >>> list(stacks.irange(400, 1000))
+        [450, 980]
+        """
+        return (node._key for node in self._nodes(lo, hi))
+
+
+    @classmethod
+    def from_sorted(cls,
+                    keys: Iterable[Any],
+                    values: Optional[Iterable[Any]]=None) -> BinaryTree:
+        """
+        Return a BinaryTree of <keys>, which must be strictly increasing,
+        w/ their <values> (or None), in O(n): no comparisons but the check
+        of the order, and no rebalancing.
+
+        Client Code
+        -----------
+        >>> leaderboard = BinaryTree.from_sorted(range(0, 10_000, 100))
+        >>> len(leaderboard), leaderboard.select(42)
+        (100, 4200)
+
+        Exceptions
+        ----------
+        If <keys> are not strictly increasing, ValueError is raised.
+        """
+        keys = keys if isinstance(keys, list) else list(keys)
+        if values is not None:
+            values = values if isinstance(values, list) else list(values)
+            if len(values) != len(keys):
+                raise ValueError('keys and values differ in length.')
+        if not all(a < b for a, b in zip(keys, islice(keys, 1, None))):
+            raise ValueError('keys are not strictly increasing.')
+        tree = cls()
+        tree._root = _build(keys, values, 0, len(keys))
+        return tree
+
+
+    def split(self, key: Any) -> tuple[BinaryTree, BinaryTree]:
+        """
+        Move the keys of this BinaryTree into 2 new ones: those < <key> and
+        those >= <key>. This BinaryTree is left empty. O(log n).
+
+        Client Code
+        -----------
+        >>> short, deep = BinaryTree([5, 40, 12, 100, 25]).split(20)
+        >>> list(short), list(deep)
+        ([5, 12], [25, 40, 100])
+        """
+        left, right = type(self)(), type(self)()
+        left._root, right._root = _split(self._root, key)
+        self._root = None
+        return left, right
+
+
+    def merge(self, other: BinaryTree) -> None:
+        """
+        Move every key of <other> into this BinaryTree, replacing the values
+        of keys in both. <other> is left empty, unless it is a
+        PersistentTree, whose keys are copied instead.
+
+        If all keys of one tree are smaller than all those of the other, it
+        takes O(log n); else O(n), n being the combined size.
+        """
+        if other is self:
+            return
+        root = other._root
+        if other._shared:
+            pairs = list(other.items())
+            root = _build([pair[0] for pair in pairs],
+                          [pair[1] for pair in pairs], 0, len(pairs))
+        if self._root is None or root is None:
+            self._root = self._root or root
+        elif self.max() < other.min():
+            self._root = _concat(self._root, root)
+        elif other.max() < self.min():
+            self._root = _concat(root, self._root)
+        else:
+            keys, values = _merge_items(list(self.items()), list(other.items()))
+            self._root = _build(keys, values, 0, len(keys))
+        if not other._shared:
+            other._root = None
+
+
+    def union(self, other: BinaryTree) -> BinaryTree:
+        """
+        Return a new BinaryTree of the keys in this BinaryTree or <other>,
+        w/ the values of <other> for keys in both, in O(n), n being the
+        combined size.
+
+        Client Code
+        -----------
+        >>> table_1 = BinaryTree({'ann': 1500, 'bob': 3200})
+        >>> table_2 = BinaryTree({'bob': 2900, 'cat': 800})
+        >>> table_1.union(table_2)
+        {'ann': 1500, 'bob': 2900, 'cat': 800}
+        """
+        keys, values = _merge_items(list(self.items()), list(other.items()))
+        tree = type(self)()
+        tree._root = _build(keys, values, 0, len(keys))
+        return tree
+
+
+    def is_empty(self) -> bool:
+        return self._root is None
+
+
+    def size(self) -> int:
+        return _size(self._root)
+
+
+    def __len__(self) -> int:
+        return _size(self._root)
+
+
+class BlockTree():
+    """
+    A sorted map (or set) w/ the same API as BinaryTree, laid out as a list
+    of sorted blocks instead of a node per key: a B-tree of height 2, in
+    effect. Each block is a Python list (or, w/ <typecode>, a typed array)
+    of up to 2 * <load> keys, and the biggest key of each block is kept in
+    one more list, so finding a key is 2 bisects.
+
+    Compared to BinaryTree, it stores a key in 8 bytes instead of a node
+    object of ~100 bytes (or the key's raw bytes, w/ <typecode>), and range
+    iteration reads consecutive slots of a few blocks. Inserting and
+    deleting shift up to 2 * <load> slots of a block, which is a fast
+    memmove for the default <load> of 1000.
+
+    Values are only stored once some key gets a non-None value, so a
+    BlockTree used as a set holds nothing but its keys.
+
+    Client Code
+    -----------
+    >>> stacks = BlockTree([2200, 640, 1500, 980], typecode='q', load=2)
+    >>> stacks.insert(3100)
+    >>> stacks.delete(640)
+    >>> list(stacks), stacks.select(-1), stacks.rank(1500)
+    ([980, 1500, 2200, 3100], 3100, 1)
+    >>> stacks.floor(2000), stacks.ceiling(2000)
+    (1500, 2200)
+    >>> list(stacks.irange(1000, 3000))
+    [1500, 2200]
+    >>> seats = BlockTree({'ann': 1, 'bob': 4})
+    >>> seats['cat'] = 2
+    >>> seats
+    {'ann': 1, 'bob': 4, 'cat': 2}
+
+    Representation Invariants
+    -------------------------
+    - Every block is sorted, non-empty, and holds keys smaller than those of
+    the next block.
+    - _maxes[i] is the last key of block i.
+    """
+    _keys: list
+    _values: Optional[list[list]]
+    _maxes: list
+    _len: int
+    _load: int
+    _typecode: Optional[str]
+    # Index of the first key of each block, rebuilt after keys are added or
+    # removed, once rank() or select() needs it
+    _offsets: Optional[list[int]]
+
+
+    def __init__(self,
+                 items: Union[None, Mapping, Iterable[Any]]=None,
+                 typecode: Optional[str]=None,
+                 load: int=1000) -> None:
+        """
+        Initialize BlockTree. Refer to BinaryTree for <items>; they are
+        sorted once, not inserted one by one. <typecode> is an array
+        typecode (e.g. 'q' or 'd') to store numeric keys in, unboxed, or
+        None to store keys in lists.
+        """
+        self._typecode = typecode
+        self._load = load
+        self._keys, self._values, self._maxes = [], None, []
+        self._len = 0
+        self._offsets = None
+        if items is None:
+            return
+        if isinstance(items, Mapping):
+            pairs = sorted(items.items(), key=lambda pair: pair[0])
+            keys = [key for key, _ in pairs]
+            values = [value for _, value in pairs]
+        else:
+            keys = sorted(items)
+            # Drop repeated keys
+            keys = [key for i, key in enumerate(keys)
+                    if i == 0 or keys[i - 1] < key]
+            values = None
+        self._len = len(keys)
+        for start in range(0, len(keys), load):
+            self._keys.append(self._new_block(keys[start:start + load]))
+            self._maxes.append(keys[min(start + load, len(keys)) - 1])
+        if values is not None and any(value is not None for value in values):
+            self._values = [values[start:start + load]
+                            for start in range(0, len(values), load)]
+
+
+    def _new_block(self, keys: list) -> Union[list, array]:
+        if self._typecode is None:
+            return keys
+        return array(self._typecode, keys)
+
+
+    def __str__(self) -> str:
+        return '{' + ', '.join(f'{key!r}: {value!r}'
+                               for key, value in self.items()) + '}'
+
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+    def _find(self, key: Any) -> tuple[int, int]:
+        """
+        Return (block, slot) of <key>, or (-1, -1) if <key> is not in this
+        BlockTree.
+        """
+        i = bisect_left(self._maxes, key)
+        if i < len(self._maxes):
+            block = self._keys[i]
+            j = bisect_left(block, key)
+            if not key < block[j]:
+                return i, j
+        return -1, -1
+
+
+    def insert(self, key: Any, value: Optional[Any]=None) -> None:
+        """
+        Insert <key> w/ <value>. If <key> is already in this BlockTree, its
+        value is replaced.
+        """
+        if value is not None and self._values is None:
+            self._values = [[None] * len(block) for block in self._keys]
+        keys, maxes, values = self._keys, self._maxes, self._values
+        if not maxes:
+            keys.append(self._new_block([key]))
+            maxes.append(key)
+            if values is not None:
+                values.append([value])
+            self._len = 1
+            self._offsets = None
+            return
+        i = bisect_left(maxes, key)
+        if i == len(maxes):
+            # Bigger than every key: goes at the end of the last block
+            i -= 1
+            j = len(keys[i])
+            maxes[i] = key
+        else:
+            j = bisect_left(keys[i], key)
+            if not key < keys[i][j]:
+                if values is not None:
+                    values[i][j] = value
+                return
+        keys[i].insert(j, key)
+        if values is not None:
+            values[i].insert(j, value)
+        self._len += 1
+        self._offsets = None
+        if len(keys[i]) > 2 * self._load:
+            self._split(i)
+
+
+    def _split(self, i: int) -> None:
+        """
+        Split block <i> in half.
+        """
+        block, half = self._keys[i], len(self._keys[i]) // 2
+        self._keys.insert(i + 1, block[half:])
+        del block[half:]
+        self._maxes.insert(i, block[-1])
+        if self._values is not None:
+            values = self._values[i]
+            self._values.insert(i + 1, values[half:])
+            del values[half:]
+
+
+    def _merge(self, i: int) -> None:
+        """
+        Merge block <i> w/ block <i> + 1, then split it again if it got too
+        big.
+        """
+        self._keys[i].extend(self._keys.pop(i + 1))
+        self._maxes[i] = self._maxes.pop(i + 1)
+        if self._values is not None:
+            self._values[i].extend(self._values.pop(i + 1))
+        if len(self._keys[i]) > 2 * self._load:
+            self._split(i)
+
+
+    def delete(self, key: Any) -> None:
+        """
+        Remove <key> and its value.
+
+        Exceptions
+        ----------
+        If <key> is not in this BlockTree, KeyError is raised.
+        """
+        i, j = self._find(key)
+        if i < 0:
+            raise KeyError(key)
+        block = self._keys[i]
+        del block[j]
+        if self._values is not None:
+            del self._values[i][j]
+        self._len -= 1
+        self._offsets = None
+        if not block:
+            del self._keys[i], self._maxes[i]
+            if self._values is not None:
+                del self._values[i]
+            return
+        self._maxes[i] = block[-1]
+        if len(block) < self._load // 2 and len(self._keys) > 1:
+            self._merge(i if i + 1 < len(self._keys) else i - 1)
+
+
+    def search(self, key: Any) -> Optional[Any]:
+        """
+        Return the value of <key>, or None if <key> is not in this
+        BlockTree.
+        """
+        i, j = self._find(key)
+        if i < 0 or self._values is None:
+            return None
+        return self._values[i][j]
+
+
+    def __getitem__(self, key: Any) -> Any:
+        i, j = self._find(key)
+        if i < 0:
+            raise KeyError(key)
+        return self._values[i][j] if self._values is not None else None
+
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.insert(key, value)
+
+
+    def __delitem__(self, key: Any) -> None:
+        self.delete(key)
+
+
+    def __contains__(self, key: Any) -> bool:
+        return self._find(key)[0] >= 0
+
+
+    def floor(self, key: Any) -> Optional[Any]:
+        """
+        Return the biggest key <= <key>, or None if there is none.
+        """
+        i = bisect_left(self._maxes, key)
+        if i < len(self._maxes):
+            block = self._keys[i]
+            j = bisect_right(block, key)
+            if j:
+                return block[j - 1]
+        return self._maxes[i - 1] if i else None
+
+
+    def ceiling(self, key: Any) -> Optional[Any]:
+        """
+        Return the smallest key >= <key>, or None if there is none.
+        """
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return None
+        block = self._keys[i]
+        return block[bisect_left(block, key)]
+
+
+    def _block_offsets(self) -> list[int]:
+        if self._offsets is None:
+            self._offsets = list(accumulate(
+                (len(block) for block in self._keys[:-1]), initial=0))
+        return self._offsets
+
+
+    def rank(self, key: Any) -> int:
+        """
+        Return the number of keys smaller than <key>. <key> need not be in
+        this BlockTree.
+        """
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return self._len
+        return self._block_offsets()[i] + bisect_left(self._keys[i], key)
+
+
+    def select(self, i: int) -> Any:
+        """
+        Return the key w/ <i> smaller keys. Refer to BinaryTree.select().
+        """
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError('BlockTree index out of range')
+        offsets = self._block_offsets()
+        k = bisect_right(offsets, i) - 1
+        return self._keys[k][i - offsets[k]]
+
+
+    def min(self) -> Optional[Any]:
+        return self._keys[0][0] if self._keys else None
+
+
+    def max(self) -> Optional[Any]:
+        return self._maxes[-1] if self._maxes else None
+
+
+    def _slices(self,
+                lo: Optional[Any],
+                hi: Optional[Any],
+                blocks: list) -> Iterator[Any]:
+        """
+        Yield the slices of <blocks> (_keys or _values) that hold the keys
+        k w/ <lo> <= k < <hi>, in order. A None bound is no bound.
+        """
+        keys, maxes = self._keys, self._maxes
+        i, j = 0, 0
+        if lo is not None:
+            i = bisect_left(maxes, lo)
+            if i < len(maxes):
+                j = bisect_left(keys[i], lo)
+        end_i, end_j = len(maxes) - 1, None
+        if hi is not None:
+            end_i = bisect_left(maxes, hi)
+            if end_i == len(maxes):
+                end_i -= 1
+            else:
+                end_j = bisect_left(keys[end_i], hi)
+        for k in range(i, end_i + 1):
+            start = j if k == i else 0
+            stop = end_j if k == end_i else None
+            yield blocks[k][start:stop]
+
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterate over the keys, smallest first.
+        """
+        return chain.from_iterable(self._keys)
+
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        """
+        Iterate over the (key, value) pairs, smallest key first.
+        """
+        if self._values is None:
+            return ((key, None) for key in self)
+        return zip(self, chain.from_iterable(self._values))
+
+
+    def irange(self,
+               lo: Optional[Any]=None,
+               hi: Optional[Any]=None) -> Iterator[Any]:
+        """
+        Iterate over the keys k w/ <lo> <= k < <hi>, smallest first. A None
+        bound is no bound. The keys are read a block slice at a time.
+        """
+        return chain.from_iterable(self._slices(lo, hi, self._keys))
+
+
+    def is_empty(self) -> bool:
+        return not self._len
+
+
+    def size(self) -> int:
+        return self._len
+
+
+    def __len__(self) -> int:
+        return self._len
 
 
 if __name__ == '__main__':
@@ -1,5 +1,29 @@
 from __future__ import annotations
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Iterator, Optional, Sequence, Union
+from array import array
+from numbers import Real
+from operator import add, sub
+import math
+
+
+def _compose(name: Union[None, str, tuple]) -> Optional[str]:
+    """
+    Return the name that <name> stands for. A tuple (left, sign, right) is
+    the name of a Coord derived from 2 others, e.g. '[a+b]', composed only
+    when asked for. Names nest, so they are composed w/o recursion.
+    """
+    if not isinstance(name, tuple):
+        return name
+    parts = []
+    todo = [name]
+    while todo:
+        part = todo.pop()
+        if isinstance(part, tuple):
+            left, sign, right = part
+            todo.extend((']', right, sign, left, '['))
+        else:
+            parts.append(str(part))
+    return ''.join(parts)
 
 
 class Coord:
@@ -12,9 +36,15 @@ class Coord:
         The x-coordinate of the point.
     y : int, float
         The y-coordinate of the point.
-    
+
+    Coords are slotted: no per-instance dict. The name of a Coord made by
+    + or - is only composed when the Coord is printed, and +=, -= and *=
+    move a Coord in place, so hot loops can update positions w/o making a
+    new object per step.
     """
-    _name: Optional[str]
+    __slots__ = ('x', 'y', '_name')
+    # A str, None, or a (left, sign, right) tuple; refer to _compose()
+    _name: Union[None, str, tuple]
     x: Union[int, float]
     y: Union[int, float]
 
@@ -59,9 +89,12 @@ class Coord:
         >>> print(p2)
         Coord: (75, 300)  <--  test
         """
-        if self._name is None:
+        name = self._name
+        if isinstance(name, tuple):
+            name = self._name = _compose(name)
+        if name is None:
             return f'Coord: ({self.x}, {self.y})'
-        return f'Coord: ({self.x}, {self.y})  <--  {self._name}'
+        return f'Coord: ({self.x}, {self.y})  <--  {name}'
     
 
     def __len__(self) -> int:
@@ -84,7 +117,8 @@ class Coord:
 
     def __eq__(self, other: Coord) -> bool:
         """
-        Return True if the coordinates are equal, False otherwise.
+        Return True if the coordinates are equal, False otherwise. Only
+        Coords are compared; other objects are never equal to a Coord.
         
         Parameters
         ----------
@@ -105,7 +139,11 @@ class Coord:
         True
         >>> p1 == p3
         False
+        >>> p1 == (1, 2)
+        False
         """
+        if not isinstance(other, Coord):
+            return NotImplemented
         return (self.x == other.x) and (self.y == other.y)
 
 
@@ -133,6 +171,8 @@ class Coord:
         >>> p1 != p3
         True
         """
+        if not isinstance(other, Coord):
+            return NotImplemented
         return (self.x != other.x) or (self.y != other.y)
 
 
@@ -166,15 +206,8 @@ class Coord:
         # TODO: FINISH WRITING DOCTESTS
 
         """
-        sum_x, sum_y = self.x + other.x, self.y + other.y
-        new = f'[{self._name}+{other._name}]' if name is None else name
-        return Coord(sum_x, sum_y, new)
-        # sum_x = self.x + other.x
-        # sum_y = self.y + other.y
-        # if name is None:
-        #     new_name = f'[{self._name}+{other._name}]'
-        #     return Coord(sum_x, sum_y, new_name)
-        # return Coord(sum_x, sum_y, name)
+        new = (self._name, '+', other._name) if name is None else name
+        return Coord(self.x + other.x, self.y + other.y, new)
 
 
     def __sub__(self, other: Coord, name: Optional[str]=None) -> 'Coord':
@@ -201,9 +234,98 @@ class Coord:
 
         # TODO: FINISH WRITING DOCTESTS
         """
-        new_x, new_y = self.x - other.x, self.y - other.y
-        new = f'[{self._name}-{other._name}]' if name is None else name
-        return Coord(new_x, new_y, new)
+        new = (self._name, '-', other._name) if name is None else name
+        return Coord(self.x - other.x, self.y - other.y, new)
+
+
+    def __iadd__(self, other: Coord) -> Coord:
+        """
+        Add <other> to this Coord, in place. Its name does not change.
+
+        Examples
+        --------
+        >>> p1 = Coord(1, 2, 'button')
+        >>> before = p1
+        >>> p1 += Coord(3, 4)
+        >>> p1, p1 is before
+        (Coord: (4, 6)  <--  button, True)
+        """
+        self.x += other.x
+        self.y += other.y
+        return self
+
+
+    def __isub__(self, other: Coord) -> Coord:
+        """
+        Subtract <other> from this Coord, in place. Its name does not
+        change.
+        """
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
+
+    def __mul__(self, factor: Union[int, float]) -> Coord:
+        """
+        Return a new Coord object w/ the coordinates scaled by <factor>.
+
+        Examples
+        --------
+        >>> Coord(1, 2) * 3
+        Coord: (3, 6)  <--  [None*3]
+        >>> 0.5 * Coord(4, 4, 'pot')
+        Coord: (2.0, 2.0)  <--  [pot*0.5]
+        >>> Coord(1, 2) * Coord(3, 4)
+        Traceback (most recent call last):
+        ...
+        TypeError: unsupported operand type(s) for *: 'Coord' and 'Coord'
+        """
+        if not isinstance(factor, Real):
+            return NotImplemented
+        return Coord(self.x * factor, self.y * factor,
+                     (self._name, '*', factor))
+
+
+    def __rmul__(self, factor: Union[int, float]) -> Coord:
+        return self.__mul__(factor)
+
+
+    def __imul__(self, factor: Union[int, float]) -> Coord:
+        """
+        Scale this Coord by <factor>, in place. Its name does not change.
+        """
+        if not isinstance(factor, Real):
+            return NotImplemented
+        self.x *= factor
+        self.y *= factor
+        return self
+
+
+    def __hash__(self) -> int:
+        """
+        Return the hash of the coordinates, consistent w/ ==. Do not change
+        a Coord while it is in a set or a dict key.
+
+        Examples
+        --------
+        >>> len({Coord(1, 2), Coord(1, 2, 'same spot'), Coord(2, 1)})
+        2
+        >>> (1, 2) in {Coord(1, 2)}
+        False
+        """
+        return hash((self.x, self.y))
+
+
+    def astuple(self) -> tuple[Union[int, float], Union[int, float]]:
+        """
+        Return the coordinates as an (x, y) tuple.
+
+        Examples
+        --------
+        >>> Coord(5, 7).astuple()
+        (5, 7)
+        """
+        return (self.x, self.y)
 
 
     def __getitem__(self, key: int) -> Union[int, float]:
@@ -228,9 +350,11 @@ class Coord:
         >>> p1[1]
         2
         """
-        if key not in [0, 1]:
-            raise IndexError('You must index 0 or 1, for x and y, respectively.')
-        return self.y if key else self.x
+        if key == 0:
+            return self.x
+        if key == 1:
+            return self.y
+        raise IndexError('You must index 0 or 1, for x and y, respectively.')
 
 
     def __setitem__(self, key: int, value: Union[int, float]) -> None:
@@ -254,14 +378,297 @@ class Coord:
         >>> p1
         Coord: (3, 4)
         """
-        if key not in [0, 1]:
-            raise IndexError('You must index 0 or 1, for x and y, respectively.')
-        if key:
+        if key == 0:
+            self.x = value
+        elif key == 1:
             self.y = value
         else:
-            self.x = value
+            raise IndexError('You must index 0 or 1, for x and y, respectively.')
         
 
+def _import_numpy() -> Any:
+    # NumPy is an optional extra, so it is only imported when asked for.
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("CoordArray(use_numpy=True) requires NumPy: "
+                          "pip install 'pietoolz[numpy]'") from None
+    return np
+
+
+class CoordArray:
+    """
+    A batch of 2D points, stored as 2 contiguous float64 buffers (one of x's,
+    one of y's) instead of a Coord object per point.
+
+    Arithmetic works on the whole batch at once: w/ another CoordArray of
+    the same length (point by point), or w/ a single Coord or (x, y) pair
+    (every point). The loops run in C: over array('d') buffers by default,
+    or as NumPy operations if <use_numpy> is True.
+
+    Indexing gives and takes Coords, so a CoordArray can stand in for a list
+    of Coords.
+
+    Attributes
+    ----------
+    xs : array('d') or numpy.ndarray
+        The x-coordinates of the points.
+    ys : array('d') or numpy.ndarray
+        The y-coordinates of the points.
+
+    Examples
+    --------
+    >>> chips = CoordArray([Coord(0, 0), Coord(3, 4), (6, 8)])
+    >>> moved = chips + Coord(1, 1)
+    >>> moved
+    CoordArray: [(1.0, 1.0), (4.0, 5.0), (7.0, 9.0)]
+    >>> moved[1]
+    Coord: (4.0, 5.0)
+    >>> list(chips.distance(Coord(0, 0)))
+    [0.0, 5.0, 10.0]
+    >>> chips[0] = Coord(-1, 2)
+    >>> chips.scale(2)
+    CoordArray: [(-2.0, 4.0), (6.0, 8.0), (12.0, 16.0)]
+    """
+    xs: Union[array, Any]
+    ys: Union[array, Any]
+    _np: Any
+
+
+    def __init__(self,
+                 points: Optional[Iterable[Union[Coord, Sequence[float]]]]=None,
+                 use_numpy: bool=False) -> None:
+        """
+        Initialize the CoordArray.
+
+        Parameters
+        ----------
+        points : iterable of Coord or (x, y) pairs, optional
+            The points, in order. None means no points.
+        use_numpy : bool
+            If True, store the points in NumPy arrays, and use NumPy for
+            arithmetic.
+        """
+        points = list(points) if points is not None else []
+        self._np = _import_numpy() if use_numpy else None
+        self.xs = self._buffer([p[0] for p in points])
+        self.ys = self._buffer([p[1] for p in points])
+
+
+    @classmethod
+    def from_xy(cls,
+                xs: Iterable[float],
+                ys: Iterable[float],
+                use_numpy: bool=False) -> CoordArray:
+        """
+        Return a CoordArray of the points (xs[i], ys[i]).
+
+        Examples
+        --------
+        >>> CoordArray.from_xy([1, 2], [3, 4])
+        CoordArray: [(1.0, 3.0), (2.0, 4.0)]
+        """
+        points = cls(use_numpy=use_numpy)
+        points.xs = points._buffer(xs, copy=True)
+        points.ys = points._buffer(ys, copy=True)
+        if len(points.xs) != len(points.ys):
+            raise ValueError('xs and ys must have the same length.')
+        return points
+
+
+    def _buffer(self,
+                values: Iterable[float],
+                copy: bool=False) -> Union[array, Any]:
+        """
+        Return <values> as a float64 buffer of this CoordArray's kind. A
+        NumPy array of float64s is only copied if <copy>.
+        """
+        np = self._np
+        if np is None:
+            return array('d', values)
+        if isinstance(values, Iterator):
+            return np.fromiter(values, dtype=np.float64)
+        return np.array(values, dtype=np.float64, copy=True if copy else None)
+
+
+    def _new(self,
+             xs: Iterable[float],
+             ys: Iterable[float],
+             copy: bool=False) -> CoordArray:
+        points = CoordArray.__new__(CoordArray)
+        points._np = self._np
+        points.xs, points.ys = self._buffer(xs, copy), self._buffer(ys, copy)
+        return points
+
+
+    def __repr__(self) -> str:
+        points = ', '.join(f'({float(x)}, {float(y)})'
+                           for x, y in zip(self.xs, self.ys))
+        return f'CoordArray: [{points}]'
+
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Coord, CoordArray]:
+        """
+        Return the point at index <key> as a Coord, or the points in slice
+        <key> as a CoordArray.
+        """
+        if isinstance(key, slice):
+            return self._new(self.xs[key], self.ys[key], copy=True)
+        return Coord(float(self.xs[key]), float(self.ys[key]))
+
+
+    def __setitem__(self, key: int, value: Union[Coord, Sequence[float]]) -> None:
+        """
+        Set the point at index <key> to <value>, a Coord or (x, y) pair.
+        """
+        self.xs[key], self.ys[key] = value[0], value[1]
+
+
+    def __iter__(self) -> Iterator[Coord]:
+        """
+        Iterate over the points as Coords.
+        """
+        for x, y in zip(self.xs, self.ys):
+            yield Coord(float(x), float(y))
+
+
+    def _operands(self, other: Union[CoordArray, Coord, Sequence[float]]
+                  ) -> tuple[Any, Any, bool]:
+        """
+        Return the x's and y's of <other>, and whether <other> is a single
+        point.
+        """
+        if isinstance(other, CoordArray):
+            if len(other) != len(self):
+                raise ValueError('CoordArrays must have the same length.')
+            return other.xs, other.ys, False
+        return float(other[0]), float(other[1]), True
+
+
+    def _apply(self, op, other) -> tuple[Any, Any]:
+        """
+        Return the x's and y's of op(this CoordArray, <other>).
+        """
+        ox, oy, single = self._operands(other)
+        if self._np is not None:
+            return op(self.xs, ox), op(self.ys, oy)
+        if single:
+            # float.__add__ bound to the operand: a C call per point
+            if op is sub:
+                op, ox, oy = add, -ox, -oy
+            return map(ox.__add__, self.xs), map(oy.__add__, self.ys)
+        return map(op, self.xs, ox), map(op, self.ys, oy)
+
+
+    def __add__(self, other: Union[CoordArray, Coord, Sequence[float]]
+                ) -> CoordArray:
+        """
+        Return a new CoordArray of the points plus <other>. Refer to class
+        docstring for what <other> can be.
+        """
+        return self._new(*self._apply(add, other))
+
+
+    def __sub__(self, other: Union[CoordArray, Coord, Sequence[float]]
+                ) -> CoordArray:
+        """
+        Return a new CoordArray of the points minus <other>.
+
+        Examples
+        --------
+        >>> a = CoordArray([(5, 5), (2, 0)])
+        >>> a - a
+        CoordArray: [(0.0, 0.0), (0.0, 0.0)]
+        """
+        return self._new(*self._apply(sub, other))
+
+
+    def __iadd__(self, other: Union[CoordArray, Coord, Sequence[float]]
+                 ) -> CoordArray:
+        """
+        Add <other> to the points, in place.
+
+        Examples
+        --------
+        >>> a = CoordArray([(1, 1)], use_numpy=True)
+        >>> a += (0.5, -1)
+        >>> a
+        CoordArray: [(1.5, 0.0)]
+        """
+        if self._np is not None:
+            ox, oy, _ = self._operands(other)
+            self.xs += ox
+            self.ys += oy
+        else:
+            xs, ys = self._apply(add, other)
+            self.xs[:], self.ys[:] = array('d', xs), array('d', ys)
+        return self
+
+
+    def __isub__(self, other: Union[CoordArray, Coord, Sequence[float]]
+                 ) -> CoordArray:
+        """
+        Subtract <other> from the points, in place.
+        """
+        if self._np is not None:
+            ox, oy, _ = self._operands(other)
+            self.xs -= ox
+            self.ys -= oy
+        else:
+            xs, ys = self._apply(sub, other)
+            self.xs[:], self.ys[:] = array('d', xs), array('d', ys)
+        return self
+
+
+    def scale(self, factor: float) -> CoordArray:
+        """
+        Return a new CoordArray of the points scaled by <factor>, about the
+        origin.
+        """
+        if self._np is not None:
+            return self._new(self.xs * factor, self.ys * factor)
+        mul = float(factor).__mul__
+        return self._new(map(mul, self.xs), map(mul, self.ys))
+
+
+    def __mul__(self, factor: float) -> CoordArray:
+        return self.scale(factor)
+
+
+    def __rmul__(self, factor: float) -> CoordArray:
+        return self.scale(factor)
+
+
+    def distance(self, other: Union[CoordArray, Coord, Sequence[float]]
+                 ) -> Union[array, Any]:
+        """
+        Return the Euclidean distance from each point to <other> (a single
+        point, or the point at the same index of a CoordArray), as a float64
+        buffer.
+
+        Examples
+        --------
+        >>> a = CoordArray([(0, 0), (1, 1)])
+        >>> list(a.distance(CoordArray([(3, 4), (1, 1)])))
+        [5.0, 0.0]
+        """
+        if self._np is not None:
+            ox, oy, _ = self._operands(other)
+            return self._np.hypot(self.xs - ox, self.ys - oy)
+        return array('d', map(math.hypot, *self._apply(sub, other)))
+
+
+    def to_coords(self) -> list[Coord]:
+        """
+        Return the points as a list of Coords.
+        """
+        return list(self)
+
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
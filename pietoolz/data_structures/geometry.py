@@ -0,0 +1,280 @@
+"""
+Geometry kernels over whole sets of 2D points: distances, affine
+transforms, convex hulls and polygon areas.
+
+Points can be given as a CoordArray, or as a sequence of Coords or (x, y)
+pairs, which is read into a CoordArray once. The work then runs over its
+float64 columns: as C-level map() loops over array('d'), or as NumPy
+operations for a CoordArray made w/ use_numpy=True. Results that are
+points come back as a CoordArray of the same kind.
+"""
+from __future__ import annotations
+from typing import Any, Optional, Sequence, Union
+from array import array
+from itertools import chain, islice
+from numbers import Real
+from operator import add, attrgetter, itemgetter, mul
+import math
+
+from pietoolz.data_structures.coord import Coord, CoordArray
+
+
+Point = Union[Coord, Sequence[float]]
+Points = Union[CoordArray, Sequence[Point]]
+
+
+def as_coord_array(points: Points) -> CoordArray:
+    """
+    Return <points> as a CoordArray: <points> itself if it is one.
+
+    Examples
+    --------
+    >>> as_coord_array([Coord(1, 2), Coord(3, 4)])
+    CoordArray: [(1.0, 2.0), (3.0, 4.0)]
+    >>> as_coord_array([Coord(1, 2), (3, 4)])
+    CoordArray: [(1.0, 2.0), (3.0, 4.0)]
+    """
+    if isinstance(points, CoordArray):
+        return points
+    points = list(points)
+    # One C-level pass per column; Coords are read by attribute, the
+    # fastest way to get at them, unless mixed w/ pairs, which Coords can
+    # stand in for
+    if points and all(isinstance(point, Coord) for point in points):
+        get_x, get_y = attrgetter('x'), attrgetter('y')
+    else:
+        get_x, get_y = itemgetter(0), itemgetter(1)
+    return CoordArray.from_xy(map(get_x, points), map(get_y, points))
+
+
+def distances_to(points: Points, point: Point) -> Union[array, Any]:
+    """
+    Return the distance from each of <points> to <point>, as a float64
+    buffer.
+
+    Examples
+    --------
+    >>> list(distances_to([(3, 4), (0, 1)], Coord(0, 0)))
+    [5.0, 1.0]
+    """
+    return as_coord_array(points).distance(point)
+
+
+def distance_matrix(points: Points,
+                    others: Optional[Points]=None) -> Union[list[array], Any]:
+    """
+    Return the distance from each of <points> to each of <others> (to each
+    other, if <others> is None): a list of array('d') rows, or a 2D NumPy
+    array if <points> is NumPy-backed. Row i holds the distances from
+    point i.
+
+    Examples
+    --------
+    >>> [list(row) for row in distance_matrix([(0, 0), (3, 4)])]
+    [[0.0, 5.0], [5.0, 0.0]]
+    """
+    points = as_coord_array(points)
+    others = points if others is None else as_coord_array(others)
+    np = points._np
+    if np is not None:
+        ox, oy = np.asarray(others.xs), np.asarray(others.ys)
+        return np.hypot(points.xs[:, None] - ox[None, :],
+                        points.ys[:, None] - oy[None, :])
+    # One C-level pass per row
+    return [others.distance((x, y)) for x, y in zip(points.xs, points.ys)]
+
+
+class Affine:
+    """
+    An affine transform of the plane:
+        x' = a*x + b*y + c
+        y' = d*x + e*y + f
+
+    Build one from rotation(), scaling() and translation(), and chain them
+    w/ @: (t2 @ t1) applies t1, then t2. However many are chained, applying
+    the result to a point set is one pass over it.
+
+    Examples
+    --------
+    >>> quarter_turn = Affine.rotation(math.pi / 2)
+    >>> layout = Affine.translation(10, 0) @ Affine.scaling(2) @ quarter_turn
+    >>> moved = layout.apply([(1, 0), (0, 1)])
+    >>> [round(x, 9) for x in moved.xs], [round(y, 9) for y in moved.ys]
+    ([10.0, 8.0], [2.0, 0.0])
+    >>> moved = layout.apply(Coord(1, 0))
+    >>> round(moved.x, 9), round(moved.y, 9)
+    (10.0, 2.0)
+    >>> Affine.translation(1, 2).apply((3, 4))
+    (4.0, 6.0)
+    """
+    __slots__ = ('a', 'b', 'c', 'd', 'e', 'f')
+    a: float
+    b: float
+    c: float
+    d: float
+    e: float
+    f: float
+
+
+    def __init__(self,
+                 a: float=1.0, b: float=0.0, c: float=0.0,
+                 d: float=0.0, e: float=1.0, f: float=0.0) -> None:
+        """
+        Initialize the Affine w/ its coefficients. The defaults are the
+        identity.
+        """
+        self.a, self.b, self.c = float(a), float(b), float(c)
+        self.d, self.e, self.f = float(d), float(e), float(f)
+
+
+    def __repr__(self) -> str:
+        return (f'Affine({self.a}, {self.b}, {self.c}, '
+                f'{self.d}, {self.e}, {self.f})')
+
+
+    @classmethod
+    def translation(cls, dx: float, dy: float) -> Affine:
+        return cls(1, 0, dx, 0, 1, dy)
+
+
+    @classmethod
+    def scaling(cls,
+                sx: float,
+                sy: Optional[float]=None,
+                origin: Point=(0, 0)) -> Affine:
+        """
+        Return the Affine that scales by <sx> along x and <sy> along y (<sx>
+        if None), about <origin>.
+        """
+        sy = sx if sy is None else sy
+        ox, oy = origin[0], origin[1]
+        return cls(sx, 0, ox - sx * ox, 0, sy, oy - sy * oy)
+
+
+    @classmethod
+    def rotation(cls, angle: float, origin: Point=(0, 0)) -> Affine:
+        """
+        Return the Affine that rotates by <angle> radians, counterclockwise,
+        about <origin>.
+        """
+        cos, sin = math.cos(angle), math.sin(angle)
+        ox, oy = origin[0], origin[1]
+        return cls(cos, -sin, ox - cos * ox + sin * oy,
+                   sin, cos, oy - sin * ox - cos * oy)
+
+
+    def __matmul__(self, other: Affine) -> Affine:
+        """
+        Return the Affine that applies <other>, then this Affine.
+        """
+        a, b, c, d, e, f = self.a, self.b, self.c, self.d, self.e, self.f
+        return Affine(a * other.a + b * other.d,
+                      a * other.b + b * other.e,
+                      a * other.c + b * other.f + c,
+                      d * other.a + e * other.d,
+                      d * other.b + e * other.e,
+                      d * other.c + e * other.f + f)
+
+
+    def apply(self, points: Union[Point, Points]
+              ) -> Union[Coord, tuple[float, float], CoordArray]:
+        """
+        Return <points> transformed, as a CoordArray; or, if <points> is a
+        single point, as a Coord, or as an (x, y) tuple if it is a pair.
+        """
+        a, b, c, d, e, f = self.a, self.b, self.c, self.d, self.e, self.f
+        if isinstance(points, Coord):
+            x, y = points.x, points.y
+            return Coord(a * x + b * y + c, d * x + e * y + f)
+        if (isinstance(points, (tuple, list)) and len(points) == 2
+                and isinstance(points[0], Real)):
+            x, y = points
+            return a * x + b * y + c, d * x + e * y + f
+        points = as_coord_array(points)
+        xs, ys = points.xs, points.ys
+        if points._np is not None:
+            return points._new(a * xs + b * ys + c, d * xs + e * ys + f)
+        return points._new(
+            map(c.__add__, map(add, map(a.__mul__, xs), map(b.__mul__, ys))),
+            map(f.__add__, map(add, map(d.__mul__, xs), map(e.__mul__, ys))))
+
+
+def _cross(ox: float, oy: float, ax: float, ay: float,
+           bx: float, by: float) -> float:
+    # > 0 if O -> A -> B turns counterclockwise
+    return (ax - ox) * (by - oy) - (ay - oy) * (bx - ox)
+
+
+def convex_hull(points: Points) -> CoordArray:
+    """
+    Return the vertices of the convex hull of <points>, counterclockwise,
+    starting from the leftmost (then lowest) point. Points on the hull's
+    edges are left out. O(n log n), by Andrew's monotone chain.
+
+    Examples
+    --------
+    >>> table = [(0, 0), (2, 0), (1, 1), (2, 2), (0, 2), (1, 0)]
+    >>> convex_hull(table)
+    CoordArray: [(0.0, 0.0), (2.0, 0.0), (2.0, 2.0), (0.0, 2.0)]
+    """
+    points = as_coord_array(points)
+    if points._np is not None:
+        np = points._np
+        order = np.lexsort((points.ys, points.xs)).tolist()
+    else:
+        order = sorted(range(len(points)),
+                       key=list(zip(points.xs, points.ys)).__getitem__)
+    xs, ys = points.xs, points.ys
+    # Drop repeated points, now next to each other
+    order = [i for n, i in enumerate(order)
+             if n == 0 or xs[i] != xs[order[n - 1]] or ys[i] != ys[order[n - 1]]]
+    if len(order) < 3:
+        hull = order
+    else:
+        # The lower hull, left to right, then the upper hull, right to
+        # left; each drops the points that would make a clockwise turn
+        hull = []
+        for half in (order, reversed(order)):
+            start = len(hull)
+            for i in half:
+                x, y = xs[i], ys[i]
+                while (len(hull) - start >= 2
+                       and _cross(xs[hull[-2]], ys[hull[-2]],
+                                  xs[hull[-1]], ys[hull[-1]], x, y) <= 0):
+                    hull.pop()
+                hull.append(i)
+            hull.pop()  # The last point of each half starts the other
+    return points._new([xs[i] for i in hull], [ys[i] for i in hull])
+
+
+def polygon_area(points: Points, signed: bool=False) -> float:
+    """
+    Return the area of the polygon w/ vertices <points>, in order, by the
+    shoelace formula. If <signed>, the area is negative for clockwise
+    vertices.
+
+    Examples
+    --------
+    >>> square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+    >>> polygon_area(square), polygon_area(square[::-1], signed=True)
+    (4.0, -4.0)
+    """
+    points = as_coord_array(points)
+    xs, ys = points.xs, points.ys
+    if len(xs) < 3:
+        return 0.0
+    if points._np is not None:
+        np = points._np
+        twice = float(np.dot(xs, np.roll(ys, -1)) - np.dot(np.roll(xs, -1), ys))
+    else:
+        next_xs = chain(islice(xs, 1, None), islice(xs, 1))
+        next_ys = chain(islice(ys, 1, None), islice(ys, 1))
+        twice = math.fsum(chain(map(mul, xs, next_ys),
+                                map(mul, next_xs, map((-1.0).__mul__, ys))))
+    area = twice / 2
+    return area if signed else abs(area)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
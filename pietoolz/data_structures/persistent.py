@@ -0,0 +1,357 @@
+"""
+Persistent (immutable) versions of Stack and BinaryTree. "Changing" one
+returns a new version and leaves the old one as it was; the 2 share every
+part that did not change. So keeping a version around, e.g. one per
+decision point of a game-tree search, costs nothing, and memory grows w/
+the number of changes, not w/ the number of versions kept.
+"""
+from __future__ import annotations
+from typing import Any, Iterable, Iterator, Mapping, Optional
+
+from pietoolz.data_structures.bst import BinaryTree, _Node, _height, _update
+
+
+class _Cell:
+    """
+    Cell of a cons list: an item, the rest of the list below it, and the
+    length of the list from here down.
+    """
+    __slots__ = ('_item', '_next', '_size')
+    _item: Any
+    _next: Optional[_Cell]
+    _size: int
+
+
+    def __init__(self, item: Any, next_cell: Optional[_Cell]) -> None:
+        self._item = item
+        self._next = next_cell
+        self._size = next_cell._size + 1 if next_cell is not None else 1
+
+
+class PersistentStack:
+    """
+    A Stack that never changes: push() and pop() return a new
+    PersistentStack in O(1), sharing all of the old one's items. It is
+    initialized the same 3 ways as Stack.
+
+    Client Code
+    -----------
+    >>> preflop = PersistentStack(['post blinds', 'deal'])
+    >>> called = preflop.push('call')
+    >>> raised = preflop.push('raise')  # Another line from the same spot
+    >>> raised
+    ['post blinds', 'deal', 'raise']
+    >>> action, undone = raised.pop()
+    >>> action, undone
+    ('raise', ['post blinds', 'deal'])
+    >>> preflop, called  # Unchanged
+    (['post blinds', 'deal'], ['post blinds', 'deal', 'call'])
+    """
+    __slots__ = ('_top',)
+    _top: Optional[_Cell]
+
+
+    def __init__(self, item: Any=None) -> None:
+        """
+        Initialize PersistentStack. Refer to Stack for <item>.
+        """
+        self._top = None
+        if item is not None:
+            if isinstance(item, (str, bytes, bytearray, Mapping)):
+                self._top = _Cell(item, None)
+            elif isinstance(item, Iterable):
+                for i in item:
+                    self._top = _Cell(i, self._top)
+            else:
+                self._top = _Cell(item, None)
+
+
+    @classmethod
+    def _from_top(cls, top: Optional[_Cell]) -> PersistentStack:
+        stack = cls.__new__(cls)
+        stack._top = top
+        return stack
+
+
+    def __str__(self) -> str:
+        items = list(self)
+        items.reverse()
+        return str(items)
+
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+    def push(self, item: Any) -> PersistentStack:
+        """
+        Return this PersistentStack w/ <item> pushed to the top.
+        """
+        return self._from_top(_Cell(item, self._top))
+
+
+    def extend(self, items: Iterable[Any]) -> PersistentStack:
+        """
+        Return this PersistentStack w/ each of <items> pushed, in order.
+        """
+        top = self._top
+        for item in items:
+            top = _Cell(item, top)
+        return self._from_top(top)
+
+
+    def pop(self) -> tuple[Any, PersistentStack]:
+        """
+        Return the item at the top of this PersistentStack and the
+        PersistentStack below it. If this PersistentStack is empty, return
+        (None, this PersistentStack).
+        """
+        if self._top is None:
+            return None, self
+        return self._top._item, self._from_top(self._top._next)
+
+
+    def pop_many(self, k: int) -> tuple[list[Any], PersistentStack]:
+        """
+        Return the top <k> items of this PersistentStack, top first, and the
+        PersistentStack below them. If there are fewer than <k> items,
+        return all of them.
+        """
+        items = []
+        top = self._top
+        while top is not None and len(items) < k:
+            items.append(top._item)
+            top = top._next
+        return items, self._from_top(top)
+
+
+    def peek(self) -> Any:
+        """
+        Return the item at the top of this PersistentStack, or None if it is
+        empty.
+        """
+        return self._top._item if self._top is not None else None
+
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterate over the items, top first.
+        """
+        top = self._top
+        while top is not None:
+            yield top._item
+            top = top._next
+
+
+    def is_empty(self) -> bool:
+        return self._top is None
+
+
+    def size(self) -> int:
+        return self._top._size if self._top is not None else 0
+
+
+    def __len__(self) -> int:
+        return self.size()
+
+
+def _node(key: Any, value: Any, left: Optional[_Node],
+          right: Optional[_Node]) -> _Node:
+    node = _Node(key, value)
+    node._left, node._right = left, right
+    _update(node)
+    return node
+
+
+def _balanced(key: Any, value: Any, left: Optional[_Node],
+              right: Optional[_Node]) -> _Node:
+    """
+    Return a new node of <key> and <value> over <left> and <right>, whose
+    heights are at most 2 apart, rotated as needed to be balanced. Nodes of
+    <left> and <right> are copied, not changed.
+    """
+    lh, rh = _height(left), _height(right)
+    if lh > rh + 1:
+        if _height(left._left) < _height(left._right):
+            pivot = left._right
+            return _node(pivot._key, pivot._value,
+                         _node(left._key, left._value, left._left, pivot._left),
+                         _node(key, value, pivot._right, right))
+        return _node(left._key, left._value, left._left,
+                     _node(key, value, left._right, right))
+    if rh > lh + 1:
+        if _height(right._right) < _height(right._left):
+            pivot = right._left
+            return _node(pivot._key, pivot._value,
+                         _node(key, value, left, pivot._left),
+                         _node(right._key, right._value, pivot._right,
+                               right._right))
+        return _node(right._key, right._value,
+                     _node(key, value, left, right._left), right._right)
+    return _node(key, value, left, right)
+
+
+def _insert(node: Optional[_Node], key: Any, value: Any) -> _Node:
+    if node is None:
+        return _Node(key, value)
+    if key < node._key:
+        return _balanced(node._key, node._value,
+                         _insert(node._left, key, value), node._right)
+    if node._key < key:
+        return _balanced(node._key, node._value,
+                         node._left, _insert(node._right, key, value))
+    return _node(key, value, node._left, node._right)
+
+
+def _pop_min(node: _Node) -> tuple[Optional[_Node], _Node]:
+    if node._left is None:
+        return node._right, node
+    left, smallest = _pop_min(node._left)
+    return _balanced(node._key, node._value, left, node._right), smallest
+
+
+def _delete(node: Optional[_Node], key: Any) -> Optional[_Node]:
+    if node is None:
+        raise KeyError(key)
+    if key < node._key:
+        return _balanced(node._key, node._value,
+                         _delete(node._left, key), node._right)
+    if node._key < key:
+        return _balanced(node._key, node._value,
+                         node._left, _delete(node._right, key))
+    if node._left is None:
+        return node._right
+    if node._right is None:
+        return node._left
+    right, successor = _pop_min(node._right)
+    return _balanced(successor._key, successor._value, node._left, right)
+
+
+def _join(left: Optional[_Node], key: Any, value: Any,
+          right: Optional[_Node]) -> _Node:
+    # Refer to bst._join(); copies the nodes on its path.
+    lh, rh = _height(left), _height(right)
+    if lh > rh + 1:
+        return _balanced(left._key, left._value, left._left,
+                         _join(left._right, key, value, right))
+    if rh > lh + 1:
+        return _balanced(right._key, right._value,
+                         _join(left, key, value, right._left), right._right)
+    return _node(key, value, left, right)
+
+
+def _split(node: Optional[_Node],
+           key: Any) -> tuple[Optional[_Node], Optional[_Node]]:
+    # Refer to bst._split(); copies the nodes on its path.
+    if node is None:
+        return None, None
+    if node._key < key:
+        left, right = _split(node._right, key)
+        return _join(node._left, node._key, node._value, left), right
+    left, right = _split(node._left, key)
+    return left, _join(right, node._key, node._value, node._right)
+
+
+class PersistentTree(BinaryTree):
+    """
+    A BinaryTree that never changes. Every method that would change a
+    BinaryTree instead returns a new PersistentTree, in the same time, and
+    leaves this one as it was: insert() and delete() copy the O(log n) nodes
+    on the path to the key and share all the rest. Lookups, order
+    statistics and iteration work as in BinaryTree.
+
+    Client Code
+    -----------
+    >>> flop = PersistentTree({'ann': 1500, 'bob': 3200})
+    >>> turn = flop.insert('bob', 2400).insert('cat', 900)
+    >>> river = turn.delete('ann')
+    >>> flop, turn, river
+    ({'ann': 1500, 'bob': 3200}, {'ann': 1500, 'bob': 2400, 'cat': 900}, {'bob': 2400, 'cat': 900})
+    >>> turn.select(-1), river.rank('cat')
+    ('cat', 1)
+    """
+    _shared = True
+
+
+    def __init__(self, items: Any=None) -> None:
+        """
+        Initialize PersistentTree. Refer to BinaryTree for <items>.
+        """
+        super().__init__()
+        if items is not None:
+            if isinstance(items, Mapping):
+                pairs = items.items()
+            else:
+                pairs = ((key, None) for key in items)
+            for key, value in pairs:
+                self._root = _insert(self._root, key, value)
+
+
+    @classmethod
+    def _from_root(cls, root: Optional[_Node]) -> PersistentTree:
+        tree = cls()
+        tree._root = root
+        return tree
+
+
+    def insert(self, key: Any, value: Optional[Any]=None) -> PersistentTree:
+        """
+        Return this PersistentTree w/ <key> inserted w/ <value>, or w/ its
+        value replaced if it is already in this PersistentTree.
+        """
+        return self._from_root(_insert(self._root, key, value))
+
+
+    def delete(self, key: Any) -> PersistentTree:
+        """
+        Return this PersistentTree w/o <key>.
+
+        Exceptions
+        ----------
+        If <key> is not in this PersistentTree, KeyError is raised.
+        """
+        return self._from_root(_delete(self._root, key))
+
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        raise TypeError('PersistentTree does not change; use insert().')
+
+
+    def __delitem__(self, key: Any) -> None:
+        raise TypeError('PersistentTree does not change; use delete().')
+
+
+    def split(self, key: Any) -> tuple[PersistentTree, PersistentTree]:
+        """
+        Return the PersistentTrees of the keys < <key> and of the keys >=
+        <key>, in O(log n).
+        """
+        left, right = _split(self._root, key)
+        return self._from_root(left), self._from_root(right)
+
+
+    def merge(self, other: BinaryTree) -> PersistentTree:
+        """
+        Return a PersistentTree of the keys of this one and <other>, w/ the
+        values of <other> for keys in both. If all keys of one tree are
+        smaller than all those of the other, it takes O(log n); else O(n),
+        n being the combined size.
+        """
+        # The nodes of a BinaryTree may still change, so they are copied
+        if not isinstance(other, PersistentTree):
+            return self.union(other)
+        low, high = self._root, other._root
+        if low is None or high is None:
+            return self._from_root(low or high)
+        if other.max() < self.min():
+            low, high = high, low
+        elif not self.max() < other.min():
+            return self.union(other)
+        high, smallest = _pop_min(high)
+        return self._from_root(
+            _join(low, smallest._key, smallest._value, high))
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
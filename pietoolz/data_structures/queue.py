@@ -1,5 +1,570 @@
+from __future__ import annotations
+from typing import Any, Iterable, Mapping, Optional
+from collections import deque
+from multiprocessing import resource_tracker, shared_memory
+import os
+import struct
+import sys
+import time
+
+
+class QueueFullException(Exception):
+    def __init__(self):
+        super().__init__("The Queue is at capacity.")
+
+
 class Queue:
-    pass
+    """
+    The classic FIFO Queue object experience: items are dequeued in the
+    order they were enqueued. Like Stack, you can store any combination of
+    data types within the same instance of Queue, and initialize it the same
+    3 ways.
+
+    Enqueue, dequeue, and peek are all O(1); the items live in a
+    collections.deque.
+
+    How to Initialize in 3 Different Ways
+    =====================================
+
+    Create an empty Queue:
+    ----------------------
+    >>> q1 = Queue()
+    >>> q1.enqueue(7)
+    >>> q1.enqueue('nine')
+    >>> q1
+    [7, 'nine']
+    >>> q1.dequeue()
+    7
+
+    Create a Pre-made Queue (Multiple Items):
+    -----------------------------------------
+    >>> q2 = Queue(range(4))  # Any iterable: list, tuple, generator...
+    >>> q2
+    [0, 1, 2, 3]
+    >>> q2.peek()
+    0
+
+    Create a Queue w/ a single item:
+    --------------------------------
+    >>> Queue('a str item')
+    ['a str item']
+
+    Fixed Capacity
+    --------------
+    A Queue can hold at most <capacity> items. When it is full, enqueuing
+    either raises QueueFullException (the default), or, if <overwrite> is
+    True, drops the oldest item to make room (a ring buffer):
+    >>> recent = Queue(capacity=3, overwrite=True)
+    >>> recent.enqueue_many(range(5))
+    >>> recent
+    [2, 3, 4]
+    >>> strict = Queue([1, 2], capacity=2)
+    >>> strict.enqueue(3)  # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    QueueFullException: The Queue is at capacity.
+
+    Representation Invariants
+    -------------------------
+    - The number of elements in the Queue cannot be a negative integer, nor
+    greater than its capacity, if it has one.
+    """
+    _queue: deque
+    _capacity: Optional[int]
+    _overwrite: bool
+
+
+    def __init__(self,
+                 item: Any=None,
+                 capacity: Optional[int]=None,
+                 overwrite: bool=False) -> None:
+        """
+        Initialize Queue. Refer to class docstring for details.
+        """
+        self._capacity = capacity
+        self._overwrite = overwrite
+        self._queue = deque(maxlen=capacity if overwrite else None)
+        # If an <item> is passed
+        if item is not None:
+            # <item>: a str, bytes, or mapping, which is ONE item
+            if isinstance(item, (str, bytes, bytearray, Mapping)):
+                self.enqueue(item)
+            # <item>: any other iterable (list, tuple, range, generator...)
+            elif isinstance(item, Iterable):
+                self.enqueue_many(item)
+            # <item>: anything else
+            else:
+                self.enqueue(item)
+
+
+    def __str__(self) -> str:
+        """
+        Client Code:
+        ------------
+        >>> print(Queue([1, 'two', 3.0]))
+        [1, 'two', 3.0]
+        """
+        return str(list(self._queue))
+
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+    def enqueue(self, item: Any) -> None:
+        """
+        Add <item> to the back of this Queue. Refer to the class docstring
+        for what happens when the Queue is full.
+        """
+        if (self._capacity is not None and not self._overwrite
+                and len(self._queue) >= self._capacity):
+            raise QueueFullException
+        self._queue.append(item)
+
+
+    def enqueue_many(self, items: Iterable[Any]) -> None:
+        """
+        Add each of <items>, in order, to the back of this Queue, in one
+        C-level pass. If this Queue rejects items when full and <items> do
+        not all fit, none are added.
+
+        Client Code:
+        ------------
+        >>> q = Queue()
+        >>> q.enqueue_many(['a', 'b', 'c'])
+        >>> q.dequeue_many(2)
+        ['a', 'b']
+        """
+        if self._capacity is not None and not self._overwrite:
+            if not isinstance(items, (list, tuple, deque)):
+                items = list(items)
+            if len(self._queue) + len(items) > self._capacity:
+                raise QueueFullException
+        self._queue.extend(items)
+
+
+    def dequeue(self) -> Any:
+        """
+        Remove the item at the front of this Queue and return it, or return
+        None if this Queue is empty.
+
+        Client Code:
+        ------------
+        >>> q = Queue([1, 2])
+        >>> q.dequeue()
+        1
+        >>> q.dequeue()
+        2
+        >>> q.dequeue()
+        >>> q.is_empty()
+        True
+        """
+        if not self._queue:
+            return None
+        return self._queue.popleft()
+
+
+    def dequeue_many(self, k: int) -> list[Any]:
+        """
+        Remove the <k> items at the front of this Queue and return them,
+        front first. If there are fewer than <k> items, remove and return all
+        of them.
+        """
+        queue = self._queue
+        k = min(k, len(queue))
+        if k == len(queue):
+            items = list(queue)
+            queue.clear()
+            return items
+        popleft = queue.popleft
+        return [popleft() for _ in range(k)]
+
+
+    def peek(self) -> Any:
+        """
+        Return the item at the front of this Queue w/o removing it, or None
+        if this Queue is empty.
+        """
+        return self._queue[0] if self._queue else None
+
+
+    def is_empty(self) -> bool:
+        """
+        Return True if Queue is empty. Else, return False.
+        """
+        return not self._queue
+
+
+    def is_full(self) -> bool:
+        """
+        Return True if this Queue has a capacity and is at it. Else, return
+        False.
+        """
+        return self._capacity is not None and len(self._queue) >= self._capacity
+
+
+    def size(self) -> int:
+        """
+        Return how many items are in this Queue.
+
+        Client Code
+        -----------
+        >>> q = Queue()
+        >>> q.size()
+        0
+        >>> q.enqueue_many([10, 20, 30])
+        >>> _ = q.dequeue()
+        >>> q.size()
+        2
+        """
+        return len(self._queue)
+
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+
+# Record header of a SharedQueue of bytes: the payload's length
+_LENGTH: struct.Struct = struct.Struct('<I')
+# SharedQueue header: 2 cache lines of uint64s, so the consumer's head and
+# the producer's tail are never written to the same line
+_HEADER_SIZE: int = 128
+_HEAD, _CAPACITY, _RECORD_SIZE, _TAIL = 0, 1, 2, 8
+# Longest sleep while polling for an item or room
+_MAX_BACKOFF: float = 0.001
+
+
+def _attach_shared_queue(name: str, fmt: Optional[str]) -> SharedQueue:
+    return SharedQueue.attach(name, fmt)
+
+
+class SharedQueue:
+    """
+    A fixed-capacity FIFO Queue in shared memory, for passing items from ONE
+    producer process to ONE consumer process. Items are fixed-size records
+    in a ring buffer, so an item crosses processes as a copy into and out of
+    the shared block: no pickling and no pipe writes, unlike
+    multiprocessing.Queue.
+
+    Items are either:
+    - bytes-like objects (bytes, bytearray, memoryview, array...) of at most
+      <record_size> bytes, dequeued as bytes; or
+    - if <fmt> is given, tuples packed w/ struct format <fmt>, dequeued as
+      tuples (or as single values, if <fmt> has one field).
+
+    The producer only ever writes the tail index and the consumer only the
+    head index, so neither side takes a lock. An enqueue or dequeue that has
+    to wait polls, sleeping at most 1ms between tries.
+
+    The process that creates a SharedQueue owns the shared block and unlinks
+    it on close(); a forked child that inherits the owner's SharedQueue only
+    detaches. Garbage collection does not unlink it, as other processes
+    may still attach by name: if the owner never calls close(), the block
+    lasts until the owner exits, when its resource tracker frees it (and
+    warns of a leak). Other processes get it by unpickling the SharedQueue
+    (e.g. passing it to a multiprocessing.Process or as a
+    ProcessPoolExecutor initializer argument), or by attach() with its name.
+
+    Client Code
+    -----------
+    >>> import pickle
+    >>> results = SharedQueue(capacity=4, fmt='<Hdd')  # (hand, win, tie)
+    >>> results.enqueue((0, 0.85, 0.005))
+    >>> results.enqueue_many([(1, 0.67, 0.017), (2, 0.66, 0.016)])
+    >>> consumer_side = pickle.loads(pickle.dumps(results))  # As a worker would
+    >>> consumer_side.dequeue()
+    (0, 0.85, 0.005)
+    >>> consumer_side.dequeue_many(5)
+    [(1, 0.67, 0.017), (2, 0.66, 0.016)]
+    >>> consumer_side.dequeue(block=False)  # Empty
+    >>> consumer_side.close()
+    >>> results.close()
+
+    >>> with SharedQueue(capacity=1, record_size=8) as frames:
+    ...     frames.enqueue(b'AsKd')
+    ...     frames.enqueue(b'7c2h', block=False)  # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    QueueFullException: The Queue is at capacity.
+    """
+    _shm: shared_memory.SharedMemory
+    # pid of the process that created the block, or None if attached
+    _owner: Optional[int]
+    _capacity: int
+    _record_size: int
+    _fmt: Optional[str]
+    _struct: Optional[struct.Struct]
+    _buf: memoryview
+    # uint64 view of the header; [_HEAD] and [_TAIL] count the items ever
+    # dequeued / enqueued, so the Queue holds tail - head items. They are
+    # stored through this view, in one 8-byte write each: struct.pack_into()
+    # zeroes its target first, so another process could read a 0.
+    _index: memoryview
+
+
+    def __init__(self,
+                 capacity: int,
+                 record_size: Optional[int]=None,
+                 fmt: Optional[str]=None,
+                 name: Optional[str]=None) -> None:
+        """
+        Create a SharedQueue of <capacity> items, each at most <record_size>
+        bytes or packed w/ <fmt> (give exactly one). Refer to class
+        docstring for details. <name> names the shared block; a unique name
+        is made up if None.
+        """
+        if (record_size is None) == (fmt is None):
+            raise ValueError('Give exactly one of record_size and fmt.')
+        if fmt is not None:
+            stride = struct.calcsize(fmt)
+        else:
+            stride = _LENGTH.size + record_size
+        stride = -(-stride // 8) * 8  # Keep records 8-byte aligned
+        shm = shared_memory.SharedMemory(
+            name, create=True, size=_HEADER_SIZE + capacity * stride)
+        self._setup(shm, os.getpid(), fmt)
+        self._index[_HEAD] = self._index[_TAIL] = 0
+        self._index[_CAPACITY] = capacity
+        self._index[_RECORD_SIZE] = stride
+        self._capacity, self._record_size = capacity, stride
+
+
+    @classmethod
+    def attach(cls, name: str, fmt: Optional[str]=None) -> SharedQueue:
+        """
+        Return the SharedQueue in the shared block named <name>, created
+        w/ <fmt> (or w/o one). The attaching process does not own the block.
+        """
+        # Only the owner should have the block cleaned up after it. Before
+        # 3.13, SharedMemory always registers it w/ the resource tracker,
+        # which would unlink it when this process exits.
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name)
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        queue = cls.__new__(cls)
+        queue._setup(shm, None, fmt)
+        queue._capacity = queue._index[_CAPACITY]
+        queue._record_size = queue._index[_RECORD_SIZE]
+        return queue
+
+
+    def _setup(self, shm: shared_memory.SharedMemory, owner: Optional[int],
+               fmt: Optional[str]) -> None:
+        self._shm, self._owner, self._fmt = shm, owner, fmt
+        self._struct = struct.Struct(fmt) if fmt is not None else None
+        self._buf = shm.buf
+        self._index = shm.buf[:_HEADER_SIZE].cast('Q')
+
+
+    def __reduce__(self) -> tuple:
+        return (_attach_shared_queue, (self._shm.name, self._fmt))
+
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+
+    def __str__(self) -> str:
+        head, tail = self._index[_HEAD], self._index[_TAIL]
+        return str([self._read(i) for i in range(head, tail)])
+
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+    def _write(self, i: int, item: Any) -> None:
+        offset = _HEADER_SIZE + (i % self._capacity) * self._record_size
+        if self._struct is not None:
+            if isinstance(item, tuple):
+                self._struct.pack_into(self._buf, offset, *item)
+            else:
+                self._struct.pack_into(self._buf, offset, item)
+            return
+        n = memoryview(item).nbytes
+        if _LENGTH.size + n > self._record_size:
+            raise ValueError(f'An item of {n} bytes does not fit in a record.')
+        _LENGTH.pack_into(self._buf, offset, n)
+        start = offset + _LENGTH.size
+        self._buf[start:start + n] = memoryview(item).cast('B')
+
+
+    def _read(self, i: int) -> Any:
+        offset = _HEADER_SIZE + (i % self._capacity) * self._record_size
+        if self._struct is not None:
+            item = self._struct.unpack_from(self._buf, offset)
+            return item[0] if len(item) == 1 else item
+        (n,) = _LENGTH.unpack_from(self._buf, offset)
+        start = offset + _LENGTH.size
+        return bytes(self._buf[start:start + n])
+
+
+    def _head(self) -> int:
+        return self._index[_HEAD]
+
+
+    def _tail(self) -> int:
+        return self._index[_TAIL]
+
+
+    @staticmethod
+    def _poll(ready, block: bool, timeout: Optional[float]) -> bool:
+        """
+        Return whether ready() came true, polling it until <timeout>
+        seconds pass (forever if None) if <block>.
+        """
+        if not block:
+            return ready()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = 0.0
+        while not ready():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(delay)
+            delay = min(_MAX_BACKOFF, delay * 2 or 1e-6)
+        return True
+
+
+    def enqueue(self,
+                item: Any,
+                block: bool=True,
+                timeout: Optional[float]=None) -> None:
+        """
+        Add <item> to the back of this SharedQueue. If it is full, wait for
+        room, up to <timeout> seconds (forever if None), unless <block> is
+        False. Only call from the producer.
+
+        Exceptions
+        ----------
+        If there is no room in time, QueueFullException is raised.
+        """
+        tail = self._tail()
+        if tail - self._head() >= self._capacity and not self._poll(
+                lambda: tail - self._head() < self._capacity, block, timeout):
+            raise QueueFullException
+        self._write(tail, item)
+        self._index[_TAIL] = tail + 1  # Publish only once written
+
+
+    def enqueue_many(self,
+                     items: Iterable[Any],
+                     block: bool=True,
+                     timeout: Optional[float]=None) -> None:
+        """
+        Add each of <items>, in order, to the back of this SharedQueue,
+        publishing as many at a time as there is room for. Refer to
+        SharedQueue.enqueue() for <block> and <timeout>; if they run out,
+        the items not yet added are dropped and QueueFullException is
+        raised.
+        """
+        tail = self._tail()
+        room = self._capacity - (tail - self._head())
+        for item in items:
+            if not room:
+                self._index[_TAIL] = tail
+                if not self._poll(
+                        lambda: tail - self._head() < self._capacity,
+                        block, timeout):
+                    raise QueueFullException
+                room = self._capacity - (tail - self._head())
+            self._write(tail, item)
+            tail += 1
+            room -= 1
+        self._index[_TAIL] = tail
+
+
+    def dequeue(self, block: bool=True, timeout: Optional[float]=None) -> Any:
+        """
+        Remove the item at the front of this SharedQueue and return it. If
+        it is empty, wait for an item, up to <timeout> seconds (forever if
+        None), unless <block> is False. Return None if none arrives in time.
+        Only call from the consumer.
+        """
+        head = self._head()
+        if self._tail() == head and not self._poll(
+                lambda: self._tail() != head, block, timeout):
+            return None
+        item = self._read(head)
+        self._index[_HEAD] = head + 1  # Free the record only once read
+        return item
+
+
+    def dequeue_many(self, k: int) -> list[Any]:
+        """
+        Remove up to <k> items from the front of this SharedQueue and return
+        them, front first. Does not wait for items.
+        """
+        head = self._head()
+        end = min(self._tail(), head + max(k, 0))
+        items = [self._read(i) for i in range(head, end)]
+        self._index[_HEAD] = end
+        return items
+
+
+    def is_empty(self) -> bool:
+        return self._tail() == self._head()
+
+
+    def is_full(self) -> bool:
+        return self.size() >= self._capacity
+
+
+    def size(self) -> int:
+        return self._tail() - self._head()
+
+
+    def __len__(self) -> int:
+        return self.size()
+
+
+    def close(self) -> None:
+        """
+        Detach from the shared block; the owner also frees it. Items left in
+        it are lost once every process has closed.
+
+        Client Code
+        -----------
+        >>> import multiprocessing as mp
+        >>> with SharedQueue(capacity=2, fmt='<q') as shared:
+        ...     if 'fork' in mp.get_all_start_methods():
+        ...         # The child inherits the owner's SharedQueue as is
+        ...         child = mp.get_context('fork').Process(target=shared.close)
+        ...         child.start()
+        ...         child.join()
+        ...     shared.enqueue(7)
+        ...     shared.dequeue()
+        7
+        """
+        if self._index is None:
+            return
+        self._index.release()
+        self._index = self._buf = None
+        self._shm.close()
+        if self._owner == os.getpid():
+            if sys.version_info < (3, 13):
+                # An attach() in a process sharing this one's resource
+                # tracker (this one, or a child) dropped the block's entry
+                resource_tracker.register(self._shm._name, 'shared_memory')
+            self._shm.unlink()
+
+
+    def __del__(self) -> None:
+        # Let SharedMemory close the block, which it cannot while the
+        # header view is alive
+        if getattr(self, '_index', None) is not None:
+            self._index.release()
+
+
+    def __enter__(self) -> SharedQueue:
+        return self
+
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
 
 if __name__ == "__main__":
     import doctest
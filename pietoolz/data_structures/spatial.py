@@ -0,0 +1,439 @@
+"""
+Spatial indexes over 2D points, for nearest-neighbour, radius and box
+queries w/o scanning every point:
+- GridIndex: a uniform hash grid, for points that are added, moved and
+  removed all the time.
+- KDTree: a k-d tree, bulk-built once over a static set of points.
+
+Points can be given as Coords, (x, y) pairs, or (to KDTree) a CoordArray.
+Both indexes answer the same 3 queries:
+- nearest(point, k): the k nearest points, as (distance, key) pairs,
+  nearest first.
+- within(point, radius): the keys of the points at most <radius> away.
+- in_box(corner, other_corner): the keys of the points in the box.
+"""
+from __future__ import annotations
+from typing import Any, Hashable, Iterable, Optional, Sequence, Union
+from array import array
+import heapq
+import math
+
+from pietoolz.data_structures.coord import Coord, CoordArray
+
+
+Point = Union[Coord, Sequence[float]]
+
+
+class GridIndex:
+    """
+    Points under keys of your choice (e.g. player ids), bucketed into square
+    cells of side <cell_size>. Only the cells that hold points are stored,
+    in a dict, so the grid has no bounds.
+
+    Inserting, moving and removing a point is O(1): it only changes cell if
+    it crosses a cell border. A query only looks at the cells that overlap
+    its area, so pick <cell_size> around the typical query radius.
+
+    Examples
+    --------
+    >>> seats = GridIndex(cell_size=10)
+    >>> seats.insert('ann', Coord(1, 1))
+    >>> seats.insert('bob', (4, 5))
+    >>> seats.insert('cat', (30, 30))
+    >>> seats.nearest(Coord(0, 0), k=2)
+    [(1.4142135623730951, 'ann'), (6.4031242374328485, 'bob')]
+    >>> seats.move('cat', (2, 2))
+    >>> sorted(seats.within((0, 0), radius=3))
+    ['ann', 'cat']
+    >>> seats.remove('ann')
+    >>> seats.in_box((0, 0), (5, 5))
+    ['bob', 'cat']
+    """
+    _cell_size: float
+    # Cell (i, j) -> {key: (x, y)} of the points in it
+    _cells: dict[tuple[int, int], dict[Hashable, tuple[float, float]]]
+    # Key -> (x, y) of every point
+    _points: dict[Hashable, tuple[float, float]]
+
+
+    def __init__(self,
+                 cell_size: float,
+                 items: Optional[Iterable[tuple[Hashable, Point]]]=None) -> None:
+        """
+        Initialize the GridIndex, w/ the (key, point) pairs of <items>, if
+        any.
+        """
+        if cell_size <= 0:
+            raise ValueError('cell_size must be positive.')
+        self._cell_size = cell_size
+        self._cells = {}
+        self._points = {}
+        if items is not None:
+            for key, point in items:
+                self.insert(key, point)
+
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        size = self._cell_size
+        return (math.floor(x / size), math.floor(y / size))
+
+
+    def insert(self, key: Hashable, point: Point) -> None:
+        """
+        Add the point <point> under <key>. If <key> is already in this
+        GridIndex, its point is moved.
+        """
+        if key in self._points:
+            self.move(key, point)
+            return
+        x, y = float(point[0]), float(point[1])
+        self._points[key] = (x, y)
+        cell = self._cell(x, y)
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            bucket = self._cells[cell] = {}
+        bucket[key] = (x, y)
+
+
+    def move(self, key: Hashable, point: Point) -> None:
+        """
+        Move the point under <key> to <point>.
+
+        Exceptions
+        ----------
+        If <key> is not in this GridIndex, KeyError is raised.
+        """
+        old = self._points[key]
+        x, y = float(point[0]), float(point[1])
+        self._points[key] = (x, y)
+        old_cell, cell = self._cell(*old), self._cell(x, y)
+        if cell == old_cell:
+            self._cells[cell][key] = (x, y)
+            return
+        self._discard(key, old_cell)
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            bucket = self._cells[cell] = {}
+        bucket[key] = (x, y)
+
+
+    def _discard(self, key: Hashable, cell: tuple[int, int]) -> None:
+        bucket = self._cells[cell]
+        del bucket[key]
+        if not bucket:
+            del self._cells[cell]
+
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Remove the point under <key>.
+
+        Exceptions
+        ----------
+        If <key> is not in this GridIndex, KeyError is raised.
+        """
+        self._discard(key, self._cell(*self._points.pop(key)))
+
+
+    def get(self, key: Hashable) -> Optional[Coord]:
+        """
+        Return the point under <key> as a Coord, or None if <key> is not in
+        this GridIndex.
+        """
+        point = self._points.get(key)
+        return Coord(*point) if point is not None else None
+
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._points
+
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+
+    def _buckets(self, i0: int, j0: int, i1: int, j1: int) -> Iterable[dict]:
+        """
+        Yield the non-empty cells (i, j) w/ i0 <= i <= i1 and j0 <= j <= j1.
+        """
+        cells = self._cells
+        if (i1 - i0 + 1) * (j1 - j0 + 1) > len(cells):
+            # Fewer cells hold points than the area covers
+            for (i, j), bucket in cells.items():
+                if i0 <= i <= i1 and j0 <= j <= j1:
+                    yield bucket
+            return
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                bucket = cells.get((i, j))
+                if bucket is not None:
+                    yield bucket
+
+
+    def within(self, point: Point, radius: float) -> list[Hashable]:
+        """
+        Return the keys of the points at most <radius> away from <point>.
+
+        Exceptions
+        ----------
+        If <radius> is negative, ValueError is raised.
+        """
+        if radius < 0:
+            raise ValueError('radius must not be negative.')
+        x, y = float(point[0]), float(point[1])
+        r2 = radius * radius
+        i0, j0 = self._cell(x - radius, y - radius)
+        i1, j1 = self._cell(x + radius, y + radius)
+        return [key
+                for bucket in self._buckets(i0, j0, i1, j1)
+                for key, (px, py) in bucket.items()
+                if (px - x) ** 2 + (py - y) ** 2 <= r2]
+
+
+    def in_box(self, corner: Point, other_corner: Point) -> list[Hashable]:
+        """
+        Return the keys of the points in the box w/ opposite corners
+        <corner> and <other_corner>, edges included.
+        """
+        x0, x1 = sorted((float(corner[0]), float(other_corner[0])))
+        y0, y1 = sorted((float(corner[1]), float(other_corner[1])))
+        i0, j0 = self._cell(x0, y0)
+        i1, j1 = self._cell(x1, y1)
+        return [key
+                for bucket in self._buckets(i0, j0, i1, j1)
+                for key, (px, py) in bucket.items()
+                if x0 <= px <= x1 and y0 <= py <= y1]
+
+
+    def nearest(self, point: Point, k: int=1) -> list[tuple[float, Hashable]]:
+        """
+        Return the (distance, key) pairs of the <k> points nearest to
+        <point>, nearest first. If there are fewer than <k> points, return
+        all of them.
+
+        The cells are searched in square rings around the cell of <point>,
+        until no point left can be nearer than the <k>th nearest found.
+        """
+        x, y = float(point[0]), float(point[1])
+        k = min(k, len(self._points))
+        if k <= 0:
+            return []
+        ci, cj = self._cell(x, y)
+        cells = self._cells
+        # Max-heap of the best (-squared distance, -order seen, key) found
+        # yet: of 2 points as far away, the one seen first is kept
+        best = []
+        seen = 0
+        r = 0
+        while True:
+            if (2 * r + 1) ** 2 > 2 * len(cells):
+                # Cheaper to look at every remaining cell than ring by ring
+                ring = [bucket for (i, j), bucket in cells.items()
+                        if max(abs(i - ci), abs(j - cj)) >= r]
+                r = -1
+            elif r == 0:
+                ring = [cells.get((ci, cj))]
+            else:
+                ring = [cells.get((ci + di, cj + dj))
+                        for di in range(-r, r + 1)
+                        for dj in ((-r, r) if abs(di) < r
+                                   else range(-r, r + 1))]
+            for bucket in ring:
+                if bucket is None:
+                    continue
+                for key, (px, py) in bucket.items():
+                    d2 = (px - x) ** 2 + (py - y) ** 2
+                    seen += 1
+                    if len(best) < k:
+                        heapq.heappush(best, (-d2, -seen, key))
+                    elif d2 < -best[0][0]:
+                        heapq.heapreplace(best, (-d2, -seen, key))
+            # Points beyond ring r are at least r cells away
+            reach = r * self._cell_size
+            if (r < 0 or seen == len(self._points)
+                    or len(best) == k and -best[0][0] <= reach * reach):
+                break
+            r += 1
+        best.sort(reverse=True)
+        return [(math.sqrt(-d2), key) for d2, _, key in best]
+
+
+def _coords(points: Union[CoordArray, Iterable[Point]]) -> tuple[array, array]:
+    """
+    Return the x's and y's of <points> as 2 array('d')s.
+    """
+    if isinstance(points, CoordArray):
+        return array('d', points.xs), array('d', points.ys)
+    xs, ys = array('d'), array('d')
+    for point in points:
+        xs.append(point[0])
+        ys.append(point[1])
+    return xs, ys
+
+
+class KDTree:
+    """
+    A k-d tree over a static set of points, bulk-built in O(n log^2 n). The
+    key of each point is its index in the points given.
+
+    The tree is implicit: the points are reordered so that every node is a
+    contiguous run of them. The middle point of a run splits it along x or
+    y (in turns): the points before it are not past it, and those after it
+    are not before it. Runs of at most <leaf_size> points are scanned. So
+    the whole tree is 3 flat arrays, and no node objects.
+
+    Examples
+    --------
+    >>> chips = KDTree([(0, 0), (5, 5), Coord(1, 2), (9, 1), (4, 4)])
+    >>> chips.nearest((4.5, 4.5), k=2)
+    [(0.7071067811865476, 1), (0.7071067811865476, 4)]
+    >>> sorted(chips.within(Coord(0, 0), radius=3))
+    [0, 2]
+    >>> sorted(chips.in_box((3, 0), (10, 4)))
+    [3, 4]
+    """
+    _xs: array
+    _ys: array
+    # _ids[i] is the index in the points given of the ith point in order
+    _ids: array
+    _leaf_size: int
+
+
+    def __init__(self,
+                 points: Union[CoordArray, Iterable[Point]],
+                 leaf_size: int=16) -> None:
+        """
+        Build the KDTree over <points>: Coords or (x, y) pairs, or a
+        CoordArray.
+        """
+        xs, ys = _coords(points)
+        order = list(range(len(xs)))
+        keys = (xs.__getitem__, ys.__getitem__)
+        # Sort each node's run by its axis, then do the same for its halves
+        todo = [(0, len(order), 0)]
+        while todo:
+            lo, hi, axis = todo.pop()
+            if hi - lo <= leaf_size:
+                continue
+            order[lo:hi] = sorted(order[lo:hi], key=keys[axis])
+            mid = (lo + hi) // 2
+            todo.append((lo, mid, axis ^ 1))
+            todo.append((mid + 1, hi, axis ^ 1))
+        self._xs = array('d', map(xs.__getitem__, order))
+        self._ys = array('d', map(ys.__getitem__, order))
+        self._ids = array('q', order)
+        self._leaf_size = leaf_size
+
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+    def within(self, point: Point, radius: float) -> list[int]:
+        """
+        Return the indexes of the points at most <radius> away from <point>.
+
+        Exceptions
+        ----------
+        If <radius> is negative, ValueError is raised.
+        """
+        if radius < 0:
+            raise ValueError('radius must not be negative.')
+        x, y = float(point[0]), float(point[1])
+        r2 = radius * radius
+        xs, ys, ids, leaf_size = self._xs, self._ys, self._ids, self._leaf_size
+        found = []
+        todo = [(0, len(ids), 0)]
+        while todo:
+            lo, hi, axis = todo.pop()
+            if hi - lo <= leaf_size:
+                found.extend(ids[i] for i in range(lo, hi)
+                             if (xs[i] - x) ** 2 + (ys[i] - y) ** 2 <= r2)
+                continue
+            mid = (lo + hi) // 2
+            if (xs[mid] - x) ** 2 + (ys[mid] - y) ** 2 <= r2:
+                found.append(ids[mid])
+            diff = (x - xs[mid]) if axis == 0 else (y - ys[mid])
+            if diff <= radius:
+                todo.append((lo, mid, axis ^ 1))
+            if diff >= -radius:
+                todo.append((mid + 1, hi, axis ^ 1))
+        return found
+
+
+    def in_box(self, corner: Point, other_corner: Point) -> list[int]:
+        """
+        Return the indexes of the points in the box w/ opposite corners
+        <corner> and <other_corner>, edges included.
+        """
+        x0, x1 = sorted((float(corner[0]), float(other_corner[0])))
+        y0, y1 = sorted((float(corner[1]), float(other_corner[1])))
+        xs, ys, ids, leaf_size = self._xs, self._ys, self._ids, self._leaf_size
+        found = []
+        todo = [(0, len(ids), 0)]
+        while todo:
+            lo, hi, axis = todo.pop()
+            if hi - lo <= leaf_size:
+                found.extend(ids[i] for i in range(lo, hi)
+                             if x0 <= xs[i] <= x1 and y0 <= ys[i] <= y1)
+                continue
+            mid = (lo + hi) // 2
+            if x0 <= xs[mid] <= x1 and y0 <= ys[mid] <= y1:
+                found.append(ids[mid])
+            split = xs[mid] if axis == 0 else ys[mid]
+            low, high = (x0, x1) if axis == 0 else (y0, y1)
+            if low <= split:
+                todo.append((lo, mid, axis ^ 1))
+            if high >= split:
+                todo.append((mid + 1, hi, axis ^ 1))
+        return found
+
+
+    def nearest(self, point: Point, k: int=1) -> list[tuple[float, int]]:
+        """
+        Return the (distance, index) pairs of the <k> points nearest to
+        <point>, nearest first. If there are fewer than <k> points, return
+        all of them.
+        """
+        x, y = float(point[0]), float(point[1])
+        k = min(k, len(self._ids))
+        if k <= 0:
+            return []
+        xs, ys, ids, leaf_size = self._xs, self._ys, self._ids, self._leaf_size
+        # Max-heap of the best (-squared distance, -index) found yet
+        best = []
+        heappush, heapreplace = heapq.heappush, heapq.heapreplace
+
+        def visit(i: int) -> None:
+            d2 = (xs[i] - x) ** 2 + (ys[i] - y) ** 2
+            if len(best) < k:
+                heappush(best, (-d2, -ids[i]))
+            elif (-d2, -ids[i]) > best[0]:
+                heapreplace(best, (-d2, -ids[i]))
+
+        def search(lo: int, hi: int, axis: int) -> None:
+            if hi - lo <= leaf_size:
+                for i in range(lo, hi):
+                    visit(i)
+                return
+            mid = (lo + hi) // 2
+            visit(mid)
+            diff = (x - xs[mid]) if axis == 0 else (y - ys[mid])
+            # Nearer half first, so the farther one can often be skipped
+            if diff < 0:
+                search(lo, mid, axis ^ 1)
+                if len(best) < k or diff * diff <= -best[0][0]:
+                    search(mid + 1, hi, axis ^ 1)
+            else:
+                search(mid + 1, hi, axis ^ 1)
+                if len(best) < k or diff * diff <= -best[0][0]:
+                    search(lo, mid, axis ^ 1)
+
+        search(0, len(ids), 0)
+        best.sort(reverse=True)
+        return [(math.sqrt(-d2), -i) for d2, i in best]
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
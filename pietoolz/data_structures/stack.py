@@ -5,8 +5,56 @@ How to Implement Code:
 2. Refactor/optimize if necessary.
 """
 from __future__ import annotations
-from typing import Any, Optional, Union
+from typing import Any, Iterable, Mapping, MutableSequence, Optional, Union
+from array import array
+import random
 import secrets
+import threading
+
+
+# Cryptographic RNG, drawing from OS entropy. Use it when shuffles must be
+# unpredictable (e.g. real-money dealing).
+SYSTEM_RNG: random.Random = secrets.SystemRandom()
+
+
+def make_rng(rng: Union[None, int, random.Random]=None) -> random.Random:
+    """
+    Return the RNG that <rng> stands for:
+    - None: SYSTEM_RNG, the cryptographic RNG.
+    - int: a new, fast random.Random seeded w/ <rng>, for reproducible
+      simulations.
+    - random.Random (or subclass) instance: <rng> itself.
+
+    >>> make_rng() is SYSTEM_RNG
+    True
+    >>> make_rng(7).random() == make_rng(7).random()
+    True
+    """
+    if rng is None:
+        return SYSTEM_RNG
+    if isinstance(rng, int):
+        return random.Random(rng)
+    return rng
+
+
+def shuffle_top(seq: MutableSequence, k: int, rng: random.Random) -> None:
+    """
+    Randomize only the last <k> items of <seq> (i.e. the top of a Stack):
+    they become a uniformly random sample of all of <seq>, in random order.
+    The rest of <seq> is left partially shuffled.
+
+    Costs k random draws, instead of len(seq) for a full shuffle.
+
+    >>> seq = list(range(52))
+    >>> shuffle_top(seq, 5, make_rng(1))
+    >>> sorted(seq) == list(range(52))
+    True
+    """
+    randbelow = rng.randrange
+    n = len(seq)
+    for i in range(n - 1, max(n - k, 1) - 1, -1):
+        j = randbelow(i + 1)
+        seq[i], seq[j] = seq[j], seq[i]
 
 
 class Stack:
@@ -36,12 +84,20 @@ class Stack:
     >>> s2 = Stack(temp_list)
     >>> s2
     [2, 3, 4, 9]
+    >>> # Any iterable works, and is read straight into the Stack, w/o a copy.
+    >>> Stack(range(4))
+    [0, 1, 2, 3]
+    >>> Stack(n * n for n in range(4))
+    [0, 1, 4, 9]
 
     Create a Stack w/ a bottom item:
     --------------------------------
     >>> s3 = Stack('a str item')
     >>> s3
     ['a str item']
+    >>> # str, bytes, and mappings (e.g. dict) are single items, too.
+    >>> Stack({'k': 'v'})
+    [{'k': 'v'}]
 
     Extra Features
     --------------
@@ -52,6 +108,17 @@ class Stack:
         >>> # The line of code below randomly shuffles the stacking order.
         >>> stk.shuffle()
         >>> # Now, there's only a "33.3% possibility" that s1.pop() will return 3.
+
+    2. Reproducible Shuffles
+        By default, shuffles draw from OS entropy (cryptographic). To make
+        them fast and reproducible instead (e.g. for simulations), give the
+        Stack a seed, or a random.Random of its own:
+        >>> s1 = Stack(list(range(10)), rng=42)
+        >>> s2 = Stack(list(range(10)), rng=42)
+        >>> s1.shuffle()
+        >>> s2.shuffle()
+        >>> str(s1) == str(s2)
+        True
     
     Representation Invariants
     -------------------------
@@ -66,32 +133,55 @@ class Stack:
     #
     _stack: list[Any]
     _size: int
+    _rng: random.Random
 
 
-    def __init__(self, item: Any=None) -> None:
+    def __init__(self,
+                 item: Any=None,
+                 rng: Union[None, int, random.Random]=None) -> None:
         """
         Initialize Stack. Refer to class docstring for details.
+
+        <rng> is the RNG this Stack shuffles with. Refer to make_rng().
         """
         # Initialize an empty Stack
-        self._stack = []
+        self._stack = self._new_storage()
         self._size = 0
+        self._rng = make_rng(rng)
         # If an <item> is passed
         if item is not None:
-            # <item>: list
-            if isinstance(item, list):
-                self._stack += item
-                self._size += len(item)
-            # <item>: tuple
-            elif isinstance(item, tuple):
-                for i in item:
-                    self._stack.append(i)
-                self._size += len(item)
-            # <item>: anything other than Python list or tuple
+            # <item>: a str, bytes, or mapping, which is ONE item
+            if isinstance(item, (str, bytes, bytearray, Mapping)):
+                self.push(item)
+            # <item>: any other iterable (list, tuple, range, generator...)
+            elif isinstance(item, Iterable):
+                self.extend(item)
+            # <item>: anything else
             else:
-                self._stack.append(item)
-                self._size += 1
+                self.push(item)
 
     
+    def _new_storage(self) -> MutableSequence:
+        """
+        Return the empty sequence this Stack keeps its items in.
+        """
+        return []
+
+
+    @classmethod
+    def typed(cls,
+              typecode: str,
+              item: Any=None,
+              rng: Union[None, int, random.Random]=None) -> TypedStack:
+        """
+        Return a TypedStack of <typecode> items. Refer to TypedStack.
+
+        >>> Stack.typed('d', [1.5, 2.5])
+        [1.5, 2.5]
+        """
+        return TypedStack(typecode, item, rng)
+
+
     def __str__(self) -> str:
         """
         Client Code:
@@ -138,6 +228,39 @@ class Stack:
         self._size += 1
     
 
+    def extend(self, items: Iterable[Any]) -> None:
+        """
+        Push each of <items>, in order, onto this Stack: the last one ends up
+        on top. <items> can be any iterable, and is consumed lazily, in one
+        C-level pass, w/o an intermediate copy.
+
+        Client Code:
+        ------------
+        >>> stk = Stack([1])
+        >>> stk.extend(range(2, 5))
+        >>> stk
+        [1, 2, 3, 4]
+        >>> stk.size()
+        4
+        """
+        self._stack.extend(items)
+        self._size = len(self._stack)
+
+
+    def push_many(self, *items: Any) -> None:
+        """
+        Push each of <items>, in order, onto this Stack.
+
+        Client Code:
+        ------------
+        >>> stk = Stack()
+        >>> stk.push_many(1, 2, 'three')
+        >>> stk
+        [1, 2, 'three']
+        """
+        self.extend(items)
+
+
     def pop(self) -> Optional[None]:
         """
         Info.
@@ -181,6 +304,32 @@ class Stack:
             return self._stack.pop()
 
 
+    def pop_many(self, k: int) -> list[Any]:
+        """
+        Remove the top <k> items of this Stack, in one slice, and return them
+        in the order they would have been popped. If there are fewer than <k>
+        items, remove and return all of them.
+
+        Client Code:
+        ------------
+        >>> stk = Stack([1, 2, 3, 4, 5])
+        >>> stk.pop_many(2)
+        [5, 4]
+        >>> stk.pop_many(7)
+        [3, 2, 1]
+        >>> stk.size()
+        0
+        """
+        k = min(k, len(self._stack))
+        if k <= 0:
+            return []
+        items = self._stack[-k:]
+        del self._stack[-k:]
+        self._size -= k
+        items.reverse()
+        return items
+
+
     def is_empty(self) -> bool:
         """
         Return True if Stack is empty. Else, return False.
@@ -222,7 +371,8 @@ class Stack:
     def dump_into(self, other: Stack) -> None:
         """
         Starting from the top of this Stack, transfer all current items into
-        the <other> Stack, one-by-one, until this Stack is empty.
+        the <other> Stack, as if popped and pushed one-by-one, until this
+        Stack is empty. (The transfer itself is done in one reversed slice.)
 
         I.e., the previously-top item of this Stack is now the currently-bottom
         item of the new <other> Stack that this method returns. This means that
@@ -260,19 +410,43 @@ class Stack:
         >>> s1.is_empty()
         True
         """
-        for _ in range(len(self._stack)):
-            other.push(self.pop())
+        if other is self:
+            return
+        other.extend(reversed(self._stack))
+        del self._stack[:]
+        self._size = 0
+
+
+    def set_rng(self, rng: Union[None, int, random.Random]=None) -> None:
+        """
+        Change the RNG this Stack shuffles with. Refer to make_rng().
+        """
+        self._rng = make_rng(rng)
 
 
-    def shuffle(self) -> None:
+    def shuffle(self,
+                k: Optional[int]=None,
+                rng: Union[None, int, random.Random]=None) -> None:
         """
         Randomly shuffle the order of this Stack.
 
+        If <k> is passed, only randomize the top <k> items (e.g. the cards
+        about to be dealt). Refer to shuffle_top().
+
+        If <rng> is passed, use it for this shuffle only, instead of this
+        Stack's own RNG.
+
         >>> s = Stack([1, 2, 3, 4, 5])
         >>> s.shuffle()
         >>> # Now, s is shuffled (i.e., items are re-ordered)
+        >>> s.shuffle(k=2)
+        >>> # Now, the top 2 items are a random sample of s
         """
-        secrets.SystemRandom().shuffle(self._stack)
+        rng = self._rng if rng is None else make_rng(rng)
+        if k is None:
+            rng.shuffle(self._stack)
+        else:
+            shuffle_top(self._stack, k, rng)
 
     
     def __size_is_len_stack(self) -> bool:
@@ -292,6 +466,344 @@ class Stack:
             return False
 
 
+class TypedStack(Stack):
+    """
+    A Stack of numbers, all of one C type, packed in an array.array instead
+    of a list: e.g. 8 bytes per float ('d'), or 4 per int ('i'), instead of
+    a pointer plus a boxed object each. It has the same methods as Stack.
+
+    <typecode> is one of array.array's typecodes, e.g. 'b', 'i', 'q', 'f' or
+    'd'. Pushing an item that does not fit it raises TypeError or
+    OverflowError, as array.array does.
+
+    Client Code
+    -----------
+    >>> frontier = TypedStack('q', range(5))
+    >>> frontier.push(10)
+    >>> frontier.pop()
+    10
+    >>> frontier.pop_many(2)
+    array('q', [4, 3])
+    >>> frontier
+    [0, 1, 2]
+
+    Zero-copy Reads
+    ---------------
+    TypedStack.view() exposes the items through the buffer protocol, e.g.
+    for NumPy to read w/o copying:
+    >>> import numpy as np
+    >>> undo = Stack.typed('d', [0.5, 1.5, 2.5])
+    >>> with undo.view() as buf:
+    ...     np.frombuffer(buf, dtype=np.float64).sum()
+    np.float64(4.5)
+    """
+    _stack: array
+    _typecode: str
+
+
+    def __init__(self,
+                 typecode: str,
+                 item: Any=None,
+                 rng: Union[None, int, random.Random]=None) -> None:
+        """
+        Initialize TypedStack. Refer to class docstring for details.
+        """
+        self._typecode = typecode
+        super().__init__(item, rng)
+
+
+    def _new_storage(self) -> array:
+        return array(self._typecode)
+
+
+    def __str__(self) -> str:
+        """
+        >>> print(TypedStack('i', [1, 2, 3]))
+        [1, 2, 3]
+        """
+        return str(self._stack.tolist())
+
+
+    def get_typecode(self) -> str:
+        return self._typecode
+
+
+    def view(self) -> memoryview:
+        """
+        Return a read-write memoryview of the items, bottom first, w/o
+        copying them.
+
+        NOTE: The TypedStack cannot grow or shrink while the view is alive
+        (array.array raises BufferError), so release it when done, e.g. w/ a
+        <with> block.
+        """
+        return memoryview(self._stack)
+
+
+    def __buffer__(self, flags: int) -> memoryview:
+        # Python 3.12+: lets np.asarray(typed_stack) read the items directly.
+        return memoryview(self._stack)
+
+
+class StackFullException(Exception):
+    def __init__(self):
+        super().__init__("The Stack is at capacity.")
+
+
+class ConcurrentStack(Stack):
+    """
+    A Stack that many threads can push to and pop from at once. Every method
+    holds the Stack's lock, so the size counter and the items never drift
+    apart, on GIL and free-threaded (no-GIL) CPython builds alike.
+
+    On top of Stack's methods, it can:
+    - Block in pop() until an item arrives, up to an optional timeout.
+    - Hold at most <capacity> items, blocking push() until there is room
+      (backpressure for producers that outrun consumers).
+
+    An uncontended push or pop costs one lock acquire/release.
+
+    Client Code
+    -----------
+    >>> import threading
+    >>> jobs = ConcurrentStack(capacity=2)
+    >>> jobs.push('a')
+    >>> jobs.push('b')
+    >>> jobs.push('c', timeout=0.01)  # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    StackFullException: The Stack is at capacity.
+    >>> jobs.pop_many(2)
+    ['b', 'a']
+    >>> jobs.pop(timeout=0.01)  # Empty: gives up after 10ms
+    >>> worker = threading.Thread(target=jobs.push, args=('late',))
+    >>> worker.start()
+    >>> jobs.pop()  # Blocks until the worker pushes
+    'late'
+    >>> worker.join()
+    """
+    _lock: threading.Lock
+    _not_empty: threading.Condition
+    _not_full: threading.Condition
+    _capacity: Optional[int]
+    # Threads waiting in pop() / push(), so uncontended calls skip notify()
+    _pops_waiting: int
+    _pushes_waiting: int
+
+
+    def __init__(self,
+                 item: Any=None,
+                 rng: Union[None, int, random.Random]=None,
+                 capacity: Optional[int]=None) -> None:
+        """
+        Initialize ConcurrentStack. Refer to Stack for <item> and <rng>.
+        <capacity> is the max number of items; None means unbounded.
+        """
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._capacity = None
+        self._pops_waiting = self._pushes_waiting = 0
+        super().__init__(item, rng)
+        self._capacity = capacity
+        if capacity is not None and self._size > capacity:
+            raise StackFullException
+
+
+    def __str__(self) -> str:
+        with self._lock:
+            return str(self._stack)
+
+
+    def _wait_for_room(self, n: int, block: bool, timeout: Optional[float]) -> None:
+        # Call w/ the lock held.
+        if self._capacity is None:
+            return
+        if n > self._capacity or not block and self._size + n > self._capacity:
+            raise StackFullException
+        self._pushes_waiting += 1
+        try:
+            room = self._not_full.wait_for(
+                lambda: self._size + n <= self._capacity, timeout)
+        finally:
+            self._pushes_waiting -= 1
+        if not room:
+            raise StackFullException
+
+
+    def push(self,
+             item: Any,
+             block: bool=True,
+             timeout: Optional[float]=None) -> None:
+        """
+        Push <item> to the top of the Stack. If the Stack is at capacity,
+        wait for room, up to <timeout> seconds (forever if None), unless
+        <block> is False.
+
+        Exceptions
+        ----------
+        If there is no room in time, StackFullException is raised.
+        """
+        with self._not_full:
+            self._wait_for_room(1, block, timeout)
+            self._stack.append(item)
+            self._size += 1
+            if self._pops_waiting:
+                self._not_empty.notify()
+
+
+    def extend(self,
+               items: Iterable[Any],
+               block: bool=True,
+               timeout: Optional[float]=None) -> None:
+        """
+        Push each of <items> at once: no other thread sees only some of them.
+        Refer to ConcurrentStack.push() for <block> and <timeout>.
+        """
+        # Consumed before locking: the room needed must be known up front,
+        # and a generator could call back into this Stack
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
+        with self._not_full:
+            if self._capacity is not None:
+                self._wait_for_room(len(items), block, timeout)
+            self._stack.extend(items)
+            added = len(self._stack) - self._size
+            self._size += added
+            if self._pops_waiting:
+                self._not_empty.notify(added)
+
+
+    def pop(self, block: bool=True, timeout: Optional[float]=None) -> Any:
+        """
+        Remove an item from the top of this Stack and return it. If the
+        Stack is empty, wait for an item, up to <timeout> seconds (forever if
+        None), unless <block> is False. Return None if none arrives in time.
+        """
+        with self._not_empty:
+            if block and not self._size:
+                self._pops_waiting += 1
+                try:
+                    self._not_empty.wait_for(lambda: self._size, timeout)
+                finally:
+                    self._pops_waiting -= 1
+            if not self._size:
+                return None
+            self._size -= 1
+            item = self._stack.pop()
+            if self._pushes_waiting:
+                self._not_full.notify()
+            return item
+
+
+    def pop_many(self, k: int) -> list[Any]:
+        """
+        Refer to Stack.pop_many(). Does not wait for items.
+        """
+        with self._lock:
+            items = super().pop_many(k)
+            if self._pushes_waiting:
+                self._not_full.notify(len(items))
+            return items
+
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+
+    def size(self) -> int:
+        return self._size
+
+
+    def dump_into(self, other: Stack) -> None:
+        """
+        Refer to Stack.dump_into(). Only this Stack's lock is held while its
+        items are taken, so two ConcurrentStacks dumping into each other
+        cannot deadlock.
+        """
+        if other is self:
+            return
+        with self._lock:
+            items = self._stack[::-1]
+            del self._stack[:]
+            self._size = 0
+            self._not_full.notify_all()
+        try:
+            other.extend(items)
+        except BaseException:
+            # E.g. <other> is full: put the items back, under any new ones.
+            with self._lock:
+                self._stack[0:0] = items[::-1]
+                self._size = len(self._stack)
+                self._not_empty.notify(len(items))
+            raise
+
+
+    def shuffle(self,
+                k: Optional[int]=None,
+                rng: Union[None, int, random.Random]=None) -> None:
+        with self._lock:
+            super().shuffle(k, rng)
+
+
+class AtomicStack(Stack):
+    """
+    A lock-free Stack for many threads: push() and pop() are each ONE list
+    append or pop, which is atomic on GIL builds of CPython, and on
+    free-threaded builds, where every list guards itself w/ a lightweight
+    per-object lock. There is no separate size counter to drift: size() is
+    the length of the list.
+
+    It cannot block or bound its size; use ConcurrentStack for that. Like
+    Stack, pop() returns None when empty. shuffle() and dump_into() are not
+    atomic: call them only when no other thread is using the Stack.
+
+    Client Code
+    -----------
+    >>> import threading
+    >>> stk = AtomicStack()
+    >>> threads = [threading.Thread(target=stk.extend, args=(range(1000),))
+    ...            for _ in range(4)]
+    >>> for t in threads: t.start()
+    >>> for t in threads: t.join()
+    >>> stk.size()
+    4000
+    >>> len(stk.pop_many(10)), stk.size()
+    (10, 3990)
+    """
+    @property
+    def _size(self) -> int:
+        return len(self._stack)
+
+
+    @_size.setter
+    def _size(self, value: int) -> None:
+        # The size is always len(self._stack); Stack's updates are no-ops.
+        pass
+
+
+    def pop(self) -> Any:
+        try:
+            return self._stack.pop()
+        except IndexError:
+            return None
+
+
+    def pop_many(self, k: int) -> list[Any]:
+        """
+        Refer to Stack.pop_many(). Items are popped one atomic pop at a time,
+        so another thread may interleave its own pops.
+        """
+        items = []
+        pop = self._stack.pop
+        try:
+            for _ in range(k):
+                items.append(pop())
+        except IndexError:
+            pass
+        return items
+
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
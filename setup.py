@@ -5,6 +5,7 @@ setup(
     version='0.0.10',  # Update the version ONLY when you're about to publish a new release immediately after.
     packages=find_packages(),
     install_requires=[],
+    extras_require={'numpy': ['numpy']},
     author='coolhuip',
     author_email='cool.huip@example.com',
     description='PieToolz makes life easier.'